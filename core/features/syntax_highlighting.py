@@ -52,6 +52,10 @@ class SyntaxHighlightingText(tk.Frame):
         self._highlight_tags = {}  # Store tag configurations
         self._last_highlighted_text = ""
         self._highlight_scheduled = False
+        self._suspend_highlight = False  # Set by bulk loaders to defer tagging
+        # Owners that drive highlighting themselves (e.g. viewport passes on
+        # <<Modified>>) clear this to skip the full pass on key release
+        self.auto_highlight = True
 
         # Create line numbers canvas
         self.line_numbers = tk.Canvas(
@@ -80,7 +84,11 @@ class SyntaxHighlightingText(tk.Frame):
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
 
         self.text.config(
-            yscrollcommand=lambda *args: (scrollbar_y.set(*args), self._update_line_numbers()),
+            yscrollcommand=lambda *args: (
+                scrollbar_y.set(*args),
+                self._update_line_numbers(),
+                self.text.event_generate('<<Scroll>>'),
+            ),
             xscrollcommand=scrollbar_x.set
         )
 
@@ -183,11 +191,19 @@ class SyntaxHighlightingText(tk.Frame):
 
         return theme_colors.get(self.theme, theme_colors['dark'])
 
-    def set_language(self, language: str):
-        """Set the programming language for syntax highlighting."""
+    def set_language(self, language: str, highlight: bool = True):
+        """Set the programming language for syntax highlighting.
+
+        Pass ``highlight=False`` when the caller re-tags only the visible
+        lines itself (see ``highlight_range``).
+        """
         self.language = language
         self._setup_syntax_highlighting()
-        self._highlight_text()
+        if highlight:
+            self._highlight_text()
+        else:
+            # Tags were dropped; make the next full pass re-tag unchanged text
+            self._last_highlighted_text = ""
 
     def set_theme(self, theme: str):
         """Set the color theme for syntax highlighting."""
@@ -198,7 +214,7 @@ class SyntaxHighlightingText(tk.Frame):
 
     def _on_key_release(self, event=None):
         """Handle key release events for syntax highlighting."""
-        if not self._highlight_scheduled:
+        if self.auto_highlight and not self._highlight_scheduled:
             self._highlight_scheduled = True
             self.after(100, self._delayed_highlight)  # Debounce highlighting
 
@@ -209,7 +225,7 @@ class SyntaxHighlightingText(tk.Frame):
 
     def _highlight_text(self):
         """Apply syntax highlighting to the current text."""
-        if not PYGMENTS_AVAILABLE or not self.lexer:
+        if not PYGMENTS_AVAILABLE or not self.lexer or self._suspend_highlight:
             return
 
         current_text = self.text.get('1.0', tk.END)
@@ -225,12 +241,38 @@ class SyntaxHighlightingText(tk.Frame):
             if tag.startswith('syntax_'):
                 self.text.tag_remove(tag, '1.0', tk.END)
 
+        self._apply_tokens(current_text, '1.0')
+
+    def highlight_all(self):
+        """Re-apply syntax highlighting to the whole buffer if it changed."""
+        self._highlight_text()
+
+    def highlight_range(self, first: str, last: str):
+        """Re-apply syntax highlighting to the lines spanning *first* to *last*.
+
+        The lines are lexed on their own, so a construct that opens above
+        *first* (e.g. a multi-line string) is not seen.  This is meant for
+        cheap viewport refreshes; callers follow up with ``highlight_all``
+        once edits settle to correct such lines.
+        """
+        if not PYGMENTS_AVAILABLE or not self.lexer or self._suspend_highlight:
+            return
+
+        start = self.text.index(f"{first} linestart")
+        end = self.text.index(f"{last} lineend")
+        for tag in self.text.tag_names():
+            if tag.startswith('syntax_'):
+                self.text.tag_remove(tag, start, end)
+
+        self._apply_tokens(self.text.get(start, end), start)
+
+    def _apply_tokens(self, source: str, pos: str):
+        """Lex *source* and tag it in the widget starting at index *pos*."""
         try:
             # Get tokens from pygments
-            tokens = self.lexer.get_tokens(current_text)
+            tokens = self.lexer.get_tokens(source)
 
             # Apply highlighting
-            pos = '1.0'
             for token_type, value in tokens:
                 if not value:
                     continue
@@ -170,6 +170,7 @@ class Time_WarpInterpreter:  # pylint: disable=too-many-public-methods
         # Program execution state
         self.output_widget = output_widget
         self.variables = {}  # Global variable storage
+        self.arrays_numeric = {}  # BASIC array name -> holds only numbers
         self.labels = {}  # PILOT label definitions
         self.program_lines = []  # Parsed program lines
         self.current_line = 0  # Current execution position
@@ -690,7 +691,9 @@ class Time_WarpInterpreter:  # pylint: disable=too-many-public-methods
 
     def reset(self):
         """Reset interpreter state"""
-        self.variables = {}
+        # Cleared in place: the Pascal executor shares this dict
+        self.variables.clear()
+        self.arrays_numeric = {}
         self.labels = {}
         self.program_lines = []
         self.current_line = 0
@@ -1524,6 +1527,10 @@ class Time_WarpInterpreter:  # pylint: disable=too-many-public-methods
             self.log_output("Error loading program")
             return False
 
+        # Forth words left waiting on an unclosed structure by an earlier
+        # run must not swallow this one
+        self.forth_executor.reset_run_state()
+
         self.running = True
         self.current_line = 0
         max_iterations = 10000  # Prevent infinite loops
@@ -1593,6 +1600,7 @@ class Time_WarpInterpreter:  # pylint: disable=too-many-public-methods
             self.log_error(error_msg, self.current_line + 1)
         finally:
             self.running = False
+            self.forth_executor.end_run()
             if self.error_history:
                 self.log_output(f"📊 Execution completed with {len(self.error_history)} error(s)")
             else:
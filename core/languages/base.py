@@ -10,16 +10,20 @@ needs to set a few class-level attributes and, optionally, override
 The base class handles:
 * Discovering the language runtime on ``$PATH``
 * Writing source to a secure temporary file
-* Running the subprocess with a timeout
+* Running the subprocess with a timeout (``_run_source``), optionally in a
+  worker process started ahead of time (``worker_bootstrap``)
 * Capturing and routing stdout / stderr
 * Cleaning up the temporary file
 """
 
 from __future__ import annotations
 
+import atexit
 import os
+import shutil
 import subprocess
 import tempfile
+import weakref
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -34,32 +38,72 @@ class SubprocessExecutor:
     file_suffix: str = ".txt"           # temp-file extension
     executable_candidates: list[str] = []  # e.g. ["node", "nodejs"]
     timeout: int = 30                   # subprocess timeout in seconds
+    # Inline program (passed with ``-e``) that reads a script path from
+    # stdin and runs that script; when set, each run uses a runtime that
+    # was started while the previous run's output was being handled
+    worker_bootstrap: str | None = None
+
+    # Runtime found by ``_find_executable`` for each executor class, shared
+    # by all instances so PATH is searched once rather than per executor
+    _executable_cache: dict[type, str | None] = {}
+
+    # Executors that keep a warm worker, stopped together at interpreter exit
+    _worker_executors: weakref.WeakSet[SubprocessExecutor] = weakref.WeakSet()
 
     def __init__(self, interpreter: Time_WarpInterpreter) -> None:
         self.interpreter = interpreter
-        self.executable: str | None = self._find_executable()
+        self._worker: subprocess.Popen | None = None  # warm runtime for next run
+        if self.worker_bootstrap is not None:
+            SubprocessExecutor._worker_executors.add(self)
 
     # ---- executable discovery ----
 
+    @property
+    def executable(self) -> str | None:
+        """Path of the language runtime, or ``None`` if it is not installed.
+
+        Looked up on first use and then cached for the executor class.
+        """
+        cache = SubprocessExecutor._executable_cache
+        cls = type(self)
+        if cls not in cache:
+            cache[cls] = self._find_executable()
+        return cache[cls]
+
+    @classmethod
+    def invalidate_executable_cache(cls) -> None:
+        """Forget the cached runtime so the next use searches PATH again.
+
+        Called on ``SubprocessExecutor`` itself, clears every language.
+        """
+        if cls is SubprocessExecutor:
+            cls._executable_cache.clear()
+        else:
+            SubprocessExecutor._executable_cache.pop(cls, None)
+
     def _find_executable(self) -> str | None:
         """Locate the language runtime on the system PATH.
 
-        Iterates over ``executable_candidates`` and returns the first one
-        that responds to ``--version``.  Subclasses that know the exact
-        path (e.g. ``sys.executable`` for Python) should override this.
+        Iterates over ``executable_candidates`` and returns the full path
+        of the first one that responds to ``--version``.  Subclasses that
+        know the exact path (e.g. ``sys.executable`` for Python) should
+        override this.
         """
         for name in self.executable_candidates:
+            path = shutil.which(name)
+            if path is None:
+                continue
             try:
                 result = subprocess.run(
-                    [name, "--version"],
+                    [path, "--version"],
                     capture_output=True,
                     text=True,
                     timeout=5,
                     check=False,
                 )
                 if result.returncode == 0:
-                    return name
-            except (subprocess.TimeoutExpired, FileNotFoundError):
+                    return path
+            except (subprocess.TimeoutExpired, OSError):
                 continue
         return None
 
@@ -89,13 +133,7 @@ class SubprocessExecutor:
                 )
                 return False
 
-            result = subprocess.run(
-                [self.executable, filepath],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                check=False,
-            )
+            result = self._run_source(filepath)
 
             if result.stdout:
                 self.interpreter.log_output(result.stdout)
@@ -153,13 +191,7 @@ class SubprocessExecutor:
                 temp_path = tmp.name
 
             try:
-                result = subprocess.run(
-                    [self.executable, temp_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout,
-                    check=False,
-                )
+                result = self._run_source(temp_path)
             except subprocess.TimeoutExpired:
                 self.interpreter.log_output(
                     f"❌ {self.lang_name} script execution timed out"
@@ -192,6 +224,83 @@ class SubprocessExecutor:
             )
             return "error"
 
+    def _run_source(self, path: str) -> subprocess.CompletedProcess:
+        """Run the source file at *path* and capture its output.
+
+        Raises ``subprocess.TimeoutExpired`` if it outlives ``timeout``.
+        Override to change how the runtime is launched.
+        """
+        if self.worker_bootstrap is None:
+            return subprocess.run(
+                [self.executable, path],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=False,
+            )
+        return self._run_in_worker(path)
+
+    # ---- warm worker ----
+
+    def _run_in_worker(self, path: str) -> subprocess.CompletedProcess:
+        """Run *path* in a runtime process that has already started up.
+
+        Each script still gets a fresh process of its own; the one for the
+        next run is launched as soon as this one finishes.
+        """
+        worker = self._worker
+        self._worker = None
+        if worker is not None and worker.args[0] != self.executable:
+            # The runtime was looked up again since this worker started
+            self._worker = worker
+            self._discard_worker()
+            worker = None
+        if worker is None or worker.poll() is not None:
+            worker = self._spawn_worker()
+        try:
+            stdout, stderr = worker.communicate(
+                os.path.abspath(path), timeout=self.timeout
+            )
+        except subprocess.TimeoutExpired:
+            worker.kill()
+            worker.communicate()
+            self._start_next_worker()
+            raise
+        self._start_next_worker()
+        return subprocess.CompletedProcess(
+            worker.args, worker.returncode, stdout, stderr
+        )
+
+    def _start_next_worker(self) -> None:
+        """Launch the worker for the next run; if that fails, leave none."""
+        try:
+            self._worker = self._spawn_worker()
+        except OSError:
+            self._worker = None
+
+    def _spawn_worker(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            [self.executable, "-e", self.worker_bootstrap],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    def _discard_worker(self) -> None:
+        """Stop the idle worker, if any."""
+        worker = self._worker
+        self._worker = None
+        if worker is not None and worker.poll() is None:
+            worker.kill()
+            worker.wait()
+
+    @classmethod
+    def _discard_all_workers(cls) -> None:
+        """Stop every executor's idle worker (registered with ``atexit``)."""
+        for executor in list(cls._worker_executors):
+            executor._discard_worker()
+
     def _parse_version(self, stdout: str) -> str:
         """Extract a version string from ``--version`` output.
 
@@ -203,3 +312,6 @@ class SubprocessExecutor:
             if line:
                 return line
         return f"{self.lang_name} available"
+
+
+atexit.register(SubprocessExecutor._discard_all_workers)
@@ -27,9 +27,26 @@ falling back to text-based output otherwise.
 # pylint: disable=C0302,R1705,R1702,W0718,R0912,W0613,R0911,W0612,R0915,R0914,R1714,W1514,R0903
 
 import re
+import sys
 import time
 import math
 import random
+import functools
+
+# Optional pygame import - graphics fall back to the IDE canvas or text
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+# GAME* arguments are separated by commas and/or whitespace
+_GAME_ARG_SPLIT = re.compile(r"[,\s]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _rgb_hex(r, g, b):
+    """Return the Tk '#rrggbb' string for an RGB triple (games reuse few)"""
+    return f"#{r:02x}{g:02x}{b:02x}"
 
 
 class TwBasicExecutor:
@@ -55,6 +72,15 @@ class TwBasicExecutor:
         self.pygame_screen = None
         self.pygame_clock = None
         self.current_color = (255, 255, 255)  # White default
+        self._color_hex = "#FFFFFF"  # Tk form of current_color
+        self._default_font = None  # pygame font, created on first GAMETEXT
+        self._text_surfaces = {}  # (text, color) -> rendered pygame surface
+        self._game_backend = None  # "tk", "pygame" or "" once resolved
+        self._canvas_dirty = False  # Tk game canvas drawn on since last update
+        self._last_canvas_update = 0.0
+        self._flush_job = None  # Tk after() id for a coalesced GAMEUPDATE
+        self._last_tick = time.monotonic()  # End of the previous GAMEDELAY
+        self._parse_cache = {}  # GAME* argument tokens -> parsed int tuple
 
     def _init_pygame_graphics(self, width, height, title):
         """
@@ -72,7 +98,8 @@ class TwBasicExecutor:
             bool: True if pygame initialized successfully, False otherwise
         """
         try:
-            import pygame  # pylint: disable=import-outside-toplevel
+            if pygame is None:
+                raise ImportError("pygame")
             import os  # pylint: disable=import-outside-toplevel
 
             # Check if display is available
@@ -122,7 +149,9 @@ class TwBasicExecutor:
             if not parts:
                 return "continue"
 
-            cmd = parts[0].upper()
+            # Interned so the keyword compares and table lookups below hit
+            # the identity fast path against the (interned) literals
+            cmd = sys.intern(parts[0].upper())
 
             # Standard BASIC commands
             if cmd == "LET":
@@ -331,6 +360,8 @@ class TwBasicExecutor:
                                 current[idx] = {}
                             current = current[idx]
                         current[indices[-1]] = value
+                        if not isinstance(value, (int, float)):
+                            self.interpreter.arrays_numeric[array_name] = False
                     else:
                         # Simple variable assignment
                         self.interpreter.variables[var_name] = value
@@ -672,8 +703,12 @@ class TwBasicExecutor:
 
                         array = create_array(dimensions)
 
-                    # Store the array
+                    # Store the array; only flat arrays of numbers can be
+                    # reduced by SUM/AVG/MIN/MAX
                     self.interpreter.variables[array_name] = array
+                    self.interpreter.arrays_numeric[array_name] = (
+                        len(dimensions) == 1
+                    )
                     self.interpreter.log_output(
                         f"Array {array_name} declared with dimensions {dimensions}"
                     )
@@ -1645,8 +1680,6 @@ class TwBasicExecutor:
                                         f"Drew line from ({x1},{y1}) to ({x2},{y2})"
                                     )
                                 elif self.pygame_screen:
-                                    import pygame
-
                                     pygame.draw.line(
                                         self.pygame_screen,
                                         self.current_color,
@@ -1711,8 +1744,6 @@ class TwBasicExecutor:
                                 f"({x},{y}) size {width}x{height}"
                             )
                         elif self.pygame_screen:
-                            import pygame
-
                             rect = pygame.Rect(x, y, width, height)
                             if filled:
                                 pygame.draw.rect(
@@ -1787,8 +1818,6 @@ class TwBasicExecutor:
                                     f"Drew {'filled ' if filled else ''}triangle"
                                 )
                             elif self.pygame_screen:
-                                import pygame
-
                                 if filled:
                                     pygame.draw.polygon(
                                         self.pygame_screen,
@@ -1860,8 +1889,6 @@ class TwBasicExecutor:
                                 f"({x},{y}) size {width}x{height}"
                             )
                         elif self.pygame_screen:
-                            import pygame
-
                             rect = pygame.Rect(x, y, width, height)
                             if filled:
                                 pygame.draw.ellipse(
@@ -1918,8 +1945,6 @@ class TwBasicExecutor:
                                 f"Flood fill at ({x},{y}) with {color}"
                             )
                         elif self.pygame_screen:
-                            import pygame
-
                             pygame.draw.circle(
                                 self.pygame_screen,
                                 self.current_color,
@@ -2118,30 +2143,32 @@ class TwBasicExecutor:
                     if array_name in self.interpreter.variables:
                         array = self.interpreter.variables[array_name]
                         if isinstance(array, list) and array:
-                            try:
-                                result = 0  # Initialize to avoid pylint warning
-                                operation = ""  # Initialize to avoid pylint warning
-                                if cmd == "SUM":
-                                    result = sum(array)
-                                    operation = "sum"
-                                elif cmd == "AVG":
-                                    result = sum(array) / len(array)
-                                    operation = "average"
-                                elif cmd == "MIN":
-                                    result = min(array)
-                                    operation = "minimum"
-                                elif cmd == "MAX":
-                                    result = max(array)
-                                    operation = "maximum"
-
-                                self.interpreter.variables["RESULT"] = result
-                                self.interpreter.log_output(
-                                    f"Array {array_name} {operation}: {result}"
-                                )
-                            except Exception:  # pylint: disable=broad-except
+                            if not self.interpreter.arrays_numeric.get(
+                                array_name, True
+                            ):
                                 self.interpreter.log_output(
                                     "Array contains non-numeric elements"
                                 )
+                                return "continue"
+                            result = 0  # Initialize to avoid pylint warning
+                            operation = ""  # Initialize to avoid pylint warning
+                            if cmd == "SUM":
+                                result = sum(array)
+                                operation = "sum"
+                            elif cmd == "AVG":
+                                result = sum(array) / len(array)
+                                operation = "average"
+                            elif cmd == "MIN":
+                                result = min(array)
+                                operation = "minimum"
+                            elif cmd == "MAX":
+                                result = max(array)
+                                operation = "maximum"
+
+                            self.interpreter.variables["RESULT"] = result
+                            self.interpreter.log_output(
+                                f"Array {array_name} {operation}: {result}"
+                            )
                         else:
                             self.interpreter.log_output(
                                 f"{array_name} is not a valid array"
@@ -2154,315 +2181,412 @@ class TwBasicExecutor:
             self.interpreter.debug_output(f"Array operation error: {e}")
         return "continue"
 
-    def _handle_game_commands(self, command, cmd, parts):  # noqa: C901
+    def _handle_game_commands(self, command, cmd, parts):
         """Handle game development commands"""
-        if cmd == "GAMESCREEN":
-            # GAMESCREEN width, height [, title]
-            if len(parts) >= 3:
-                try:
-                    width = int(parts[1].rstrip(","))
-                    height = int(parts[2].rstrip(","))
-                    title = (
-                        " ".join(parts[3:]).strip('"')
-                        if len(parts) > 3
-                        else "Time_Warp Game Window"
-                    )
-                    self.interpreter.log_output(
-                        f"🎮 Game screen initialized: {width}x{height} - {title}"
-                    )
+        handler = self._GAME_DISPATCH.get(cmd)
+        if handler is not None:
+            # Split off clean numeric tokens once; commands ending in free
+            # text (GAMETEXT, GAMESCREEN) keep that text as the last part.
+            parts = _GAME_ARG_SPLIT.split(
+                command.strip(), self._GAME_TEXT_SPLITS.get(cmd, 0)
+            )
+            if self._game_backend is None:
+                self._resolve_game_backend()
+            handler(self, parts)
+        else:
+            # Generic game command
+            self.interpreter.log_output(f"🎮 Game command: {command}")
+        return "continue"
 
-                    # Initialize graphics - either
-                    # IDE canvas or standalone pygame
-                    if (
-                        hasattr(self.interpreter, "ide_turtle_canvas")
-                        and self.interpreter.ide_turtle_canvas
-                    ):
-                        # IDE mode - use turtle canvas
-                        canvas = self.interpreter.ide_turtle_canvas
-                        canvas.delete("all")  # Clear canvas
-                        canvas.config(
-                            width=min(width, 600), height=min(height, 400)
-                        )  # Limit size
-                        canvas.create_text(
-                            width // 2,
-                            20,
-                            text=title,
-                            font=("Arial", 16),
-                            fill="white",
-                        )
-                        self.interpreter.log_output(
-                            "🎨 Graphics canvas initialized for game"
-                        )
-                    else:
-                        # Standalone mode - use pygame
-                        self._init_pygame_graphics(width, height, title)
-                        self.interpreter.log_output(
-                            "🎮 Pygame graphics initialized for standalone game"
-                        )
-                except ValueError:
-                    self.interpreter.log_output("Error: Invalid GAMESCREEN parameters")
-        elif cmd == "GAMEBG":
-            # GAMEBG r, g, b - set background color
-            if len(parts) >= 4:
-                try:
-                    r = int(parts[1].rstrip(","))
-                    g = int(parts[2].rstrip(","))
-                    b = int(parts[3].rstrip(","))
-                    color = f"#{r:02x}{g:02x}{b:02x}"
-                    self.interpreter.log_output(
-                        f"🎨 Background color set to RGB({r},{g},{b})"
-                    )
+    _PARSE_CACHE_MAX = 4096
 
-                    if (
-                        hasattr(self.interpreter, "ide_turtle_canvas")
-                        and self.interpreter.ide_turtle_canvas
-                    ):
-                        # IDE mode
-                        self.interpreter.ide_turtle_canvas.config(bg=color)
-                    elif self.pygame_screen:
-                        # Pygame mode
-                        self.pygame_screen.fill((r, g, b))
-                except ValueError:
-                    self.interpreter.log_output("Error: Invalid GAMEBG color values")
-        elif cmd == "GAMELOOP":
-            self.interpreter.log_output("🔄 Game loop started")
-        elif cmd == "GAMEEND":
-            self.interpreter.log_output("🎮 Game ended")
-        elif cmd == "GAMECLEAR":
-            # Clear the game screen
-            self.interpreter.log_output("🧹 Game screen cleared")
-            if (
-                hasattr(self.interpreter, "ide_turtle_canvas")
-                and self.interpreter.ide_turtle_canvas
-            ):
-                # IDE mode
-                self.interpreter.ide_turtle_canvas.delete("game_objects")
-            elif self.pygame_screen:
-                # Pygame mode - fill with black
-                self.pygame_screen.fill((0, 0, 0))
-        elif cmd == "GAMECOLOR":
-            # GAMECOLOR r, g, b - set drawing color
-            if len(parts) >= 4:
-                try:
-                    r = int(parts[1].rstrip(","))
-                    g = int(parts[2].rstrip(","))
-                    b = int(parts[3].rstrip(","))
-                    self.interpreter.variables["GAME_COLOR"] = f"#{r:02x}{g:02x}{b:02x}"
-                    self.current_color = (r, g, b)  # Store for pygame
-                    self.interpreter.log_output(
-                        f"🎨 Drawing color set to RGB({r},{g},{b})"
-                    )
-                except ValueError:
-                    self.interpreter.log_output("Error: Invalid GAMECOLOR values")
-        elif cmd == "GAMEPOINT":
-            # GAMEPOINT x, y - draw a point
-            if len(parts) >= 3:
-                try:
-                    x = int(parts[1].rstrip(","))
-                    y = int(parts[2].rstrip(","))
-                    color = self.interpreter.variables.get("GAME_COLOR", "#FFFFFF")
+    def _parse_ints(self, parts, n):
+        """
+        Parse parts[1:1+n] as integers, memoized on the raw tokens.
 
-                    if (
-                        hasattr(self.interpreter, "ide_turtle_canvas")
-                        and self.interpreter.ide_turtle_canvas
-                    ):
-                        # IDE mode
-                        canvas = self.interpreter.ide_turtle_canvas
-                        canvas.create_oval(
-                            x,
-                            y,
-                            x + 2,
-                            y + 2,
-                            fill=color,
-                            outline=color,
-                            tags="game_objects",
-                        )
-                    elif self.pygame_screen:
-                        # Pygame mode
-                        import pygame
+        Game loops re-run the same GAME* lines every frame, so the parsed
+        tuple is cached; the cache is simply dropped when it grows too big.
 
-                        pygame.draw.circle(
-                            self.pygame_screen, self.current_color, (x, y), 1
-                        )
-                except ValueError:
-                    self.interpreter.log_output("Error: Invalid GAMEPOINT coordinates")
-        elif cmd == "GAMERECT":
-            # GAMERECT x, y, width, height, filled
-            if len(parts) >= 6:
-                try:
-                    x = int(parts[1].rstrip(","))
-                    y = int(parts[2].rstrip(","))
-                    width = int(parts[3].rstrip(","))
-                    height = int(parts[4].rstrip(","))
-                    filled = int(parts[5])
-                    color = self.interpreter.variables.get("GAME_COLOR", "#FFFFFF")
+        Raises:
+            ValueError: If any token is not an integer (never cached)
+        """
+        key = tuple(parts[1 : 1 + n])
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            return cached
+        result = tuple(map(int, key))
+        if len(self._parse_cache) >= self._PARSE_CACHE_MAX:
+            self._parse_cache.clear()
+        self._parse_cache[key] = result
+        return result
+
+    def _resolve_game_backend(self):
+        """
+        Pick the game drawing backend once and bind the _draw_* methods.
 
-                    if (
-                        hasattr(self.interpreter, "ide_turtle_canvas")
-                        and self.interpreter.ide_turtle_canvas
-                    ):
-                        # IDE mode
-                        canvas = self.interpreter.ide_turtle_canvas
-                        if filled:
-                            canvas.create_rectangle(
-                                x,
-                                y,
-                                x + width,
-                                y + height,
-                                fill=color,
-                                outline=color,
-                                tags="game_objects",
-                            )
-                        else:
-                            canvas.create_rectangle(
-                                x,
-                                y,
-                                x + width,
-                                y + height,
-                                outline=color,
-                                tags="game_objects",
-                            )
-                    elif self.pygame_screen:
-                        # Pygame mode
-                        import pygame
-
-                        rect = pygame.Rect(x, y, width, height)
-                        if filled:
-                            pygame.draw.rect(
-                                self.pygame_screen, self.current_color, rect
-                            )
-                        else:
-                            pygame.draw.rect(
-                                self.pygame_screen, self.current_color, rect, 2
-                            )
-                except ValueError:
-                    self.interpreter.log_output("Error: Invalid GAMERECT parameters")
-        elif cmd == "GAMELOOP":
-            self.interpreter.log_output("🔄 Game loop started")
-        elif cmd == "GAMETEXT":
-            # GAMETEXT x, y, "text"
-            if len(parts) >= 4:
-                try:
-                    x = int(parts[1].rstrip(","))
-                    y = int(parts[2].rstrip(","))
-                    text = " ".join(parts[3:]).strip('"')
-                    color = self.interpreter.variables.get("GAME_COLOR", "#FFFFFF")
+        The IDE turtle canvas wins when present, then a standalone pygame
+        window; otherwise drawing commands are silently ignored. Resolved
+        lazily on the first GAME* draw and again after every GAMESCREEN.
+        """
+        if getattr(self.interpreter, "ide_turtle_canvas", None):
+            self._game_backend = "tk"
+            self._draw_bg = self._draw_bg_tk
+            self._draw_clear = self._draw_clear_tk
+            self._draw_point = self._draw_point_tk
+            self._rect_fns = (self._draw_rect_outline_tk, self._draw_rect_filled_tk)
+            self._circle_fns = (
+                self._draw_circle_outline_tk,
+                self._draw_circle_filled_tk,
+            )
+            self._draw_text = self._draw_text_tk
+            self._draw_update = self._draw_update_tk
+        elif self.pygame_screen:
+            self._game_backend = "pygame"
+            self._draw_bg = self._draw_bg_pygame
+            self._draw_clear = self._draw_clear_pygame
+            self._draw_point = self._draw_point_pygame
+            self._rect_fns = (
+                self._draw_rect_outline_pygame,
+                self._draw_rect_filled_pygame,
+            )
+            self._circle_fns = (
+                self._draw_circle_outline_pygame,
+                self._draw_circle_filled_pygame,
+            )
+            self._draw_text = self._draw_text_pygame
+            self._draw_update = self._draw_update_pygame
+        else:
+            self._game_backend = ""
+            self._draw_bg = self._draw_clear = self._draw_point = self._draw_noop
+            self._draw_text = self._draw_update = self._draw_noop
+            self._rect_fns = self._circle_fns = (self._draw_noop, self._draw_noop)
+
+    def _draw_noop(self, *_args):
+        """Drawing sink used when no graphics backend is available"""
+
+    def _draw_bg_tk(self, color, _rgb):
+        self._canvas_dirty = True
+        self.interpreter.ide_turtle_canvas.config(bg=color)
+
+    def _draw_clear_tk(self):
+        self._canvas_dirty = True
+        self.interpreter.ide_turtle_canvas.delete("game_objects")
+
+    def _draw_point_tk(self, x, y):
+        self._canvas_dirty = True
+        color = self._color_hex
+        self.interpreter.ide_turtle_canvas.create_oval(
+            x, y, x + 2, y + 2, fill=color, outline=color, tags="game_objects"
+        )
+
+    def _draw_rect_filled_tk(self, x, y, width, height):
+        self._canvas_dirty = True
+        color = self._color_hex
+        self.interpreter.ide_turtle_canvas.create_rectangle(
+            x,
+            y,
+            x + width,
+            y + height,
+            fill=color,
+            outline=color,
+            tags="game_objects",
+        )
+
+    def _draw_rect_outline_tk(self, x, y, width, height):
+        self._canvas_dirty = True
+        self.interpreter.ide_turtle_canvas.create_rectangle(
+            x, y, x + width, y + height, outline=self._color_hex, tags="game_objects"
+        )
+
+    def _draw_text_tk(self, x, y, text):
+        self._canvas_dirty = True
+        self.interpreter.ide_turtle_canvas.create_text(
+            x,
+            y,
+            text=text,
+            fill=self._color_hex,
+            font=("Arial", 12),
+            tags="game_objects",
+        )
+
+    def _draw_circle_filled_tk(self, x, y, radius):
+        self._canvas_dirty = True
+        color = self._color_hex
+        self.interpreter.ide_turtle_canvas.create_oval(
+            x - radius,
+            y - radius,
+            x + radius,
+            y + radius,
+            fill=color,
+            outline=color,
+            tags="game_objects",
+        )
+
+    def _draw_circle_outline_tk(self, x, y, radius):
+        self._canvas_dirty = True
+        self.interpreter.ide_turtle_canvas.create_oval(
+            x - radius,
+            y - radius,
+            x + radius,
+            y + radius,
+            outline=self._color_hex,
+            tags="game_objects",
+        )
+
+    def _draw_update_tk(self):
+        # Skip the Tk event-loop turn when nothing was drawn, and coalesce
+        # updates arriving faster than ~120 fps. A coalesced frame is not
+        # dropped: a timer shows it once Tk next gets control, and GAMEDELAY
+        # shows it before sleeping.
+        if self._canvas_dirty:
+            wait = self._last_canvas_update + 0.008 - time.monotonic()
+            if wait <= 0:
+                self._flush_canvas()
+            elif self._flush_job is None:
+                self._flush_job = self.interpreter.ide_turtle_canvas.after(
+                    max(1, int(wait * 1000)), self._flush_canvas_later
+                )
+        self.interpreter.log_output("🔄 Display updated")
+
+    def _flush_canvas(self):
+        """Show the Tk game canvas now, cancelling any coalesced update"""
+        canvas = self.interpreter.ide_turtle_canvas
+        if self._flush_job is not None:
+            canvas.after_cancel(self._flush_job)
+            self._flush_job = None
+        canvas.update()
+        self._canvas_dirty = False
+        self._last_canvas_update = time.monotonic()
+
+    def _flush_canvas_later(self):
+        """Timer callback for a coalesced GAMEUPDATE; Tk is already idle"""
+        self._flush_job = None
+        if self._canvas_dirty:
+            try:
+                self.interpreter.ide_turtle_canvas.update_idletasks()
+            except Exception:
+                return  # Canvas went away before the timer fired
+            self._canvas_dirty = False
+            self._last_canvas_update = time.monotonic()
+
+    def _draw_bg_pygame(self, _color, rgb):
+        self.pygame_screen.fill(rgb)
+
+    def _draw_clear_pygame(self):
+        self.pygame_screen.fill((0, 0, 0))
+
+    def _draw_point_pygame(self, x, y):
+        pygame.draw.circle(self.pygame_screen, self.current_color, (x, y), 1)
+
+    def _draw_rect_filled_pygame(self, x, y, width, height):
+        rect = pygame.Rect(x, y, width, height)
+        pygame.draw.rect(self.pygame_screen, self.current_color, rect)
+
+    def _draw_rect_outline_pygame(self, x, y, width, height):
+        rect = pygame.Rect(x, y, width, height)
+        pygame.draw.rect(self.pygame_screen, self.current_color, rect, 2)
+
+    def _draw_text_pygame(self, x, y, text):
+        key = (text, self.current_color)
+        text_surface = self._text_surfaces.get(key)
+        if text_surface is None:
+            if self._default_font is None:
+                self._default_font = pygame.font.Font(None, 24)
+            text_surface = self._default_font.render(text, True, self.current_color)
+            if len(self._text_surfaces) >= 256:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._text_surfaces[next(iter(self._text_surfaces))]
+            self._text_surfaces[key] = text_surface
+        self.pygame_screen.blit(text_surface, (x, y))
+
+    def _draw_circle_filled_pygame(self, x, y, radius):
+        pygame.draw.circle(self.pygame_screen, self.current_color, (x, y), radius)
+
+    def _draw_circle_outline_pygame(self, x, y, radius):
+        pygame.draw.circle(self.pygame_screen, self.current_color, (x, y), radius, 2)
+
+    def _draw_update_pygame(self):
+        pygame.display.flip()
+        self.interpreter.log_output("🔄 Pygame display updated")
+
+    def _cmd_gamescreen(self, parts):
+        """GAMESCREEN width, height [, title]"""
+        if len(parts) < 3:
+            return
+        try:
+            width, height = self._parse_ints(parts, 2)
+            title = (
+                parts[3].strip('"')
+                if len(parts) > 3
+                else "Time_Warp Game Window"
+            )
+            self.interpreter.log_output(
+                f"🎮 Game screen initialized: {width}x{height} - {title}"
+            )
 
-                    if (
-                        hasattr(self.interpreter, "ide_turtle_canvas")
-                        and self.interpreter.ide_turtle_canvas
-                    ):
-                        # IDE mode
-                        canvas = self.interpreter.ide_turtle_canvas
-                        canvas.create_text(
-                            x,
-                            y,
-                            text=text,
-                            fill=color,
-                            font=("Arial", 12),
-                            tags="game_objects",
-                        )
-                    elif self.pygame_screen:
-                        # Pygame mode
-                        import pygame
-
-                        font = pygame.font.Font(None, 24)
-                        text_surface = font.render(text, True, self.current_color)
-                        self.pygame_screen.blit(text_surface, (x, y))
-                except ValueError:
-                    self.interpreter.log_output("Error: Invalid GAMETEXT parameters")
-        elif cmd == "GAMEUPDATE":
-            # Update/refresh the display
+            # Initialize graphics - either
+            # IDE canvas or standalone pygame
             if (
                 hasattr(self.interpreter, "ide_turtle_canvas")
                 and self.interpreter.ide_turtle_canvas
             ):
-                # IDE mode
-                self.interpreter.ide_turtle_canvas.update()
-                self.interpreter.log_output("🔄 Display updated")
-            elif self.pygame_screen:
-                # Pygame mode
-                import pygame
-
-                pygame.display.flip()
-                self.interpreter.log_output("🔄 Pygame display updated")
-        elif cmd == "GAMEDELAY":
-            # GAMEDELAY milliseconds - delay for frame rate control
-            if len(parts) >= 2:
-                try:
-                    delay_ms = int(parts[1])
-                    time.sleep(delay_ms / 1000.0)  # Convert to seconds
-                except ValueError:
-                    self.interpreter.log_output("Error: Invalid GAMEDELAY parameter")
-        elif cmd == "GAMECIRCLE":
-            # GAMECIRCLE x, y, radius, filled
-            # (for 2-param version, assume filled=0)
-            if len(parts) >= 4:
-                try:
-                    x = int(parts[1].rstrip(","))
-                    y = int(parts[2].rstrip(","))
-                    radius = int(parts[3].rstrip(","))
-                    filled = int(parts[4]) if len(parts) >= 5 else 0  # Default unfilled
-                    color = self.interpreter.variables.get("GAME_COLOR", "#FFFFFF")
-
-                    if (
-                        hasattr(self.interpreter, "ide_turtle_canvas")
-                        and self.interpreter.ide_turtle_canvas
-                    ):
-                        # IDE mode
-                        canvas = self.interpreter.ide_turtle_canvas
-                        if filled:
-                            canvas.create_oval(
-                                x - radius,
-                                y - radius,
-                                x + radius,
-                                y + radius,
-                                fill=color,
-                                outline=color,
-                                tags="game_objects",
-                            )
-                        else:
-                            canvas.create_oval(
-                                x - radius,
-                                y - radius,
-                                x + radius,
-                                y + radius,
-                                outline=color,
-                                tags="game_objects",
-                            )
-                    elif self.pygame_screen:
-                        # Pygame mode
-                        import pygame
-
-                        if filled:
-                            pygame.draw.circle(
-                                self.pygame_screen,
-                                self.current_color,
-                                (x, y),
-                                radius,
-                            )
-                        else:
-                            pygame.draw.circle(
-                                self.pygame_screen,
-                                self.current_color,
-                                (x, y),
-                                radius,
-                                2,
-                            )
-                except ValueError:
-                    self.interpreter.log_output("Error: Invalid GAMECIRCLE parameters")
-        elif cmd == "GAMEKEY":
-            # GAMEKEY() - get pressed key
-            key = self.interpreter.get_user_input("Press a key: ")
-            if key:
-                self.interpreter.variables["LAST_KEY"] = key.upper()
-                self.interpreter.log_output(f"🎮 Key pressed: {key.upper()}")
+                # IDE mode - use turtle canvas
+                canvas = self.interpreter.ide_turtle_canvas
+                canvas.delete("all")  # Clear canvas
+                canvas.config(
+                    width=min(width, 600), height=min(height, 400)
+                )  # Limit size
+                canvas.create_text(
+                    width // 2,
+                    20,
+                    text=title,
+                    font=("Arial", 16),
+                    fill="white",
+                )
+                self.interpreter.log_output("🎨 Graphics canvas initialized for game")
             else:
-                self.interpreter.variables["LAST_KEY"] = ""
+                # Standalone mode - use pygame
+                self._init_pygame_graphics(width, height, title)
+                self.interpreter.log_output(
+                    "🎮 Pygame graphics initialized for standalone game"
+                )
+            self._resolve_game_backend()
+        except ValueError:
+            self.interpreter.log_output("Error: Invalid GAMESCREEN parameters")
+
+    def _cmd_gamebg(self, parts):
+        """GAMEBG r, g, b - set background color"""
+        if len(parts) < 4:
+            return
+        try:
+            r, g, b = self._parse_ints(parts, 3)
+            color = _rgb_hex(r, g, b)
+            self.interpreter.log_output(f"🎨 Background color set to RGB({r},{g},{b})")
+            self._draw_bg(color, (r, g, b))
+        except ValueError:
+            self.interpreter.log_output("Error: Invalid GAMEBG color values")
+
+    def _cmd_gameloop(self, parts):
+        """GAMELOOP - mark the start of the game loop"""
+        self.interpreter.log_output("🔄 Game loop started")
+
+    def _cmd_gameend(self, parts):
+        """GAMEEND - mark the end of the game"""
+        self.interpreter.log_output("🎮 Game ended")
+
+    def _cmd_gameclear(self, parts):
+        """GAMECLEAR - clear the game screen"""
+        self.interpreter.log_output("🧹 Game screen cleared")
+        self._draw_clear()
+
+    def _cmd_gamecolor(self, parts):
+        """GAMECOLOR r, g, b - set drawing color"""
+        if len(parts) < 4:
+            return
+        try:
+            r, g, b = self._parse_ints(parts, 3)
+            self._color_hex = _rgb_hex(r, g, b)
+            # Kept for BASIC-level visibility; drawing reads _color_hex
+            self.interpreter.variables["GAME_COLOR"] = self._color_hex
+            self.current_color = (r, g, b)  # Store for pygame
+            self.interpreter.log_output(f"🎨 Drawing color set to RGB({r},{g},{b})")
+        except ValueError:
+            self.interpreter.log_output("Error: Invalid GAMECOLOR values")
+
+    def _cmd_gamepoint(self, parts):
+        """GAMEPOINT x, y - draw a point"""
+        if len(parts) < 3:
+            return
+        try:
+            x, y = self._parse_ints(parts, 2)
+            self._draw_point(x, y)
+        except ValueError:
+            self.interpreter.log_output("Error: Invalid GAMEPOINT coordinates")
+
+    def _cmd_gamerect(self, parts):
+        """GAMERECT x, y, width, height, filled"""
+        if len(parts) < 6:
+            return
+        try:
+            x, y, width, height = self._parse_ints(parts, 4)
+            # Index the (outline, filled) pair with the filled flag
+            self._rect_fns[int(parts[5]) != 0](x, y, width, height)
+        except ValueError:
+            self.interpreter.log_output("Error: Invalid GAMERECT parameters")
+
+    def _cmd_gametext(self, parts):
+        """GAMETEXT x, y, "text" """
+        if len(parts) < 4:
+            return
+        try:
+            x, y = self._parse_ints(parts, 2)
+            text = parts[3].strip('"')
+            self._draw_text(x, y, text)
+        except ValueError:
+            self.interpreter.log_output("Error: Invalid GAMETEXT parameters")
+
+    def _cmd_gameupdate(self, parts):
+        """GAMEUPDATE - update/refresh the display"""
+        self._draw_update()
+
+    def _cmd_gamedelay(self, parts):
+        """GAMEDELAY milliseconds - wait until the frame has lasted that long"""
+        if len(parts) < 2:
+            return
+        try:
+            delay_ms = int(parts[1])
+            if self._flush_job is not None:
+                # Tk cannot run the coalesced update's timer while we sleep
+                self._flush_canvas()
+            # Pace frames: only sleep for whatever part of the frame budget
+            # the work since the previous GAMEDELAY has not already used.
+            sleep_for = delay_ms / 1000.0 - (time.monotonic() - self._last_tick)
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            self._last_tick = time.monotonic()
+        except ValueError:
+            self.interpreter.log_output("Error: Invalid GAMEDELAY parameter")
+
+    def _cmd_gamecircle(self, parts):
+        """GAMECIRCLE x, y, radius [, filled] (filled defaults to 0)"""
+        if len(parts) < 4:
+            return
+        try:
+            x, y, radius = self._parse_ints(parts, 3)
+            filled = len(parts) >= 5 and int(parts[4]) != 0  # Default unfilled
+            self._circle_fns[filled](x, y, radius)
+        except ValueError:
+            self.interpreter.log_output("Error: Invalid GAMECIRCLE parameters")
+
+    def _cmd_gamekey(self, parts):
+        """GAMEKEY() - get pressed key"""
+        key = self.interpreter.get_user_input("Press a key: ")
+        if key:
+            self.interpreter.variables["LAST_KEY"] = key.upper()
+            self.interpreter.log_output(f"🎮 Key pressed: {key.upper()}")
         else:
-            # Generic game command
-            self.interpreter.log_output(f"🎮 Game command: {command}")
-        return "continue"
+            self.interpreter.variables["LAST_KEY"] = ""
+
+    # Split limits for commands whose last argument is free text
+    _GAME_TEXT_SPLITS = {"GAMESCREEN": 3, "GAMETEXT": 3}
+
+    # Game command name -> handler, built once at class creation so each
+    # GAME* statement costs a single dict lookup instead of an if/elif scan.
+    _GAME_DISPATCH = {
+        "GAMESCREEN": _cmd_gamescreen,
+        "GAMEBG": _cmd_gamebg,
+        "GAMELOOP": _cmd_gameloop,
+        "GAMEEND": _cmd_gameend,
+        "GAMECLEAR": _cmd_gameclear,
+        "GAMECOLOR": _cmd_gamecolor,
+        "GAMEPOINT": _cmd_gamepoint,
+        "GAMERECT": _cmd_gamerect,
+        "GAMETEXT": _cmd_gametext,
+        "GAMEUPDATE": _cmd_gameupdate,
+        "GAMEDELAY": _cmd_gamedelay,
+        "GAMECIRCLE": _cmd_gamecircle,
+        "GAMEKEY": _cmd_gamekey,
+    }
 
     def _handle_multiplayer_commands(self, command, _cmd, _parts):
         """Handle multiplayer and networking commands"""
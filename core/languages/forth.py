@@ -11,7 +11,8 @@ Language Features:
 - Arithmetic: +, -, *, /, MOD, /MOD, MIN, MAX, ABS, NEGATE
 - Comparison: =, <, >, <=, >=, 0=, 0<, 0>
 - Bitwise operations: AND, OR, XOR, INVERT
-- Control structures: IF/THEN/ELSE, BEGIN/UNTIL, BEGIN/WHILE/REPEAT, DO/LOOP
+- Control structures: IF/THEN/ELSE, BEGIN/UNTIL, BEGIN/WHILE/REPEAT, BEGIN/AGAIN,
+  DO/LOOP, ?DO/+LOOP, EXIT
 - Word definition: : (colon) to define new words, ; (semicolon) to end
 - Variables: VARIABLE to create named storage locations
 - Constants: CONSTANT to define named values
@@ -38,9 +39,140 @@ work on data items pushed onto and popped from a parameter stack.
 
 import re
 import math
+from array import array
+from math import cos as _cos, exp as _exp, log as _log, radians as _radians
+from math import sin as _sin, sqrt as _sqrt, tan as _tan
 
 # pylint: disable=too-many-lines,too-many-instance-attributes,W0108,W0718,R1705,R0911,R0912,R0903
 
+# Opcodes of compiled Forth code; each instruction is an (opcode, arg) tuple
+OP_CALL = 0  # arg: callable implementing the word
+OP_PUSH = 1  # arg: value pushed onto the data stack
+OP_FPUSH = 2  # arg: value pushed onto the float stack
+OP_PRINT = 3  # arg: text of a ." string
+OP_BRANCH = 4  # arg: target pc
+OP_IF = 5  # arg: target pc, taken when the popped flag is 0
+OP_WHILE = 6  # arg: target pc, taken when the popped flag is 0
+OP_UNTIL = 7  # arg: target pc, taken when the popped flag is 0
+OP_DO = 8  # arg: unused
+OP_LOOP = 9  # arg: pc of the first instruction of the loop body
+OP_RECURSE = 10  # arg: unused
+OP_VARIABLE = 11  # arg: name of the variable to create
+OP_CONSTANT = 12  # arg: name of the constant to create
+OP_QDO = 13  # arg: pc after the loop, taken when start equals limit
+OP_PLUS_LOOP = 14  # arg: pc of the first instruction of the loop body
+OP_EXIT = 15  # arg: unused
+
+# Builtin words executed inline by the VM rather than through the dictionary
+OP_ADD = 16
+OP_SUB = 17
+OP_MUL = 18
+OP_EQUAL = 19
+OP_LESS = 20
+OP_GREATER = 21
+OP_DUP = 22
+OP_DROP = 23
+OP_SWAP = 24
+OP_OVER = 25
+OP_ONE_PLUS = 26
+OP_ONE_MINUS = 27
+OP_I = 28
+
+# Fused instructions produced by the peephole pass in _fuse_instructions
+OP_ADD_LIT = 29  # arg: literal added to the top of the stack
+OP_SUB_LIT = 30  # arg: literal subtracted from the top of the stack
+OP_MUL_LIT = 31  # arg: literal the top of the stack is multiplied by
+OP_EQUAL_LIT = 32  # arg: literal the top of the stack is compared with
+OP_LESS_LIT = 33  # arg: literal the top of the stack is compared with
+OP_GREATER_LIT = 34  # arg: literal the top of the stack is compared with
+OP_2DROP = 35  # arg: unused
+
+# A token is a run of non-blank characters, except that a double quote
+# opens a string which runs (spaces included) to the closing quote
+_TOKEN_RE = re.compile(r'[^\s"]*"[^"]*"?|[^\s"]+')
+_LINE_COMMENT_RE = re.compile(r"\\.*$")
+_PAREN_COMMENT_RE = re.compile(r"\(.*?\)")
+# Numeric literals: integers, or decimals (which need a point) with an
+# optional exponent
+_NUM_RE = re.compile(r"[+-]?(?:\d+|(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)$")
+
+_COMPILE_CACHE_MAX = 256  # interpreted lines kept compiled
+
+_BRANCH_NAMES = {OP_IF: "IF", OP_WHILE: "WHILE", OP_UNTIL: "UNTIL"}
+
+# word -> (opcode, stack items it needs) for the inline builtins
+_INLINE_WORDS = {
+    "+": (OP_ADD, 2),
+    "-": (OP_SUB, 2),
+    "*": (OP_MUL, 2),
+    "=": (OP_EQUAL, 2),
+    "<": (OP_LESS, 2),
+    ">": (OP_GREATER, 2),
+    "DUP": (OP_DUP, 1),
+    "DROP": (OP_DROP, 1),
+    "SWAP": (OP_SWAP, 2),
+    "OVER": (OP_OVER, 2),
+    "1+": (OP_ONE_PLUS, 1),
+    "1-": (OP_ONE_MINUS, 1),
+    "I": (OP_I, 0),
+}
+_INLINE_NAMES = {op: word for word, (op, _) in _INLINE_WORDS.items()}
+_INLINE_ARITY = {op: arity for op, arity in _INLINE_WORDS.values()}
+
+# (first opcode, second opcode) -> fused opcode, which keeps the first's arg
+_PEEPHOLES = {
+    (OP_PUSH, OP_ADD): OP_ADD_LIT,
+    (OP_PUSH, OP_SUB): OP_SUB_LIT,
+    (OP_PUSH, OP_MUL): OP_MUL_LIT,
+    (OP_PUSH, OP_EQUAL): OP_EQUAL_LIT,
+    (OP_PUSH, OP_LESS): OP_LESS_LIT,
+    (OP_PUSH, OP_GREATER): OP_GREATER_LIT,
+    (OP_DROP, OP_DROP): OP_2DROP,
+}
+for (_, _second), _fused in _PEEPHOLES.items():
+    # A fused literal op needs one stack item fewer than the word it replaces
+    _INLINE_NAMES[_fused] = _INLINE_NAMES[_second]
+    _INLINE_ARITY[_fused] = 2 if _fused == OP_2DROP else 1
+
+# Instructions whose arg is a pc
+_JUMP_OPS = frozenset(
+    (OP_BRANCH, OP_IF, OP_WHILE, OP_UNTIL, OP_LOOP, OP_QDO, OP_PLUS_LOOP)
+)
+
+
+def _fuse_instructions(code):
+    """
+    Peephole pass replacing common instruction pairs with one instruction.
+
+    A pair is left alone when a branch lands on its second instruction.
+
+    Args:
+        code: Complete compiled code, every branch target resolved
+
+    Returns:
+        list: The fused code with branch targets renumbered
+    """
+    targets = {arg for op, arg in code if op in _JUMP_OPS}
+    fused = []
+    new_pc = []  # old pc -> new pc
+    pc = 0
+    end = len(code)
+    while pc < end:
+        op, arg = code[pc]
+        new_pc.append(len(fused))
+        pair = _PEEPHOLES.get((op, code[pc + 1][0])) if pc + 1 < end else None
+        if pair is not None and pc + 1 not in targets:
+            new_pc.append(len(fused))
+            fused.append((pair, arg))
+            pc += 2
+        else:
+            fused.append((op, arg))
+            pc += 1
+    new_pc.append(len(fused))
+    return [
+        (op, new_pc[arg]) if op in _JUMP_OPS else (op, arg) for op, arg in fused
+    ]
+
 
 class TwForthExecutor:
     """Handles TW Forth language command execution"""
@@ -50,8 +182,13 @@ class TwForthExecutor:
         self.interpreter = interpreter
         self.data_stack = []  # Main data stack
         self.return_stack = []  # Return stack for control structures
-        self.float_stack = []  # Floating point stack
+        # Floating point stack; a typed array keeps the values unboxed
+        self.float_stack = array("d")
         self.dictionary = {}  # User-defined words
+        # Bumped whenever a dictionary entry is (re)defined, so compiled code
+        # that bound the old entry is not reused
+        self.dictionary_version = 0
+        self._compile_cache = {}  # (words, dictionary_version) -> code
         self.variables = {}  # Variables
         self.constants = {}  # Constants
         self.values = {}  # Mutable constants (VALUE/TO)
@@ -69,11 +206,7 @@ class TwForthExecutor:
         self.exception_handlers = []  # Exception handling stack
         self.next_file_id = 0  # For file handle management
         self.next_memory_id = 0  # For memory block management
-        # Temporary flags when following tokens act as names
-        self.expecting_variable_name = False
-        self.pending_variable_name = None
-        self.expecting_constant_name = False
-        self.pending_constant_value = None
+        self.interpret_buffer = []  # Words awaiting the end of a control structure
 
         # Initialize built-in words
         self._init_builtin_words()
@@ -121,6 +254,9 @@ class TwForthExecutor:
                 "OR": lambda: self._or(),
                 "XOR": lambda: self._xor(),
                 "INVERT": lambda: self._invert(),
+                # Memory
+                "!": lambda: self._store(),
+                "@": lambda: self._fetch(),
                 # I/O
                 ".": lambda: self._dot(),
                 ".S": lambda: self._dot_s(),
@@ -185,8 +321,7 @@ class TwForthExecutor:
                 "TRY": lambda: self._try(),
                 "THROW": lambda: self._throw(),
                 "CATCH": lambda: self._catch(),
-                # Value (mutable constants)
-                "VALUE": lambda: self._value(),
+                # Value (mutable constants; VALUE itself is compiled)
                 "TO": lambda: self._to(),
                 # Structure operations
                 "STRUCT": lambda: self._struct(),
@@ -200,6 +335,31 @@ class TwForthExecutor:
                 "SEND": lambda: self._send(),
             }
         )
+        # Snapshot so the compiler can tell builtins from user redefinitions
+        self._builtin_words = dict(self.dictionary)
+
+        # Words with compile-time behaviour, dispatched by _compile
+        self._compile_words = {
+            "{": self._compile_locals,
+            "}": self._compile_locals,
+            "IF": self._compile_if,
+            "ELSE": self._compile_else,
+            "THEN": self._compile_then,
+            "BEGIN": self._compile_begin,
+            "UNTIL": self._compile_until,
+            "WHILE": self._compile_while,
+            "REPEAT": self._compile_repeat,
+            "DO": self._compile_do,
+            "LOOP": self._compile_loop,
+            "?DO": self._compile_do,
+            "+LOOP": self._compile_loop,
+            "AGAIN": self._compile_again,
+            "EXIT": self._compile_exit,
+            "RECURSE": self._compile_recurse,
+            "VARIABLE": self._compile_defining_word,
+            "CONSTANT": self._compile_defining_word,
+            "VALUE": self._compile_defining_word,
+        }
 
     def execute_command(self, command):
         """Execute a Forth command and return the result"""
@@ -211,13 +371,39 @@ class TwForthExecutor:
             # Split command into words
             words = self._tokenize(command)
 
+            # Words outside colon definitions are compiled and run together;
+            # a control structure left open carries them over to the next line
+            pending = self.interpret_buffer
             for word in words:
-                if not self._execute_word(word):
-                    return "error"
+                if word == ":":
+                    if not self.compiling and pending:
+                        if not self._interpret(pending):
+                            return "error"
+                        pending = self.interpret_buffer
+                    self.compiling = True
+                    self.word_definition = []
+                    self.current_word = None
+                    self.locals = {}  # Reset locals for new definition
+                elif not self.compiling:
+                    if word == ";":
+                        self.interpreter.log_output("Error: Not in word definition")
+                    else:
+                        pending.append(word)
+                elif word == ";":
+                    if not self._end_word_definition():
+                        return "error"
+                elif self.current_word is None:
+                    # First word after the colon names the new definition
+                    self.current_word = word
+                else:
+                    self.word_definition.append(word)
+
+            if pending and not self._interpret(pending):
+                return "error"
 
             # If we're compiling and haven't seen the semicolon yet,
             # return a special value to indicate continuation needed
-            if self.compiling:
+            if self.compiling or self.interpret_buffer:
                 return "forth_compiling"
 
             return "continue"
@@ -228,380 +414,416 @@ class TwForthExecutor:
 
     def _tokenize(self, command):
         """Tokenize Forth command into words"""
-        # Handle comments first
-        # Remove backslash comments (from \ to end of line)
-        if command.strip().startswith("\\"):
-            return []  # Entire line is a comment
-        command = re.sub(r"\\.*$", "", command)
-        # Remove parenthesis comments
-        command = re.sub(r"\(.*?\)", "", command)  # Remove ( comments )
-
-        # Handle .\" strings specially
-        command = re.sub(r"\.\"([^\"]*?)\"", r'."\1"', command)
-
+        # Remove backslash comments (from \ to end of line), then
+        # parenthesis comments
+        command = _LINE_COMMENT_RE.sub("", command)
+        command = _PAREN_COMMENT_RE.sub("", command)
         # Split on whitespace, keeping quoted strings together
-        tokens = []
-        current_token = ""
-        in_string = False
-
-        for char in command:
-            if char == '"' and not in_string:
-                in_string = True
-                current_token += char
-            elif char == '"' and in_string:
-                in_string = False
-                current_token += char
-                tokens.append(current_token)
-                current_token = ""
-            elif char.isspace() and not in_string:
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-            else:
-                current_token += char
+        return _TOKEN_RE.findall(command)
+
+    def _interpret(self, words):
+        """Compile and run words typed outside a definition"""
+        self.interpret_buffer = []
+        key = (tuple(words), self.dictionary_version)
+        code = self._compile_cache.get(key)
+        if code is None:
+            code, open_word = self._compile(words)
+            if code is None:
+                return False
+            if open_word is not None:
+                # Wait for the rest of the control structure on later lines
+                self.interpret_buffer = words
+                return True
+            if len(self._compile_cache) >= _COMPILE_CACHE_MAX:
+                self._compile_cache.clear()
+            self._compile_cache[key] = code
+        return self._run(code)
+
+    def reset_run_state(self):
+        """Drop any half-entered definition or control structure"""
+        self.interpret_buffer = []
+        self.compiling = False
+        self.current_word = None
+        self.word_definition = []
+        self.locals = {}
+
+    def end_run(self):
+        """Report structures a program left open, then reset for the next run"""
+        if self.interpret_buffer:
+            _code, open_word = self._compile(self.interpret_buffer)
+            if open_word is not None:
+                self.interpreter.log_error(f"Unterminated {open_word} at end of program")
+        elif self.compiling:
+            self.interpreter.log_error(
+                f"Unterminated definition {self.current_word or ':'} at end of program"
+            )
+        self.reset_run_state()
 
-        if current_token:
-            tokens.append(current_token)
+    def _is_number(self, word):
+        """Check if word is a number"""
+        return _NUM_RE.match(word) is not None
 
-        return tokens
+    def _parse_number(self, word):
+        """Parse a number from string"""
+        if "." in word:
+            return float(word)
+        else:
+            return int(word)
 
-    def _execute_word(self, word):  # noqa: C901
-        """Execute a single Forth word"""
-        try:
-            # Enforce IF_SKIP: when inside a false IF branch, skip all words
-            # except ELSE, THEN and REPEAT which manage the branch state.
-            if (
-                self.return_stack
-                and isinstance(self.return_stack[-1], str)
-                and self.return_stack[-1].endswith("_SKIP")
-                and word not in ("ELSE", "THEN", "REPEAT")
-            ):
-                return True  # silently skip this word
-
-            # Handle tokens that are expected to be names for VARIABLE/CONSTANT
-            if self.expecting_variable_name:
-                name = word
-                # Create variable storage with default 0
-                self.variables[name] = 0
-                # Add execution hook so using variable pushes reference
-                self.dictionary[name] = lambda n=name: self.data_stack.append(
-                    {"type": "var", "name": n}
-                )
-                self.expecting_variable_name = False
-                self.pending_variable_name = None
-                self.interpreter.log_output(f"Variable declared: {name}")
-                return True
+    def _try_parse_number(self, word):
+        """Parse word as a number, returning None if it is not one"""
+        if _NUM_RE.match(word) is None:
+            return None
+        return self._parse_number(word)
 
-            if self.expecting_constant_name:
-                name = word
-                self.constants[name] = self.pending_constant_value
-                # Add a word so constant name pushes constant value
-                self.dictionary[name] = (
-                    lambda v=self.pending_constant_value: self.data_stack.append(v)
+    def _end_word_definition(self):
+        """End word definition and store it"""
+        if self.compiling and self.current_word:
+            name = self.current_word
+            code, open_word = self._compile(self.word_definition, name)
+            self.compiling = False
+            self.current_word = None
+            self.word_definition = []
+            if code is None:
+                return False
+            if open_word is not None:
+                self.interpreter.log_output(
+                    f"Error: {open_word} without matching end in {name}"
                 )
-                self.expecting_constant_name = False
-                self.pending_constant_value = None
-                self.interpreter.log_output(f"Constant declared: {name}")
-                return True
+                return False
+            self.dictionary[name] = lambda: self._run(code)
+            self.dictionary_version += 1
+            self.interpreter.log_output(f"Defined word: {name}")
+        else:
+            self.interpreter.log_output("Error: Not in word definition")
+        return True
 
-            # Handle numbers (including floating point)
-            if self._is_number(word):
-                if self.compiling:
-                    self.word_definition.append(word)
-                else:
-                    if "." in word and word.count(".") == 1:
-                        # Floating point number
-                        self.float_stack.append(self._parse_number(word))
-                    else:
-                        # Integer
-                        self.data_stack.append(self._parse_number(word))
-                return True
+    def _compile(self, words, word_name=None):
+        """
+        Compile a list of words into (opcode, argument) instructions.
 
-            # Handle strings
-            if word.startswith('"') and word.endswith('"'):
-                if self.compiling:
-                    self.word_definition.append(word)
+        Numbers and strings are parsed once here, and control structures
+        become branches whose targets are patched as their closing word is
+        reached, so running the code never re-examines the source words.
+
+        Args:
+            words: Tokens to compile
+            word_name: Name of the definition being compiled, if any
+
+        Returns:
+            tuple: (code, open_word) where code is None after a compile
+            error and open_word names an unclosed control structure
+        """
+        code = []
+        emit = code.append
+        control = []  # (word, pc) for each open control structure
+        compile_words = self._compile_words
+        tokens = iter(words)
+        for word in tokens:
+            handler = compile_words.get(word)
+            if handler is not None:
+                if not handler(word, code, control, tokens, word_name):
+                    return None, None
+                continue
+            value = self._try_parse_number(word)
+            if value is not None:
+                # Literals with a decimal point go to the float stack
+                emit((OP_FPUSH if isinstance(value, float) else OP_PUSH, value))
+            elif word.startswith('"') and word.endswith('"'):
+                emit((OP_PUSH, word[1:-1]))  # Remove quotes
+            elif word.startswith('."') and word.endswith('"'):
+                emit((OP_PRINT, word[2:-1]))
+            elif (
+                word in _INLINE_WORDS
+                and self.dictionary.get(word) is self._builtin_words[word]
+            ):
+                emit((_INLINE_WORDS[word][0], None))
+            else:
+                # Bind the word now; names not yet defined (forward
+                # references, VARIABLEs created by this same code) and
+                # constants, which may be redefined while this code runs,
+                # are looked up when executed
+                if word in self.dictionary and word not in self.constants:
+                    emit((OP_CALL, self.dictionary[word]))
                 else:
-                    self.data_stack.append(word[1:-1])  # Remove quotes
-                return True
+                    emit((OP_CALL, lambda name=word: self._call_late_bound(name)))
+        if control:
+            return code, control[-1][0]
+        return _fuse_instructions(code), None
 
-            # Handle locals definition
-            if word == "{":
-                return self._handle_locals_start()
-            elif word == "}":
-                return self._handle_locals_end()
-
-            # Handle word definition start
-            if word == ":":
-                self.compiling = True
-                self.word_definition = []
-                self.current_word = None
-                self.locals = {}  # Reset locals for new definition
-                return True
+    # Compile-time words: each takes (word, code, control, tokens,
+    # word_name), emits or patches instructions and returns False on error
+    def _compile_locals(self, word, code, control, tokens, word_name):
+        if word == "{":
+            return self._handle_locals_start()
+        return self._handle_locals_end()
 
-            # If compiling and we don't have a word name yet, this is the word name
-            if self.compiling and self.current_word is None:
-                self.current_word = word
-                return True
+    def _compile_if(self, word, code, control, tokens, word_name):
+        control.append(("IF", len(code)))
+        code.append((OP_IF, None))
+        return True
 
-            # Handle word definition end
-            if word == ";":
-                self._end_word_definition()
-                return True
+    def _compile_else(self, word, code, control, tokens, word_name):
+        if not control or control[-1][0] != "IF":
+            self.interpreter.log_output("ELSE without matching IF")
+            return False
+        _, at = control.pop()
+        control.append(("ELSE", len(code)))
+        code.append((OP_BRANCH, None))
+        code[at] = (OP_IF, len(code))
+        return True
 
-            # Handle control structures
-            if word == "IF":
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_if()
-            elif word == "THEN":
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_then()
-            elif word == "ELSE":
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_else()
-            elif word == "BEGIN":
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_begin()
-            elif word == "UNTIL":
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_until()
-            elif word == "WHILE":
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_while()
-            elif word == "REPEAT":
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_repeat()
-            elif word == "RECURSE":
-                return self._recurse()
-            elif word == "DO":
-                # If compiling, keep as token to be handled in compiled execution
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_do()
-            elif word == "LOOP":
-                if self.compiling:
-                    self.word_definition.append(word)
-                    return True
-                return self._handle_loop()
-
-            # Handle variable operations
-            if word == "VARIABLE":
-                # Next token must be the variable name
-                return self._handle_variable()
-            elif word == "CONSTANT":
-                return self._handle_constant()
-            elif word == "!":
-                return self._store()
-            elif word == "@":
-                return self._fetch()
-
-            # Execute built-in or user-defined word
-            # Handle ."string" inline printing tokens
-            if word.startswith('."') and word.endswith('"'):
-                # print inner content
-                inner = word[2:-1]
-                if self.compiling:
-                    self.word_definition.append(word)
-                else:
-                    self.interpreter.log_output(inner)
-                return True
+    def _compile_then(self, word, code, control, tokens, word_name):
+        if not control or control[-1][0] not in ("IF", "ELSE"):
+            self.interpreter.log_output("THEN without matching IF")
+            return False
+        _, at = control.pop()
+        code[at] = (code[at][0], len(code))
+        return True
 
-            # Handle variable and constant names when they appear as words
-            if word in self.variables:
-                # pushing a variable reference (use name token)
-                if self.compiling:
-                    self.word_definition.append(word)
-                else:
-                    # push a simple reference (name) to the stack
-                    self.data_stack.append({"type": "var", "name": word})
-                return True
+    def _compile_begin(self, word, code, control, tokens, word_name):
+        control.append(("BEGIN", len(code)))
+        return True
 
-            if word in self.constants:
-                if self.compiling:
-                    self.word_definition.append(word)
-                else:
-                    self.data_stack.append(self.constants[word])
-                return True
+    def _compile_until(self, word, code, control, tokens, word_name):
+        if not control or control[-1][0] != "BEGIN":
+            self.interpreter.log_output("UNTIL without matching BEGIN")
+            return False
+        code.append((OP_UNTIL, control.pop()[1]))
+        return True
 
-            if word in self.dictionary:
-                if self.compiling:
-                    self.word_definition.append(word)
-                else:
-                    result = self.dictionary[word]()
-                    if result is False:  # Word execution failed
-                        return False
-                return True
+    def _compile_while(self, word, code, control, tokens, word_name):
+        if not control or control[-1][0] != "BEGIN":
+            self.interpreter.log_output("WHILE without matching BEGIN")
+            return False
+        control.append(("WHILE", len(code)))
+        code.append((OP_WHILE, None))
+        return True
 
-            # Unknown word
-            self.interpreter.log_output(f"Unknown word: {word}")
+    def _compile_repeat(self, word, code, control, tokens, word_name):
+        if len(control) < 2 or control[-1][0] != "WHILE":
+            self.interpreter.log_output("REPEAT without matching WHILE")
             return False
+        _, at = control.pop()
+        _, begin = control.pop()
+        code.append((OP_BRANCH, begin))
+        code[at] = (OP_WHILE, len(code))
+        return True
 
-        except Exception as e:
-            self.interpreter.debug_output(f"Word execution error: {e}")
+    def _compile_do(self, word, code, control, tokens, word_name):
+        # ?DO is patched at LOOP to skip the body when start equals limit
+        code.append((OP_QDO if word == "?DO" else OP_DO, None))
+        control.append(("DO", len(code)))
+        return True
+
+    def _compile_loop(self, word, code, control, tokens, word_name):
+        if not control or control[-1][0] != "DO":
+            self.interpreter.log_output(f"{word} without matching DO")
             return False
+        body = control.pop()[1]
+        code.append((OP_LOOP if word == "LOOP" else OP_PLUS_LOOP, body))
+        if code[body - 1][0] == OP_QDO:
+            code[body - 1] = (OP_QDO, len(code))
+        return True
 
-    def _is_number(self, word):
-        """Check if word is a number"""
-        try:
-            self._parse_number(word)
-            return True
-        except ValueError:
+    def _compile_again(self, word, code, control, tokens, word_name):
+        if not control or control[-1][0] != "BEGIN":
+            self.interpreter.log_output("AGAIN without matching BEGIN")
             return False
+        code.append((OP_BRANCH, control.pop()[1]))
+        return True
 
-    def _parse_number(self, word):
-        """Parse a number from string"""
-        if "." in word:
-            return float(word)
-        else:
-            return int(word)
+    def _compile_exit(self, word, code, control, tokens, word_name):
+        if word_name is None:
+            self.interpreter.log_output(
+                "EXIT can only be used inside word definitions"
+            )
+            return False
+        code.append((OP_EXIT, None))
+        return True
 
-    def _end_word_definition(self):
-        """End word definition and store it"""
-        if self.compiling and self.current_word:
-            self.dictionary[self.current_word] = self._create_word_function(
-                self.word_definition, self.current_word
+    def _compile_recurse(self, word, code, control, tokens, word_name):
+        if word_name is None:
+            self.interpreter.log_output(
+                "RECURSE can only be used inside word definitions"
             )
-            self.interpreter.log_output(f"Defined word: {self.current_word}")
-            self.compiling = False
-            self.current_word = None
-            self.word_definition = []
-        else:
-            self.interpreter.log_output("Error: Not in word definition")
+            return False
+        code.append((OP_RECURSE, None))
+        return True
 
-    def _create_word_function(self, definition, word_name=None):  # noqa: C901
-        """Create a function from word definition"""
-
-        def word_func():
-            i = 0
-            # execute with instruction pointer so DO/LOOP can jump
-            while i < len(definition):
-                word = definition[i]
-
-                # Handle RECURSE sentinel – resolves to a self-recursive call
-                # using the word's name captured at definition time.
-                if word == "__RECURSE__":
-                    if word_name and word_name in self.dictionary:
-                        self.dictionary[word_name]()
-                    i += 1
-                    continue
-
-                # Handle DO/LOOP compiled control
-                if word == "DO":
-                    # DO expects ( limit start -- ) on stack
-                    # Stack is: ... limit start
-                    # start is on top
-                    if len(self.data_stack) < 2:
-                        self.interpreter.log_output("Stack underflow in DO")
+    def _compile_defining_word(self, word, code, control, tokens, word_name):
+        # VARIABLE, CONSTANT and VALUE take the following token as the name
+        name = next(tokens, None)
+        if name is None:
+            self.interpreter.log_output(f"{word} needs a name")
+            return False
+        code.append((OP_VARIABLE if word == "VARIABLE" else OP_CONSTANT, name))
+        return True
+
+    def _call_late_bound(self, name):
+        """Execute a word that was not yet defined when it was compiled"""
+        word = self.dictionary.get(name)
+        if word is None:
+            self.interpreter.log_output(f"Unknown word: {name}")
+            return False
+        return word()
+
+    def _run(self, code):  # noqa: C901
+        """
+        Execute compiled code.
+
+        Returns:
+            bool: False if a word failed, True otherwise
+        """
+        # Bind the stacks and output once; none of them is ever rebound
+        stack = self.data_stack
+        rstack = self.return_stack
+        log = self.interpreter.log_output
+        pc = 0
+        end = len(code)
+        depth = len(rstack)  # DO frames above this belong to us
+        try:
+            while pc < end:
+                op, arg = code[pc]
+                pc += 1
+                if op == OP_CALL:
+                    if arg() is False:  # Word execution failed
+                        return False
+                elif op == OP_PUSH:
+                    stack.append(arg)
+                elif op >= OP_ADD:
+                    # Inline builtins: no dictionary lookup or method call
+                    if len(stack) < _INLINE_ARITY[op]:
+                        log(f"Stack underflow in {_INLINE_NAMES[op]}")
                         return False
-                    start = self.data_stack.pop()  # Top of stack is start index
-                    limit = self.data_stack.pop()  # Next is limit
-                    # push a frame with ip position and counters
-                    frame = {
-                        "type": "DO",
-                        "ip": i,
-                        "index": start,
-                        "limit": limit,
-                    }
-                    self.return_stack.append(frame)
-                    i += 1
-                    continue
-
-                if word == "LOOP":
-                    if (
-                        not self.return_stack
-                        or self.return_stack[-1].get("type") != "DO"
-                    ):
-                        self.interpreter.log_output("LOOP without matching DO")
+                    if op >= OP_ADD_LIT:
+                        # Fused instructions, taking their operand from arg
+                        if op == OP_ADD_LIT:
+                            stack[-1] += arg
+                        elif op == OP_SUB_LIT:
+                            stack[-1] -= arg
+                        elif op == OP_MUL_LIT:
+                            stack[-1] *= arg
+                        elif op == OP_LESS_LIT:
+                            stack[-1] = -1 if stack[-1] < arg else 0
+                        elif op == OP_EQUAL_LIT:
+                            stack[-1] = -1 if stack[-1] == arg else 0
+                        elif op == OP_GREATER_LIT:
+                            stack[-1] = -1 if stack[-1] > arg else 0
+                        elif op == OP_2DROP:
+                            del stack[-2:]
+                    elif op == OP_ADD:
+                        b = stack.pop()
+                        stack[-1] += b
+                    elif op == OP_SUB:
+                        b = stack.pop()
+                        stack[-1] -= b
+                    elif op == OP_MUL:
+                        b = stack.pop()
+                        stack[-1] *= b
+                    elif op == OP_EQUAL:
+                        b = stack.pop()
+                        stack[-1] = -1 if stack[-1] == b else 0
+                    elif op == OP_LESS:
+                        b = stack.pop()
+                        stack[-1] = -1 if stack[-1] < b else 0
+                    elif op == OP_GREATER:
+                        b = stack.pop()
+                        stack[-1] = -1 if stack[-1] > b else 0
+                    elif op == OP_DUP:
+                        stack.append(stack[-1])
+                    elif op == OP_DROP:
+                        stack.pop()
+                    elif op == OP_SWAP:
+                        stack[-1], stack[-2] = stack[-2], stack[-1]
+                    elif op == OP_OVER:
+                        stack.append(stack[-2])
+                    elif op == OP_ONE_PLUS:
+                        stack[-1] += 1
+                    elif op == OP_ONE_MINUS:
+                        stack[-1] -= 1
+                    elif op == OP_I:
+                        frame = rstack[-1] if rstack else None
+                        if not isinstance(frame, dict) or frame.get("type") != "DO":
+                            log("I used outside of DO/LOOP")
+                            return False
+                        stack.append(frame.get("index", 0))
+                elif op == OP_LOOP:
+                    frame = rstack[-1] if rstack else None
+                    if not isinstance(frame, dict) or frame.get("type") != "DO":
+                        log("LOOP without matching DO")
                         return False
-                    frame = self.return_stack[-1]
                     frame["index"] += 1
-                    # if still less than limit, jump back to after DO
+                    # While still below the limit, jump back to the loop body
                     if frame["index"] < frame["limit"]:
-                        i = frame["ip"] + 1
-                        continue
-                    # else pop frame and continue
-                    self.return_stack.pop()
-                    i += 1
-                    continue
-
-                # Handle BEGIN...WHILE...REPEAT
-                if word == "BEGIN":
-                    # Mark the beginning of the loop
-                    self.return_stack.append({"type": "BEGIN", "ip": i})
-                    i += 1
-                    continue
-
-                if word == "WHILE":
-                    # Check condition on stack
-                    if len(self.data_stack) < 1:
-                        self.interpreter.log_output("Stack underflow in WHILE")
+                        pc = arg
+                    else:
+                        rstack.pop()
+                elif op == OP_IF or op == OP_WHILE or op == OP_UNTIL:
+                    if not stack:
+                        log(f"Stack underflow in {_BRANCH_NAMES[op]}")
                         return False
-                    condition = self.data_stack.pop()
-                    if condition == 0:  # False - skip to after REPEAT
-                        # Find matching REPEAT
-                        depth = 1
-                        j = i + 1
-                        while j < len(definition) and depth > 0:
-                            if definition[j] == "BEGIN":
-                                depth += 1
-                            elif definition[j] == "REPEAT":
-                                depth -= 1
-                            j += 1
-                        # Pop the BEGIN frame
-                        if self.return_stack and self.return_stack[-1].get("type") == "BEGIN":
-                            self.return_stack.pop()
-                        i = j  # Jump past REPEAT
-                        continue
-                    i += 1
-                    continue
-
-                if word == "REPEAT":
-                    # Jump back to BEGIN
-                    if self.return_stack and self.return_stack[-1].get("type") == "BEGIN":
-                        i = self.return_stack[-1]["ip"]
-                        continue
-                    i += 1
-                    continue
-
-                # Handle UNTIL
-                if word == "UNTIL":
-                    if len(self.data_stack) < 1:
-                        self.interpreter.log_output("Stack underflow in UNTIL")
+                    if stack.pop() == 0:
+                        pc = arg
+                elif op == OP_BRANCH:
+                    pc = arg
+                elif op == OP_DO:
+                    # DO expects ( limit start -- ) with start on top
+                    if len(stack) < 2:
+                        log("Stack underflow in DO")
                         return False
-                    condition = self.data_stack.pop()
-                    if condition == 0:  # False - loop back to BEGIN
-                        if self.return_stack and self.return_stack[-1].get("type") == "BEGIN":
-                            i = self.return_stack[-1]["ip"]
-                            continue
-                    # True - exit loop
-                    if self.return_stack and self.return_stack[-1].get("type") == "BEGIN":
-                        self.return_stack.pop()
-                    i += 1
-                    continue
-
-                # normal execution
-                if not self._execute_word(word):
-                    return False
-                i += 1
-
-            return True
-
-        return word_func
+                    start = stack.pop()
+                    limit = stack.pop()
+                    rstack.append({"type": "DO", "index": start, "limit": limit})
+                elif op == OP_PLUS_LOOP:
+                    frame = rstack[-1] if rstack else None
+                    if not isinstance(frame, dict) or frame.get("type") != "DO":
+                        log("+LOOP without matching DO")
+                        return False
+                    if not stack:
+                        log("Stack underflow in +LOOP")
+                        return False
+                    step = stack.pop()
+                    frame["index"] += step
+                    # Counting down includes the limit, counting up stops short
+                    if step < 0:
+                        again = frame["index"] >= frame["limit"]
+                    else:
+                        again = frame["index"] < frame["limit"]
+                    if again:
+                        pc = arg
+                    else:
+                        rstack.pop()
+                elif op == OP_QDO:
+                    if len(stack) < 2:
+                        log("Stack underflow in ?DO")
+                        return False
+                    start = stack.pop()
+                    limit = stack.pop()
+                    if start == limit:
+                        pc = arg
+                    else:
+                        rstack.append({"type": "DO", "index": start, "limit": limit})
+                elif op == OP_EXIT:
+                    # Leave any loops this word is still inside
+                    del rstack[depth:]
+                    return True
+                elif op == OP_PRINT:
+                    log(arg)
+                elif op == OP_FPUSH:
+                    self.float_stack.append(arg)
+                elif op == OP_RECURSE:
+                    if self._run(code) is False:
+                        return False
+                elif op == OP_VARIABLE:
+                    self._define_variable(arg)
+                elif op == OP_CONSTANT:
+                    if not self._define_constant(arg):
+                        return False
+        except Exception as e:
+            self.interpreter.debug_output(f"Word execution error: {e}")
+            return False
+        return True
 
     # Stack manipulation words
     def _dup(self):
@@ -668,50 +890,57 @@ class TwForthExecutor:
 
     # Arithmetic operations
     def _add(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in +")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(a + b)
+        b = s.pop()
+        s[-1] = s[-1] + b
         return True
 
     def _sub(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in -")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(a - b)
+        b = s.pop()
+        s[-1] = s[-1] - b
         return True
 
     def _mul(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in *")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(a * b)
+        b = s.pop()
+        s[-1] = s[-1] * b
         return True
 
     def _div(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in /")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
+        b = s.pop()
         if b == 0:
+            s.pop()
             self.interpreter.log_output("Division by zero")
             return False
         # Forth uses truncated integer division, not float division
-        self.data_stack.append(int(a / b))
+        s[-1] = int(s[-1] / b)
         return True
 
     def _mod(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in MOD")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
+        b = s.pop()
         if b == 0:
+            s.pop()
             self.interpreter.log_output("Division by zero in MOD")
             return False
-        self.data_stack.append(a % b)
+        s[-1] = s[-1] % b
         return True
 
     def _negate(self):
@@ -801,93 +1030,104 @@ class TwForthExecutor:
         return True
 
     def _min(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in MIN")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(min(a, b))
+        b = s.pop()
+        s[-1] = min(s[-1], b)
         return True
 
     def _max(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in MAX")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(max(a, b))
+        b = s.pop()
+        s[-1] = max(s[-1], b)
         return True
 
     # Comparison operations
     def _equal(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in =")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(-1 if a == b else 0)
+        b = s.pop()
+        s[-1] = -1 if s[-1] == b else 0
         return True
 
     def _less(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in <")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(-1 if a < b else 0)
+        b = s.pop()
+        s[-1] = -1 if s[-1] < b else 0
         return True
 
     def _greater(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in >")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(-1 if a > b else 0)
+        b = s.pop()
+        s[-1] = -1 if s[-1] > b else 0
         return True
 
     def _less_equal(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in <=")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(-1 if a <= b else 0)
+        b = s.pop()
+        s[-1] = -1 if s[-1] <= b else 0
         return True
 
     def _greater_equal(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in >=")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(-1 if a >= b else 0)
+        b = s.pop()
+        s[-1] = -1 if s[-1] >= b else 0
         return True
 
     def _not_equal(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in <>")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(-1 if a != b else 0)
+        b = s.pop()
+        s[-1] = -1 if s[-1] != b else 0
         return True
 
     # Logic operations
     def _and(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in AND")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(a & b)
+        b = s.pop()
+        s[-1] = s[-1] & b
         return True
 
     def _or(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in OR")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(a | b)
+        b = s.pop()
+        s[-1] = s[-1] | b
         return True
 
     def _xor(self):
-        if len(self.data_stack) < 2:
+        s = self.data_stack
+        if len(s) < 2:
             self.interpreter.log_output("Stack underflow in XOR")
             return False
-        b, a = self.data_stack.pop(), self.data_stack.pop()
-        self.data_stack.append(a ^ b)
+        b = s.pop()
+        s[-1] = s[-1] ^ b
         return True
 
     def _invert(self):
@@ -933,11 +1173,11 @@ class TwForthExecutor:
     def _dot_quote(self):
         """Print string literal (.")
 
-        Note: ."string" tokens are handled inline by _execute_word.
+        Note: ."string" tokens are compiled to print instructions.
         This fallback handles the edge case of a bare ." token.
         """
         # The tokenizer bundles ."text" into a single token processed in
-        # _execute_word.  A standalone ." is malformed — do nothing.
+        # _compile.  A standalone ." is malformed — do nothing.
         return True
 
     def _spaces(self):
@@ -951,56 +1191,59 @@ class TwForthExecutor:
 
     # Math functions
     def _sin(self):
-        if len(self.data_stack) < 1:
+        s = self.data_stack
+        if len(s) < 1:
             self.interpreter.log_output("Stack underflow in SIN")
             return False
-        angle = math.radians(self.data_stack.pop())
-        self.data_stack.append(math.sin(angle))
+        s[-1] = _sin(_radians(s[-1]))
         return True
 
     def _cos(self):
-        if len(self.data_stack) < 1:
+        s = self.data_stack
+        if len(s) < 1:
             self.interpreter.log_output("Stack underflow in COS")
             return False
-        angle = math.radians(self.data_stack.pop())
-        self.data_stack.append(math.cos(angle))
+        s[-1] = _cos(_radians(s[-1]))
         return True
 
     def _tan(self):
-        if len(self.data_stack) < 1:
+        s = self.data_stack
+        if len(s) < 1:
             self.interpreter.log_output("Stack underflow in TAN")
             return False
-        angle = math.radians(self.data_stack.pop())
-        self.data_stack.append(math.tan(angle))
+        s[-1] = _tan(_radians(s[-1]))
         return True
 
     def _sqrt(self):
-        if len(self.data_stack) < 1:
+        s = self.data_stack
+        if len(s) < 1:
             self.interpreter.log_output("Stack underflow in SQRT")
             return False
-        value = self.data_stack.pop()
-        if value < 0:
+        if s[-1] < 0:
+            s.pop()
             self.interpreter.log_output("Cannot take square root of negative number")
             return False
-        self.data_stack.append(math.sqrt(value))
+        s[-1] = _sqrt(s[-1])
         return True
 
     def _log(self):
-        if len(self.data_stack) < 1:
+        s = self.data_stack
+        if len(s) < 1:
             self.interpreter.log_output("Stack underflow in LOG")
             return False
-        value = self.data_stack.pop()
-        if value <= 0:
+        if s[-1] <= 0:
+            s.pop()
             self.interpreter.log_output("Cannot take log of non-positive number")
             return False
-        self.data_stack.append(math.log(value))
+        s[-1] = _log(s[-1])
         return True
 
     def _exp(self):
-        if len(self.data_stack) < 1:
+        s = self.data_stack
+        if len(s) < 1:
             self.interpreter.log_output("Stack underflow in EXP")
             return False
-        self.data_stack.append(math.exp(self.data_stack.pop()))
+        s[-1] = _exp(s[-1])
         return True
 
     # Stack queries
@@ -1035,148 +1278,30 @@ class TwForthExecutor:
         self.data_stack.append(item)
         return True
 
-    # Control structures
-    def _handle_if(self):
-        """Handle IF"""
-        if len(self.data_stack) < 1:
-            self.interpreter.log_output("Stack underflow in IF")
-            return False
-
-        condition = self.data_stack.pop()
-        if condition == 0:  # False
-            # Skip to ELSE or THEN
-            self.return_stack.append("IF_SKIP")
-        else:
-            self.return_stack.append("IF_EXEC")
-        return True
-
-    def _handle_then(self):
-        """Handle THEN"""
-        if (
-            self.return_stack
-            and isinstance(self.return_stack[-1], str)
-            and self.return_stack[-1].startswith("IF")
-        ):
-            self.return_stack.pop()
-        return True
-
-    def _handle_else(self):
-        """Handle ELSE"""
-        if self.return_stack and self.return_stack[-1] == "IF_EXEC":
-            self.return_stack[-1] = "IF_SKIP"
-        elif self.return_stack and self.return_stack[-1] == "IF_SKIP":
-            self.return_stack[-1] = "IF_EXEC"
-        return True
-
-    def _handle_begin(self):
-        """Handle BEGIN"""
-        self.return_stack.append("BEGIN")
-        return True
-
-    def _handle_do(self):
-        """Handle DO in interactive mode (push loop frame)"""
-        if len(self.data_stack) < 2:
-            self.interpreter.log_output("Stack underflow in DO")
-            return False
-        start = self.data_stack.pop()  # Top of stack is start index
-        limit = self.data_stack.pop()  # Next is limit
-        self.return_stack.append(
-            {"type": "DO", "ip": None, "index": start, "limit": limit}
-        )
-        return True
-
-    def _handle_loop(self):
-        """Handle LOOP in interactive mode"""
-        top = self.return_stack[-1] if self.return_stack else None
-        if not isinstance(top, dict) or top.get("type") != "DO":
-            self.interpreter.log_output("LOOP without matching DO")
-            return False
-        frame = self.return_stack[-1]
-        frame["index"] += 1
-        if frame["index"] >= frame["limit"]:
-            self.return_stack.pop()
-        return True
-
-    def _handle_until(self):
-        """Handle UNTIL in interactive mode.
-
-        Note: BEGIN...UNTIL loops work correctly inside compiled word
-        definitions (: word ... ;).  In interactive mode the interpreter
-        cannot replay the tokens between BEGIN and UNTIL, so the loop
-        body executes only once.
-        """
-        if len(self.data_stack) < 1:
-            self.interpreter.log_output("Stack underflow in UNTIL")
-            return False
-
-        condition = self.data_stack.pop()
-        if condition == 0:  # False → would loop, but interactive mode can't replay
-            self.interpreter.log_output(
-                "⚠️  BEGIN...UNTIL loops only execute once in interactive mode. "
-                "Use a word definition (: name ... ;) for full looping."
-            )
-        # In either case, pop the BEGIN marker
-        if self.return_stack and self.return_stack[-1] == "BEGIN":
-            self.return_stack.pop()
-        return True
-
-    def _handle_while(self):
-        """Handle WHILE"""
-        if len(self.data_stack) < 1:
-            self.interpreter.log_output("Stack underflow in WHILE")
-            return False
-
-        condition = self.data_stack.pop()
-        if condition == 0:  # False
-            # Skip to REPEAT
-            self.return_stack.append("WHILE_SKIP")
-        else:
-            self.return_stack.append("WHILE_EXEC")
-        return True
-
-    def _handle_repeat(self):
-        """Handle REPEAT"""
-        if (
-            self.return_stack
-            and isinstance(self.return_stack[-1], str)
-            and self.return_stack[-1].startswith("WHILE")
-        ):
-            self.return_stack.pop()
-        return True
-
-    def _recurse(self):
-        """Handle RECURSE - call the current word being defined"""
-        if self.compiling and self.current_word:
-            # Append a sentinel token that _create_word_function resolves to
-            # a self-recursive call at execution time, avoiding the
-            # chicken-and-egg problem of the word not yet being in the
-            # dictionary during compilation.
-            self.word_definition.append("__RECURSE__")
-            return True
-        else:
-            self.interpreter.log_output(
-                "RECURSE can only be used inside word definitions"
-            )
-            return False
-
     # Variables and constants
-    def _handle_variable(self):
-        """Handle VARIABLE declaration"""
-        # Mark that the next token is the variable name to create.
-        # Allow variable declaration both in interactive mode and inside definitions.
-        self.expecting_variable_name = True
+    def _define_variable(self, name):
+        """VARIABLE name - create a variable that pushes its address"""
+        # Create variable storage with default 0
+        self.variables[name] = 0
+        # Add execution hook so using variable pushes reference
+        self.dictionary[name] = lambda n=name: self.data_stack.append(
+            {"type": "var", "name": n}
+        )
+        self.dictionary_version += 1
+        self.interpreter.log_output(f"Variable declared: {name}")
         return True
 
-    def _handle_constant(self):
-        """Handle CONSTANT declaration"""
+    def _define_constant(self, name):
+        """CONSTANT/VALUE name - pop a value and bind name to it"""
         if len(self.data_stack) < 1:
             self.interpreter.log_output("Stack underflow in CONSTANT")
             return False
-
-        # Pop the value and wait for the next token to be the name
         value = self.data_stack.pop()
-        self.pending_constant_value = value
-        self.expecting_constant_name = True
+        self.constants[name] = value
+        # Add a word so constant name pushes constant value
+        self.dictionary[name] = lambda v=value: self.data_stack.append(v)
+        self.dictionary_version += 1
+        self.interpreter.log_output(f"Constant declared: {name}")
         return True
 
     def _store(self):
@@ -1251,8 +1376,9 @@ class TwForthExecutor:
         if len(self.float_stack) < 2:
             self.interpreter.log_output("Float stack underflow in F+")
             return False
-        b, a = self.float_stack.pop(), self.float_stack.pop()
-        self.float_stack.append(a + b)
+        fs = self.float_stack
+        b = fs.pop()
+        fs[-1] += b
         return True
 
     def _f_sub(self):
@@ -1260,8 +1386,9 @@ class TwForthExecutor:
         if len(self.float_stack) < 2:
             self.interpreter.log_output("Float stack underflow in F-")
             return False
-        b, a = self.float_stack.pop(), self.float_stack.pop()
-        self.float_stack.append(a - b)
+        fs = self.float_stack
+        b = fs.pop()
+        fs[-1] -= b
         return True
 
     def _f_mul(self):
@@ -1269,8 +1396,9 @@ class TwForthExecutor:
         if len(self.float_stack) < 2:
             self.interpreter.log_output("Float stack underflow in F*")
             return False
-        b, a = self.float_stack.pop(), self.float_stack.pop()
-        self.float_stack.append(a * b)
+        fs = self.float_stack
+        b = fs.pop()
+        fs[-1] *= b
         return True
 
     def _f_div(self):
@@ -1278,11 +1406,13 @@ class TwForthExecutor:
         if len(self.float_stack) < 2:
             self.interpreter.log_output("Float stack underflow in F/")
             return False
-        b, a = self.float_stack.pop(), self.float_stack.pop()
+        fs = self.float_stack
+        b = fs.pop()
         if b == 0:
+            fs.pop()
             self.interpreter.log_output("Floating point division by zero")
             return False
-        self.float_stack.append(a / b)
+        fs[-1] /= b
         return True
 
     def _f_dot(self):
@@ -1720,16 +1850,6 @@ class TwForthExecutor:
         return True
 
     # Value (mutable constants)
-    def _value(self):
-        """Create a mutable constant (VALUE works like CONSTANT but is mutable via TO)"""
-        if not self.data_stack:
-            self.interpreter.log_output("Stack underflow in VALUE")
-            return False
-        # Pop the value and wait for the next token to be the name
-        self.pending_constant_value = self.data_stack.pop()
-        self.expecting_constant_name = True
-        return True
-
     def _to(self):
         """Assign to a VALUE"""
         self.interpreter.log_output("TO (value assignment) simulated")
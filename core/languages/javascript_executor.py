@@ -28,6 +28,15 @@ code with output capture and error handling within the IDE environment.
 
 from .base import SubprocessExecutor
 
+# Wait for a script path on stdin, then run that script as the main module.
+# Node does its start-up work before blocking on the read, so a worker
+# launched ahead of time only has to load the script once it is needed.
+_WORKER_BOOTSTRAP = (
+    "const path = require('fs').readFileSync(0, 'utf8');"
+    "process.argv[1] = path;"
+    "require('module').runMain();"
+)
+
 
 class JavaScriptExecutor(SubprocessExecutor):
     """Handles JavaScript language script execution via Node.js."""
@@ -35,6 +44,7 @@ class JavaScriptExecutor(SubprocessExecutor):
     lang_name = "JavaScript"
     file_suffix = ".js"
     executable_candidates = ["node", "nodejs"]
+    worker_bootstrap = _WORKER_BOOTSTRAP
 
     # ---- convenience aliases (backward-compat) ----
 
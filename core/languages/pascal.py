@@ -30,8 +30,200 @@ for educational purposes, with structured programming constructs and OOP capabil
 # pylint: disable=R0902,W0718,R1705,R0911,R0912,W0613,R1702,W0123,W0107,R0903
 
 import re
+import sys
 import math
 import random
+from array import array
+import keyword
+from collections import ChainMap
+from types import CodeType, MappingProxyType
+
+# Statement patterns, compiled once and shared by every executor
+_RE_WORD = re.compile(r"(\w+)")
+_RE_UNIT = re.compile(r"UNIT\s+(\w+)", re.IGNORECASE)
+_RE_CONSTRUCTOR = re.compile(r"CONSTRUCTOR\s+(\w+)\s*\((.*?)\)", re.IGNORECASE)
+_RE_DESTRUCTOR = re.compile(r"DESTRUCTOR\s+(\w+)", re.IGNORECASE)
+_RE_IF = re.compile(r"IF\s+(.+?)\s+THEN\s+(.+?)(?:\s+ELSE\s+(.+))?$", re.IGNORECASE)
+_RE_WHILE = re.compile(r"WHILE\s+(.+?)\s+DO\s+(.+)", re.IGNORECASE)
+_RE_FOR = re.compile(
+    r"FOR\s+(\w+)\s*:=\s*(.+?)\s+(TO|DOWNTO)\s+(.+?)\s+DO\s+(.+)", re.IGNORECASE
+)
+_RE_REPEAT = re.compile(r"REPEAT\s+(.+?)\s+UNTIL\s+(.+)", re.IGNORECASE)
+_RE_PROCEDURE = re.compile(r"PROCEDURE\s+(\w+)\s*\((.*?)\)", re.IGNORECASE)
+_RE_FUNCTION = re.compile(r"FUNCTION\s+(\w+)\s*\((.*?)\)\s*:\s*(\w+)", re.IGNORECASE)
+_RE_CALL = re.compile(r"(\w+)\s*\((.*?)\)")
+# Expression tokens: group 1 is a name that is not an attribute, group 2 an
+# operator containing =; strings and numbers are matched so their contents
+# are left alone
+_RE_EXPR_TOKEN = re.compile(
+    r"""'[^']*'|"[^"]*"|\d[\w.]*|(?<![\w.])([A-Za-z_]\w*)|(<>|:=|[<>!=]?=)"""
+)
+# Pascal operators and their Python spelling; a lone = is the equality test
+_OPERATORS = {
+    "AND": "and",
+    "OR": "or",
+    "NOT": "not",
+    "DIV": "//",
+    "MOD": "%",
+    "<>": "!=",
+    ":=": "==",
+    "=": "==",
+}
+
+# Safety cap on WHILE/FOR/REPEAT iterations so runaway loops terminate
+_MAX_LOOP_ITERATIONS = 10000
+
+_EXPR_CACHE_MAX = 1024  # compiled expressions kept per executor
+_LINE_CACHE_MAX = 1024  # parsed source lines kept per executor
+
+
+def _to_boolean(value):
+    """Convert a value to a Pascal BOOLEAN"""
+    if isinstance(value, str):
+        return value.upper() in ["TRUE", "1", "YES"]
+    return bool(value)
+
+
+def _to_char(value):
+    """Convert a value to a Pascal CHAR"""
+    return str(value)[0] if value else " "
+
+
+# Pascal type -> conversion applied to values assigned or read into it
+_CONVERTERS = {
+    "INTEGER": lambda value: int(float(value)),
+    "REAL": float,
+    "STRING": str,
+    "BOOLEAN": _to_boolean,
+    "CHAR": _to_char,
+}
+
+# Element types stored unboxed in a typed array rather than a list
+_ARRAY_TYPECODES = {"INTEGER": "q", "REAL": "d"}
+
+# Turbo Pascal functions (both uppercase and lowercase for compatibility)
+_PASCAL_FUNCTIONS = MappingProxyType({
+    # Basic functions
+    "abs": abs,
+    "ABS": abs,
+    "round": round,
+    "ROUND": round,
+    "trunc": int,
+    "TRUNC": int,
+    "int": int,
+    "INT": int,
+    "float": float,
+    "FLOAT": float,
+    "max": max,
+    "MAX": max,
+    "min": min,
+    "MIN": min,
+    "len": len,
+    "LEN": len,
+    "str": str,
+    "STR": str,
+    "ord": ord,
+    "ORD": ord,
+    "chr": chr,
+    "CHR": chr,
+    # Math functions
+    "sin": math.sin,
+    "SIN": math.sin,
+    "cos": math.cos,
+    "COS": math.cos,
+    "tan": math.tan,
+    "TAN": math.tan,
+    "arcsin": math.asin,
+    "ARCSIN": math.asin,
+    "arccos": math.acos,
+    "ARCCOS": math.acos,
+    "arctan": math.atan,
+    "ARCTAN": math.atan,
+    "exp": math.exp,
+    "EXP": math.exp,
+    "ln": math.log,
+    "LN": math.log,
+    "log": math.log10,
+    "LOG": math.log10,
+    "sqrt": math.sqrt,
+    "SQRT": math.sqrt,
+    "sqr": lambda x: x * x,
+    "SQR": lambda x: x * x,
+    "power": math.pow,
+    "POWER": math.pow,
+    # String functions
+    "length": len,
+    "LENGTH": len,
+    "copy": lambda s, start, count: (
+        s[start - 1 : start - 1 + count] if s else ""
+    ),
+    "COPY": lambda s, start, count: (
+        s[start - 1 : start - 1 + count] if s else ""
+    ),
+    "pos": lambda substr, s: (s.find(substr) + 1 if substr in s else 0),
+    "POS": lambda substr, s: (s.find(substr) + 1 if substr in s else 0),
+    "concat": lambda *args: "".join(str(arg) for arg in args),
+    "CONCAT": lambda *args: "".join(str(arg) for arg in args),
+    "upcase": lambda s: str(s).upper(),
+    "UPCASE": lambda s: str(s).upper(),
+    "downcase": lambda s: str(s).lower(),
+    "DOWNCASE": lambda s: str(s).lower(),
+    "delete": lambda s, start, count: (
+        s[: start - 1] + s[start - 1 + count :] if s else ""
+    ),
+    "DELETE": lambda s, start, count: (
+        s[: start - 1] + s[start - 1 + count :] if s else ""
+    ),
+    # Random functions
+    "random": random.random,
+    "RANDOM": random.random,
+    "randomize": random.seed,
+    "RANDOMIZE": random.seed,
+    # Type conversion functions
+    "val": lambda s: (
+        int(float(s))
+        if s.replace(".", "").replace("-", "").isdigit()
+        else 0
+    ),
+    "VAL": lambda s: (
+        int(float(s))
+        if s.replace(".", "").replace("-", "").isdigit()
+        else 0
+    ),
+    "str_val": str,
+    "STR_VAL": str,
+})
+
+# Names whose result changes from call to call; expressions using them are
+# never folded to a constant
+_IMPURE_NAMES = frozenset(("_V", "random", "RANDOM", "randomize", "RANDOMIZE"))
+# Result types that are safe to share between evaluations
+_FOLDABLE_TYPES = (int, float, str)
+
+# eval() needs a real dict for globals, so this one is built once and never
+# handed out for modification
+_EVAL_GLOBALS = {"__builtins__": {}, **_PASCAL_FUNCTIONS}
+
+
+def _translate_expression(expr):
+    """Rewrite a Pascal expression as Python source"""
+    return _RE_EXPR_TOKEN.sub(_translate_token, expr)
+
+
+def _translate_token(match):
+    """Translate an operator, or a variable or constant name to a scope lookup"""
+    name, operator = match.groups()
+    if operator is not None:
+        return _OPERATORS.get(operator, operator)
+    if name is None:
+        return match.group(0)
+    upper = name.upper()
+    if upper in _OPERATORS:
+        return _OPERATORS[upper]
+    if keyword.iskeyword(name) or name in _PASCAL_FUNCTIONS:
+        return name
+    # Pascal is case-insensitive; names are stored upper-cased
+    return f"_V[{upper!r}]"
 
 
 class TwPascalExecutor:
@@ -43,18 +235,38 @@ class TwPascalExecutor:
         self.program_name = ""
         self.current_unit = None
         self.units = {}  # Unit definitions
-        self.variables = {}  # Local variable scope
+        # Variable scope, shared with the interpreter so that its variable
+        # views see Pascal assignments without a second write
+        self.variables = interpreter.variables
         self.constants = {}  # Constants
         self.procedures = {}  # User-defined procedures
         self.functions = {}  # User-defined functions
         self.objects = {}  # Object definitions
         self.data_types = {}  # Variable type information
-        self.arrays = {}  # Array definitions
+        self.arrays = {}  # Array name -> (flat elements, dimensions, strides)
         self.records = {}  # Record definitions
         self.current_procedure = None
         self.call_stack = []  # For procedure/function calls
         self.compiler_directives = {}  # Compiler directives like {$DEFINE}
         self.inline_asm_enabled = False  # For ASM blocks
+        # Expression source -> compiled code, or the value itself for
+        # expressions that read no variables and call nothing impure
+        self._expr_cache = {}
+        # eval() locals: the _V scope of compiled expressions, where constants
+        # take precedence over variables; the dicts are never rebound
+        self._eval_locals = {"_V": ChainMap(self.constants, self.variables)}
+        # Keyword -> bound handler, resolved once instead of per statement
+        self._handlers = {
+            cmd: getattr(self, name) for cmd, name in self._CMD_HANDLERS.items()
+        }
+        for cmd in self._NO_OP_CMDS:
+            self._handlers[cmd] = self._handle_no_op
+        # Keyword -> (parser, handler) for statements parsed once per line
+        self._parsed_handlers = {
+            cmd: (getattr(self, parse), getattr(self, handle))
+            for cmd, (parse, handle) in self._PARSED_HANDLERS.items()
+        }
+        self._line_cache = {}  # source line -> (handler, argument)
 
     # Dispatch table: keyword → handler method name
     _CMD_HANDLERS = {
@@ -71,17 +283,22 @@ class TwPascalExecutor:
         "OBJECT": "_handle_object",
         "CONSTRUCTOR": "_handle_constructor",
         "DESTRUCTOR": "_handle_destructor",
-        "IF": "_handle_if",
-        "WHILE": "_handle_while",
-        "FOR": "_handle_for",
-        "REPEAT": "_handle_repeat",
-        "CASE": "_handle_case",
         "PROCEDURE": "_handle_procedure",
         "FUNCTION": "_handle_function",
         "ASM": "_handle_asm",
         "READLN": "_handle_readln",
-        "WRITELN": "_handle_writeln",
-        "WRITE": "_handle_write",
+    }
+
+    # Statements whose handler takes the parser's result rather than the line,
+    # so loop bodies and repeated lines are matched against their regex once
+    _PARSED_HANDLERS = {
+        "IF": ("_parse_if", "_handle_if"),
+        "CASE": ("_parse_case", "_handle_case"),
+        "WHILE": ("_parse_while", "_handle_while"),
+        "FOR": ("_parse_for", "_handle_for"),
+        "REPEAT": ("_parse_repeat", "_handle_repeat"),
+        "WRITELN": ("_parse_output", "_handle_writeln"),
+        "WRITE": ("_parse_output", "_handle_write"),
     }
 
     # Keywords that are handled by their parent statement; return "continue" immediately
@@ -91,64 +308,94 @@ class TwPascalExecutor:
 
     def execute_command(self, command):
         """Execute a Pascal command and return the result"""
+        if not command:
+            return "continue"
         try:
-            command = command.strip()
-            if not command:
-                return "continue"
-
-            # Remove trailing semicolon if present
-            if command.endswith(";"):
-                command = command[:-1].strip()
-
-            # Get the base command name (first word before any parenthesis/space)
-            match = re.match(r"(\w+)", command)
-            if not match:
-                return "continue"
-
-            cmd = match.group(1).upper()
-
-            # No-op keywords (context handled by parent statement)
-            if cmd in self._NO_OP_CMDS:
-                return "continue"
-
-            # Dispatch to dedicated handler via lookup table
-            handler_name = self._CMD_HANDLERS.get(cmd)
-            if handler_name:
-                return getattr(self, handler_name)(command)
-
-            # Assignment
-            if ":=" in command:
-                return self._handle_assignment(command)
-
-            # Compiler directives
-            if command.strip().startswith("{$"):
-                return self._handle_directive(command)
-
-            # Procedure/function calls (fallthrough)
-            if "(" in command and ")" in command:
-                return self._handle_call(command)
-            if command.upper() in self.procedures:
-                return self._handle_call(command)
-
+            entry = self._line_cache.get(command)
+            if entry is None:
+                entry = self._compile_line(command)
+                if len(self._line_cache) >= _LINE_CACHE_MAX:
+                    self._line_cache.clear()
+                self._line_cache[command] = entry
+            handler, argument = entry
+            return handler(argument)
         except Exception as e:
             self.interpreter.debug_output(f"Pascal command error: {e}")
             return "continue"
 
+    def _compile_line(self, command):
+        """
+        Work out how to run a source line.
+
+        Returns:
+            tuple: (handler, argument) where argument is the cleaned-up line,
+            or what the statement's parser made of it
+        """
+        command = command.strip()
+        if not command:
+            return self._handle_no_op, command
+        # Comment lines; {$...} is a compiler directive, not a comment
+        if command.startswith(("//", "(*")) or (
+            command[0] == "{" and not command.startswith("{$")
+        ):
+            return self._handle_no_op, command
+
+        # Remove trailing semicolon if present
+        if command.endswith(";"):
+            command = command[:-1].strip()
+
+        # Get the base command name (first word before any parenthesis/space)
+        space = command.find(" ")
+        head = command if space < 0 else command[:space]
+        if head.isalnum():
+            # Keyword lines (BEGIN, FOR ..., VAR ...) need no regex
+            cmd = head.upper()
+        else:
+            match = _RE_WORD.match(command)
+            if not match:
+                return self._handle_no_op, command
+            cmd = match.group(1).upper()
+
+        # Dispatch to dedicated handler via lookup table
+        handler = self._handlers.get(cmd)
+        if handler is not None:
+            return handler, command
+        parsed = self._parsed_handlers.get(cmd)
+        if parsed is not None:
+            parse, handler = parsed
+            return handler, parse(command)
+
+        # Assignment
+        if ":=" in command:
+            return self._handle_assignment, self._parse_assignment(command)
+
+        # Compiler directives
+        if command.startswith("{$"):
+            return self._handle_directive, command
+
+        # Procedure/function calls (fallthrough)
+        if "(" in command and ")" in command:
+            return self._handle_call, self._parse_call(command)
+        return self._handle_no_op, command
+
+    def _handle_no_op(self, command):
+        """Handle keywords whose context is handled by the parent statement"""
         return "continue"
 
     def _handle_program(self, command):
         """Handle PROGRAM declaration"""
         # PROGRAM program_name;
-        match = re.match(r"PROGRAM\s+(\w+)", command, re.IGNORECASE)
-        if match:
-            self.program_name = match.group(1)
+        parts = command.split(None, 1)
+        name = parts[1].split("(", 1)[0].strip() if len(parts) > 1 else ""
+        if name:
+            self.program_name = name
             self.interpreter.log_output(f"🚀 Starting program: {self.program_name}")
         return "continue"
 
     def _handle_unit(self, command):
         """Handle UNIT declaration"""
         # UNIT unit_name;
-        match = re.match(r"UNIT\s+(\w+)", command, re.IGNORECASE)
+        match = _RE_UNIT.match(command)
         if match:
             unit_name = match.group(1).upper()
             self.current_unit = unit_name
@@ -250,7 +497,7 @@ class TwPascalExecutor:
         """Handle CONSTRUCTOR declaration"""
         # CONSTRUCTOR name(parameters);
         try:
-            match = re.match(r"CONSTRUCTOR\s+(\w+)\s*\((.*?)\)", command, re.IGNORECASE)
+            match = _RE_CONSTRUCTOR.match(command)
             if match:
                 name = match.group(1).upper()
                 self.interpreter.log_output(f"🔨 Constructor {name} declared")
@@ -262,7 +509,7 @@ class TwPascalExecutor:
         """Handle DESTRUCTOR declaration"""
         # DESTRUCTOR name;
         try:
-            match = re.match(r"DESTRUCTOR\s+(\w+)", command, re.IGNORECASE)
+            match = _RE_DESTRUCTOR.match(command)
             if match:
                 name = match.group(1).upper()
                 self.interpreter.log_output(f"💥 Destructor {name} declared")
@@ -326,7 +573,7 @@ class TwPascalExecutor:
         """Handle END block"""
         # END. - program end
         # END; - block end
-        if command.strip().upper() == "END.":
+        if command.upper() == "END.":
             self.interpreter.log_output("🏁 Program completed")
             return "end"
         else:
@@ -341,23 +588,23 @@ class TwPascalExecutor:
             var_part = command[3:].strip()
             if ":" in var_part:
                 var_list, type_part = var_part.split(":", 1)
-                var_type = type_part.strip().upper()
+                var_type = sys.intern(type_part.strip().upper())
 
                 # Parse variable list (can be comma-separated)
                 variables = [v.strip() for v in var_list.split(",")]
 
                 for var in variables:
-                    var_name = var.upper()
+                    var_name = sys.intern(var.upper())
                     self.variables[var_name] = self._get_default_value(var_type)
                     self.data_types[var_name] = var_type
 
                     # Handle array declarations
-                    if "[" in var and "]" in var:
-                        array_match = re.match(r"(\w+)\s*\[(.+)\]", var)
-                        if array_match:
-                            array_name = array_match.group(1).upper()
-                            dimensions = array_match.group(2)
-                            self._declare_array(array_name, dimensions, var_type)
+                    lb = var.find("[")
+                    rb = var.rfind("]")
+                    if 0 < lb < rb:
+                        array_name = sys.intern(var[:lb].strip().upper())
+                        dimensions = var[lb + 1 : rb]
+                        self._declare_array(array_name, dimensions, var_type)
 
                 self.interpreter.log_output(
                     f"📝 Declared variables: {', '.join(variables)} as {var_type}"
@@ -427,7 +674,7 @@ class TwPascalExecutor:
             const_part = command[5:].strip()
             if "=" in const_part:
                 name, value_expr = const_part.split("=", 1)
-                name = name.strip().upper()
+                name = sys.intern(name.strip().upper())
                 value = self._evaluate_expression(value_expr.strip())
                 self.constants[name] = value
                 self.interpreter.log_output(f"🔒 Constant {name} = {value}")
@@ -435,13 +682,17 @@ class TwPascalExecutor:
             self.interpreter.debug_output(f"CONST declaration error: {e}")
         return "continue"
 
-    def _handle_assignment(self, command):
+    def _parse_assignment(self, command):
+        """Split var := expr into (VAR, expr)"""
+        var_part, expr_part = command.split(":=", 1)
+        return sys.intern(var_part.strip().upper()), expr_part.strip()
+
+    def _handle_assignment(self, assignment):
         """Handle := assignment"""
         try:
-            if ":=" in command:
-                var_part, expr_part = command.split(":=", 1)
-                var_name = var_part.strip().upper()
-                value = self._evaluate_expression(expr_part.strip())
+            if assignment:
+                var_name, expr = assignment
+                value = self._evaluate_expression(expr)
 
                 # Handle array assignment
                 if "[" in var_name and "]" in var_name:
@@ -453,162 +704,186 @@ class TwPascalExecutor:
                         value = self._convert_to_type(value, expected_type)
 
                     self.variables[var_name] = value
-                    # Also store in interpreter variables for compatibility
-                    self.interpreter.variables[var_name] = value
 
                 self.interpreter.log_output(f"✅ {var_name} := {value}")
         except Exception as e:
             self.interpreter.debug_output(f"Assignment error: {e}")
         return "continue"
 
-    def _handle_if(self, command):
+    def _parse_if(self, command):
+        """
+        Split IF into (condition, then_body, else_body), None if malformed.
+
+        The branches are compiled as (handler, argument) pairs, else_body is
+        None when there is no ELSE.
+        """
+        # IF condition THEN statement [ELSE statement]
+        match = _RE_IF.match(command)
+        if not match:
+            return None
+        condition = match.group(1).strip()
+        then_body = self._compile_line(match.group(2))
+        else_body = self._compile_line(match.group(3)) if match.group(3) else None
+        return condition, then_body, else_body
+
+    def _handle_if(self, statement):
         """Handle IF statement"""
         try:
-            # IF condition THEN statement [ELSE statement]
-            match = re.match(
-                r"IF\s+(.+?)\s+THEN\s+(.+?)(?:\s+ELSE\s+(.+))?$",
-                command,
-                re.IGNORECASE,
-            )
-            if match:
-                condition = match.group(1).strip()
-                then_stmt = match.group(2).strip()
-                else_stmt = match.group(3).strip() if match.group(3) else None
-
+            if statement:
+                condition, then_body, else_body = statement
                 cond_result = self._evaluate_expression(condition)
                 if cond_result:
                     # Execute THEN statement
-                    return self.execute_command(then_stmt)
-                elif else_stmt:
+                    handler, argument = then_body
+                    return handler(argument)
+                elif else_body:
                     # Execute ELSE statement
-                    return self.execute_command(else_stmt)
+                    handler, argument = else_body
+                    return handler(argument)
         except Exception as e:
             self.interpreter.debug_output(f"IF statement error: {e}")
         return "continue"
 
-    def _handle_while(self, command):
+    def _parse_while(self, command):
+        """Split WHILE into (condition, compiled body), None if malformed"""
+        # WHILE condition DO statement
+        match = _RE_WHILE.match(command)
+        if not match:
+            return None
+        return match.group(1).strip(), self._compile_line(match.group(2))
+
+    def _handle_while(self, loop):
         """Handle WHILE loop"""
         try:
-            # WHILE condition DO statement
-            match = re.match(r"WHILE\s+(.+?)\s+DO\s+(.+)", command, re.IGNORECASE)
-            if match:
-                condition = match.group(1).strip()
-                statement = match.group(2).strip()
-
-                max_iterations = 10000
-                iterations = 0
-                while iterations < max_iterations:
-                    cond_result = self._evaluate_expression(condition)
-                    if not cond_result:
+            if loop:
+                condition, (handler, argument) = loop
+                evaluate = self._evaluate_expression
+                for _ in range(_MAX_LOOP_ITERATIONS):
+                    if not evaluate(condition):
                         break
-                    result = self.execute_command(statement)
+                    result = handler(argument)
                     if result != "continue":
                         return result
-                    iterations += 1
-                if iterations >= max_iterations:
-                    self.interpreter.log_output("WHILE loop terminated: maximum iterations reached")
+                else:
+                    self.interpreter.log_output(
+                        "WHILE loop terminated: maximum iterations reached"
+                    )
         except Exception as e:
             self.interpreter.debug_output(f"WHILE loop error: {e}")
         return "continue"
 
-    def _handle_for(self, command):
+    def _parse_for(self, command):
+        """
+        Split a FOR loop into its parts.
+
+        Returns:
+            tuple: (VAR, start_expr, step, end_expr, body), where body is the
+            compiled (handler, argument) pair, or None if the line is
+            malformed
+        """
+        # FOR variable := start TO/DOWNTO end DO statement
+        match = _RE_FOR.match(command)
+        if not match:
+            return None
+        step = 1 if match.group(3).upper() == "TO" else -1
+        return (
+            sys.intern(match.group(1).upper()),
+            match.group(2).strip(),
+            step,
+            match.group(4).strip(),
+            self._compile_line(match.group(5)),
+        )
+
+    def _handle_for(self, loop):
         """Handle FOR loop"""
         try:
-            # FOR variable := start TO/DOWNTO end DO statement
-            match = re.match(
-                r"FOR\s+(\w+)\s*:=\s*(.+?)\s+(TO|DOWNTO)\s+(.+?)\s+DO\s+(.+)",
-                command,
-                re.IGNORECASE,
-            )
-            if match:
-                var_name = match.group(1).upper()
-                start_expr = match.group(2).strip()
-                direction = match.group(3).upper()
-                end_expr = match.group(4).strip()
-                statement = match.group(5).strip()
-
+            if loop:
+                var_name, start_expr, step, end_expr, (handler, argument) = loop
                 start_val = int(self._evaluate_expression(start_expr))
                 end_val = int(self._evaluate_expression(end_expr))
+                values = range(start_val, end_val + step, step)
 
-                # Initialize loop variable
-                current_val = start_val
-                self.variables[var_name] = current_val
-                self.interpreter.variables[var_name] = current_val
-
-                max_iterations = 10000
-                iterations = 0
-                while iterations < max_iterations:
-                    # Check loop condition
-                    if direction == "TO" and current_val > end_val:
-                        break
-                    elif direction == "DOWNTO" and current_val < end_val:
-                        break
-
-                    # Execute statement
-                    result = self.execute_command(statement)
+                variables = self.variables
+                for current_val in values[:_MAX_LOOP_ITERATIONS]:
+                    variables[var_name] = current_val
+                    result = handler(argument)
                     if result != "continue":
                         return result
 
-                    # Increment/decrement
-                    if direction == "TO":
-                        current_val += 1
-                    else:
-                        current_val -= 1
-                    self.variables[var_name] = current_val
-                    self.interpreter.variables[var_name] = current_val
-                    iterations += 1
-
-                if iterations >= max_iterations:
-                    self.interpreter.log_output("FOR loop terminated: maximum iterations reached")
+                # Like Pascal, leave the variable one step past the last value
+                final_val = start_val + step * min(len(values), _MAX_LOOP_ITERATIONS)
+                variables[var_name] = final_val
+                if len(values) > _MAX_LOOP_ITERATIONS:
+                    self.interpreter.log_output(
+                        "FOR loop terminated: maximum iterations reached"
+                    )
         except Exception as e:
             self.interpreter.debug_output(f"FOR loop error: {e}")
         return "continue"
 
-    def _handle_repeat(self, command):
+    def _parse_repeat(self, command):
+        """Split REPEAT into (compiled body, condition), None if malformed"""
+        # REPEAT statement UNTIL condition
+        match = _RE_REPEAT.match(command)
+        if not match:
+            return None
+        return self._compile_line(match.group(1)), match.group(2).strip()
+
+    def _handle_repeat(self, loop):
         """Handle REPEAT loop"""
         try:
-            # REPEAT statement UNTIL condition
-            match = re.match(r"REPEAT\s+(.+?)\s+UNTIL\s+(.+)", command, re.IGNORECASE)
-            if match:
-                statement = match.group(1).strip()
-                condition = match.group(2).strip()
-
-                max_iterations = 10000
-                iterations = 0
-                while iterations < max_iterations:
-                    # Execute statement
-                    result = self.execute_command(statement)
+            if loop:
+                (handler, argument), condition = loop
+                evaluate = self._evaluate_expression
+                for _ in range(_MAX_LOOP_ITERATIONS):
+                    result = handler(argument)
                     if result != "continue":
                         return result
                     # Check condition - exit when true
-                    cond_result = self._evaluate_expression(condition)
-                    if cond_result:
+                    if evaluate(condition):
                         break
-                    iterations += 1
-                if iterations >= max_iterations:
-                    self.interpreter.log_output("REPEAT loop terminated: maximum iterations reached")
+                else:
+                    self.interpreter.log_output(
+                        "REPEAT loop terminated: maximum iterations reached"
+                    )
         except Exception as e:
             self.interpreter.debug_output(f"REPEAT loop error: {e}")
         return "continue"
 
-    def _handle_case(self, command):
+    def _parse_case(self, command):
+        """
+        Split CASE into (selector, branches), None if there is no OF.
+
+        branches lists (LABEL, compiled body) pairs in source order, with
+        labels upper-cased for comparison against the selector's text.
+        """
+        # CASE selector OF value: statement; ... END
+        # This is a simplified implementation
+        case_part = command[4:].strip()  # Remove CASE
+        if "OF" not in case_part:
+            return None
+        selector_part, cases_part = case_part.split("OF", 1)
+
+        # Parse cases (simplified)
+        branches = []
+        for case in cases_part.split(";"):
+            case = case.strip()
+            if ":" in case:
+                value_part, stmt_part = case.split(":", 1)
+                branches.append(
+                    (value_part.strip().upper(), self._compile_line(stmt_part))
+                )
+        return selector_part.strip(), branches
+
+    def _handle_case(self, statement):
         """Handle CASE statement"""
         try:
-            # CASE selector OF value: statement; ... END
-            # This is a simplified implementation
-            case_part = command[4:].strip()  # Remove CASE
-            if "OF" in case_part:
-                selector_part, cases_part = case_part.split("OF", 1)
-                selector = self._evaluate_expression(selector_part.strip())
-
-                # Parse cases (simplified)
-                cases = cases_part.split(";")
-                for case in cases:
-                    case = case.strip()
-                    if ":" in case:
-                        value_part, stmt_part = case.split(":", 1)
-                        if value_part.strip().upper() == str(selector).upper():
-                            return self.execute_command(stmt_part.strip())
+            if statement:
+                selector_expr, branches = statement
+                selector = str(self._evaluate_expression(selector_expr)).upper()
+                for label, (handler, argument) in branches:
+                    if label == selector:
+                        return handler(argument)
         except Exception as e:
             self.interpreter.debug_output(f"CASE statement error: {e}")
         return "continue"
@@ -617,9 +892,9 @@ class TwPascalExecutor:
         """Handle PROCEDURE declaration"""
         try:
             # PROCEDURE name(parameters); [VAR declarations;] BEGIN statements END;
-            match = re.match(r"PROCEDURE\s+(\w+)\s*\((.*?)\)", command, re.IGNORECASE)
+            match = _RE_PROCEDURE.match(command)
             if match:
-                proc_name = match.group(1).upper()
+                proc_name = sys.intern(match.group(1).upper())
                 params = match.group(2).strip() if match.group(2) else ""
 
                 # Store procedure definition (simplified)
@@ -636,15 +911,11 @@ class TwPascalExecutor:
         """Handle FUNCTION declaration"""
         try:
             # FUNCTION name(parameters): return_type; [VAR declarations;] BEGIN statements END;
-            match = re.match(
-                r"FUNCTION\s+(\w+)\s*\((.*?)\)\s*:\s*(\w+)",
-                command,
-                re.IGNORECASE,
-            )
+            match = _RE_FUNCTION.match(command)
             if match:
-                func_name = match.group(1).upper()
+                func_name = sys.intern(match.group(1).upper())
                 params = match.group(2).strip() if match.group(2) else ""
-                return_type = match.group(3).upper()
+                return_type = sys.intern(match.group(3).upper())
 
                 # Store function definition (simplified)
                 self.functions[func_name] = {
@@ -657,23 +928,22 @@ class TwPascalExecutor:
             self.interpreter.debug_output(f"FUNCTION declaration error: {e}")
         return "continue"
 
-    def _handle_call(self, command):
-        """Handle procedure/function call"""
-        try:
-            # name(parameters)
-            match = re.match(r"(\w+)\s*\((.*?)\)", command)
-            if match:
-                name = match.group(1).upper()
+    def _parse_call(self, command):
+        """Extract the upper-cased callee name, None if malformed"""
+        # name(parameters)
+        match = _RE_CALL.match(command)
+        if not match:
+            return None
+        return sys.intern(match.group(1).upper())
 
-                if name in self.procedures:
-                    self.interpreter.log_output(f"📞 Calling procedure {name}")
-                    # Execute procedure (simplified)
-                elif name in self.functions:
-                    self.interpreter.log_output(f"🔧 Calling function {name}")
-                    # Execute function and return result (simplified)
-                    return "continue"
-        except Exception as e:
-            self.interpreter.debug_output(f"Call error: {e}")
+    def _handle_call(self, name):
+        """Handle procedure/function call"""
+        if name in self.procedures:
+            self.interpreter.log_output(f"📞 Calling procedure {name}")
+            # Execute procedure (simplified)
+        elif name in self.functions:
+            self.interpreter.log_output(f"🔧 Calling function {name}")
+            # Execute function and return result (simplified)
         return "continue"
 
     def _handle_readln(self, command):
@@ -705,51 +975,39 @@ class TwPascalExecutor:
                             )  # Keep as string
 
                     self.variables[var] = value
-                    self.interpreter.variables[var] = value
         except Exception as e:
             self.interpreter.debug_output(f"READLN error: {e}")
         return "continue"
 
-    def _handle_writeln(self, command):
+    def _parse_output(self, command):
+        """Split WRITE/WRITELN arguments into expressions, None if no (...)"""
+        # WRITELN(expression) or WRITELN(expr1, expr2, ...)
+        output_part = command[_RE_WORD.match(command).end() :].strip()
+        if not (output_part.startswith("(") and output_part.endswith(")")):
+            return None
+        return [e.strip() for e in output_part[1:-1].strip().split(",")]
+
+    def _format_output(self, expressions):
+        """Evaluate WRITE/WRITELN arguments and concatenate their text"""
+        evaluate = self._evaluate_expression
+        return "".join([str(evaluate(expr)) for expr in expressions])
+
+    def _handle_writeln(self, expressions):
         """Handle WRITELN output"""
         try:
-            # WRITELN(expression) or WRITELN(expr1, expr2, ...)
-            writeln_part = command[7:].strip()  # Remove WRITELN
-            if writeln_part.startswith("(") and writeln_part.endswith(")"):
-                expr_list = writeln_part[1:-1].strip()
-                expressions = [e.strip() for e in expr_list.split(",")]
-
-                output_parts = []
-                for expr in expressions:
-                    value = self._evaluate_expression(expr)
-                    output_parts.append(str(value))
-
-                output = "".join(output_parts)
-                self.interpreter.log_output(output)
-            else:
-                # WRITELN without parentheses
-                self.interpreter.log_output("")
+            # WRITELN without parentheses prints an empty line
+            output = "" if expressions is None else self._format_output(expressions)
+            self.interpreter.log_output(output)
         except Exception as e:
             self.interpreter.debug_output(f"WRITELN error: {e}")
         return "continue"
 
-    def _handle_write(self, command):
+    def _handle_write(self, expressions):
         """Handle WRITE output (no newline)"""
         try:
-            # WRITE(expression) or WRITE(expr1, expr2, ...)
-            write_part = command[5:].strip()  # Remove WRITE
-            if write_part.startswith("(") and write_part.endswith(")"):
-                expr_list = write_part[1:-1].strip()
-                expressions = [e.strip() for e in expr_list.split(",")]
-
-                output_parts = []
-                for expr in expressions:
-                    value = self._evaluate_expression(expr)
-                    output_parts.append(str(value))
-
-                output = "".join(output_parts)
-                # Use debug output to avoid newline, or find another way
-                self.interpreter.log_output(output)
+            if expressions is not None:
+                # log_output always ends the line, so WRITE matches WRITELN
+                self.interpreter.log_output(self._format_output(expressions))
         except Exception as e:
             self.interpreter.debug_output(f"WRITE error: {e}")
         return "continue"
@@ -757,135 +1015,38 @@ class TwPascalExecutor:
     def _evaluate_expression(self, expr):
         """Evaluate Pascal expression"""
         try:
-            # Replace Pascal operators with Python equivalents
-            # Order matters: replace compound operators BEFORE single-char ones
-            expr = expr.replace("<>", "!=")
-            expr = expr.replace(":=", "=")  # Strip assignment operator if present
-            # Replace single = with == only where it's not part of <=, >=, !=
-            import re as _re
-            expr = _re.sub(r'(?<![<>!])=(?!=)', '==', expr)
-            expr = expr.replace("AND", "and")
-            expr = expr.replace("OR", "or")
-            expr = expr.replace("NOT", "not")
-            expr = expr.replace("DIV", "//")
-            expr = expr.replace("MOD", "%")
-
-            # Turbo Pascal functions (both uppercase and lowercase for compatibility)
-            allowed_names = {
-                # Basic functions
-                "abs": abs,
-                "ABS": abs,
-                "round": round,
-                "ROUND": round,
-                "trunc": int,
-                "TRUNC": int,
-                "int": int,
-                "INT": int,
-                "float": float,
-                "FLOAT": float,
-                "max": max,
-                "MAX": max,
-                "min": min,
-                "MIN": min,
-                "len": len,
-                "LEN": len,
-                "str": str,
-                "STR": str,
-                "ord": ord,
-                "ORD": ord,
-                "chr": chr,
-                "CHR": chr,
-                # Math functions
-                "sin": math.sin,
-                "SIN": math.sin,
-                "cos": math.cos,
-                "COS": math.cos,
-                "tan": math.tan,
-                "TAN": math.tan,
-                "arcsin": math.asin,
-                "ARCSIN": math.asin,
-                "arccos": math.acos,
-                "ARCCOS": math.acos,
-                "arctan": math.atan,
-                "ARCTAN": math.atan,
-                "exp": math.exp,
-                "EXP": math.exp,
-                "ln": math.log,
-                "LN": math.log,
-                "log": math.log10,
-                "LOG": math.log10,
-                "sqrt": math.sqrt,
-                "SQRT": math.sqrt,
-                "sqr": lambda x: x * x,
-                "SQR": lambda x: x * x,
-                "power": math.pow,
-                "POWER": math.pow,
-                # String functions
-                "length": len,
-                "LENGTH": len,
-                "copy": lambda s, start, count: (
-                    s[start - 1 : start - 1 + count] if s else ""
-                ),
-                "COPY": lambda s, start, count: (
-                    s[start - 1 : start - 1 + count] if s else ""
-                ),
-                "pos": lambda substr, s: (s.find(substr) + 1 if substr in s else 0),
-                "POS": lambda substr, s: (s.find(substr) + 1 if substr in s else 0),
-                "concat": lambda *args: "".join(str(arg) for arg in args),
-                "CONCAT": lambda *args: "".join(str(arg) for arg in args),
-                "upcase": lambda s: str(s).upper(),
-                "UPCASE": lambda s: str(s).upper(),
-                "downcase": lambda s: str(s).lower(),
-                "DOWNCASE": lambda s: str(s).lower(),
-                "delete": lambda s, start, count: (
-                    s[: start - 1] + s[start - 1 + count :] if s else ""
-                ),
-                "DELETE": lambda s, start, count: (
-                    s[: start - 1] + s[start - 1 + count :] if s else ""
-                ),
-                # Random functions
-                "random": random.random,
-                "RANDOM": random.random,
-                "randomize": random.seed,
-                "RANDOMIZE": random.seed,
-                # Type conversion functions
-                "val": lambda s: (
-                    int(float(s))
-                    if s.replace(".", "").replace("-", "").isdigit()
-                    else 0
-                ),
-                "VAL": lambda s: (
-                    int(float(s))
-                    if s.replace(".", "").replace("-", "").isdigit()
-                    else 0
-                ),
-                "str_val": str,
-                "STR_VAL": str,
-            }
-
-            # Create evaluation context
-            # Pascal is case-insensitive: store variables under both original
-            # (uppercase) keys and lowercase versions so eval() resolves either.
-            eval_context = {}
-            for k, v in self.variables.items():
-                eval_context[k] = v
-                eval_context[k.lower()] = v
-            for k, v in self.constants.items():
-                eval_context[k] = v
-                eval_context[k.lower()] = v
-            eval_context.update(allowed_names)
+            # Translation depends only on the source text, so each distinct
+            # expression is translated and compiled once
+            code = self._expr_cache.get(expr)
+            if code is None:
+                code = self._compile_expression(expr)
+                if len(self._expr_cache) >= _EXPR_CACHE_MAX:
+                    self._expr_cache.clear()
+                self._expr_cache[expr] = code
+            if code.__class__ is not CodeType:
+                return code  # folded constant
 
             # Safe evaluation
-            safe_dict = {"__builtins__": {}}
-            safe_dict.update(eval_context)
-
-            return eval(expr, safe_dict)
+            return eval(code, _EVAL_GLOBALS, self._eval_locals)
         except Exception as e:
             self.interpreter.debug_output(f"Expression evaluation error: {e}")
             return 0
 
+    def _compile_expression(self, expr):
+        """Compile an expression, folding it to its value if it is constant"""
+        code = compile(_translate_expression(expr), "<pascal>", "eval")
+        if _IMPURE_NAMES.isdisjoint(code.co_names):
+            try:
+                value = eval(code, _EVAL_GLOBALS)
+            except Exception:
+                # Leave the error to be reported each time it is evaluated
+                return code
+            if isinstance(value, _FOLDABLE_TYPES):
+                return value
+        return code
+
     def _get_default_value(self, var_type):
-        """Get default value for a Pascal type"""
+        """Get default value for an upper-cased Pascal type"""
         type_defaults = {
             "INTEGER": 0,
             "REAL": 0.0,
@@ -902,27 +1063,17 @@ class TwPascalExecutor:
             "EXTENDED": 0.0,  # Extended precision float
             "COMP": 0,  # Computational type
         }
-        return type_defaults.get(var_type.upper(), 0)
+        return type_defaults.get(var_type, 0)
 
     def _convert_to_type(self, value, target_type):
-        """Convert value to specified Pascal type"""
+        """Convert value to specified upper-cased Pascal type"""
+        converter = _CONVERTERS.get(target_type)
+        if converter is None:
+            return value
         try:
-            target_type = target_type.upper()
-            if target_type == "INTEGER":
-                return int(float(value))
-            elif target_type == "REAL":
-                return float(value)
-            elif target_type == "STRING":
-                return str(value)
-            elif target_type == "BOOLEAN":
-                if isinstance(value, str):
-                    return value.upper() in ["TRUE", "1", "YES"]
-                return bool(value)
-            elif target_type == "CHAR":
-                return str(value)[0] if value else " "
+            return converter(value)
         except Exception as e:
             self.interpreter.debug_output(f"Type conversion error: {e}")
-            pass
         return value
 
     def _declare_array(self, array_name, dimensions, element_type):
@@ -941,14 +1092,20 @@ class TwPascalExecutor:
                 else:
                     array_dims.append(int(dim))
 
-            # Create multi-dimensional array
-            def create_array(dims):
-                if len(dims) == 1:
-                    return [self._get_default_value(element_type)] * dims[0]
-                else:
-                    return [create_array(dims[1:]) for _ in range(dims[0])]
+            # Elements are stored flat in row-major order; strides[i] is how
+            # far apart consecutive values of index i are
+            strides = [1] * len(array_dims)
+            for i in range(len(array_dims) - 2, -1, -1):
+                strides[i] = strides[i + 1] * array_dims[i + 1]
+            total = math.prod(array_dims)
+            default = self._get_default_value(element_type)
+            typecode = _ARRAY_TYPECODES.get(element_type)
+            if typecode:
+                elements = array(typecode, [default]) * total
+            else:
+                elements = [default] * total
 
-            self.arrays[array_name] = create_array(array_dims)
+            self.arrays[array_name] = (elements, array_dims, strides)
             self.data_types[array_name] = f"ARRAY OF {element_type}"
             self.interpreter.log_output(
                 f"📊 Array {array_name} declared with dimensions {array_dims}"
@@ -960,21 +1117,31 @@ class TwPascalExecutor:
         """Assign value to array element"""
         try:
             # Parse array[index1,index2,...]
-            match = re.match(r"(\w+)\s*\[(.+)\]", array_ref)
-            if match:
-                array_name = match.group(1).upper()
-                indices_str = match.group(2)
+            lb = array_ref.find("[")
+            rb = array_ref.rfind("]")
+            if 0 < lb < rb:
+                array_name = sys.intern(array_ref[:lb].strip().upper())
+                indices_str = array_ref[lb + 1 : rb]
                 indices = [
                     int(self._evaluate_expression(idx.strip()))
                     for idx in indices_str.split(",")
                 ]
 
                 if array_name in self.arrays:
-                    array = self.arrays[array_name]
-                    # Navigate to the element (assuming 0-based indexing)
-                    for idx in indices[:-1]:
-                        array = array[idx]
-                    array[indices[-1]] = value
+                    elements, dims, strides = self.arrays[array_name]
+                    if len(indices) != len(dims):
+                        raise IndexError("wrong number of indices")
+                    # Locate the element (assuming 0-based indexing)
+                    offset = 0
+                    for idx, dim, stride in zip(indices, dims, strides):
+                        if not 0 <= idx < dim:
+                            raise IndexError("index out of range")
+                        offset += idx * stride
+                    if isinstance(elements, array):
+                        value = self._convert_to_type(
+                            value, self.data_types[array_name][len("ARRAY OF ") :]
+                        )
+                    elements[offset] = value
                     self.interpreter.log_output(
                         f"📊 {array_name}[{','.join(map(str, indices))}] := {value}"
                     )
@@ -26,6 +26,19 @@ execution of Perl code with output capture and error handling within the IDE.
 
 from .base import SubprocessExecutor
 
+# Wait for a script path on stdin, then run that script under its own name.
+# Perl starts up before blocking on the read, so a worker launched ahead of
+# time only has to compile the script once it is needed.  A script that
+# dies is re-raised so the message and exit status match ``perl script``.
+# The slurp is scoped to the path read, and STDIN is reopened on the null
+# device, so the script sees normal line reads and no "<STDIN> line 1"
+# suffix on its warn/die messages.
+_WORKER_BOOTSTRAP = (
+    "use File::Spec; my $p = do { local $/; <STDIN> }; "
+    'close STDIN; open STDIN, "<", File::Spec->devnull; '
+    "$0 = $p; do $0; die $@ if $@;"
+)
+
 
 class PerlExecutor(SubprocessExecutor):
     """Handles Perl language script execution."""
@@ -33,6 +46,7 @@ class PerlExecutor(SubprocessExecutor):
     lang_name = "Perl"
     file_suffix = ".pl"
     executable_candidates = ["perl", "perl5"]
+    worker_bootstrap = _WORKER_BOOTSTRAP
 
     def execute_command(self, command: object) -> str:
         """Execute a Perl command or script.
@@ -57,8 +71,11 @@ class PerlExecutor(SubprocessExecutor):
 
     def _parse_version(self, stdout: str) -> str:
         """Extract version from Perl's verbose --version output."""
-        for line in stdout.splitlines():
-            if "version" in line.lower():
-                return line.strip()
-        return "Perl available"
+        # Find the first line mentioning "version" without splitting into lines
+        i = stdout.lower().find("version")
+        if i < 0:
+            return "Perl available"
+        start = stdout.rfind("\n", 0, i) + 1
+        end = stdout.find("\n", i)
+        return stdout[start : end if end != -1 else None].strip()
 
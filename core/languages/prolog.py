@@ -15,6 +15,7 @@ Language Features:
 - Lists: [head|tail] syntax and list operations
 - Arithmetic: Basic mathematical operations and comparisons
 - Control: Cut (!) operator to control backtracking
+- Tabling: ":- table name/arity" memoizes answers so recursion terminates
 - I/O: Basic input/output predicates for console interaction
 
 TURBO PROLOG EXTENSIONS:
@@ -30,7 +31,161 @@ programming, with support for facts, rules, queries, and basic backtracking.
 
 # pylint: disable=R0902,W0718,R1705,R0911,R0912,W0123,W0613,R0903
 
+import math
 import re
+import sys
+
+# Clause and term patterns, compiled once and shared by every executor
+_PRED_RE = re.compile(r"(\w+)\s*\((.*)\)$")  # whole goal or fact
+_HEAD_RE = re.compile(r"(\w+)\s*\((.*?)\)")  # rule head
+_DECL_RE = re.compile(r"(\w+)\s*\((.+)\)")  # typed predicate declaration
+_DOMAINS_RE = re.compile(r"DOMAINS\s+(\w+)\s*=\s*(.+)", re.IGNORECASE)
+_OBJECT_RE = re.compile(r"OBJECT\s+(\w+)", re.IGNORECASE)
+_CLASS_RE = re.compile(r"CLASS\s+(\w+)", re.IGNORECASE)
+_INHERITS_RE = re.compile(r"INHERITS\s+(\w+)", re.IGNORECASE)
+_PREDICATES_RE = re.compile(r"PREDICATES\s+(.+)", re.IGNORECASE)
+
+# Head instructions compiled for each fact and rule; operands are the
+# argument position and the clause's term at that position
+OP_GET_CONSTANT = 0  # call argument must be the atom/number/string, or unbound
+OP_GET_TERM = 1  # variable or list: full unification with the call argument
+
+_CALL_CACHE_MAX = 1024  # ground calls whose solutions are kept
+
+# Over-approximate the variables a goal mentions and the predicates it calls,
+# from its text; extra names only make call-cache keys more specific
+_GOAL_VAR_RE = re.compile(r"\b[A-Z_]\w*")
+_GOAL_CALL_RE = re.compile(r"\b([a-z]\w*)\s*\(")
+
+# Built-ins with side effects; calls reaching them are never cached
+_IMPURE_GOALS = ("nl", "!")
+_IMPURE_PREFIXES = (
+    "write(",
+    "readln(",
+    "readchar(",
+    "readint(",
+    "readreal(",
+    "assert(",
+    "retract(",
+    "consult(",
+    "repeat",
+)
+
+# Prolog comparison operators that differ from Python's, rewritten in one pass
+_PYTHON_OPS = {"=:=": "==", "=\\=": "!=", "=<": "<="}
+_ARITH_OP_RE = re.compile("|".join(map(re.escape, _PYTHON_OPS)))
+
+# The only names arithmetic goals may call
+_ALLOWED_NAMES = {
+    "abs": abs,
+    "round": round,
+    "int": int,
+    "float": float,
+    "max": max,
+    "min": min,
+    "sin": math.sin,
+    "cos": math.cos,
+    "sqrt": math.sqrt,
+}
+_SAFE_GLOBALS = {"__builtins__": {}, **_ALLOWED_NAMES}
+
+
+def _index_key(term):
+    """
+    Key a term for clause indexing.
+
+    Two terms can only unify if they share a key or one of them is a
+    variable, for which None is returned.
+    """
+    term_type = term["type"]
+    if term_type == "variable":
+        return None
+    if term_type == "list":
+        return ("list",)
+    if term_type == "atom":
+        return ("atom", term["name"])
+    return (term_type, term.get("value"))
+
+
+def _compile_head(args):
+    """Compile clause head arguments to (opcode, position, term) instructions"""
+    return [
+        (
+            OP_GET_TERM if term["type"] in ("variable", "list") else OP_GET_CONSTANT,
+            position,
+            term,
+        )
+        for position, term in enumerate(args)
+    ]
+
+
+def _add_to_composite(index, positions, clause):
+    """
+    File a clause in a composite index under its keys at positions.
+
+    Returns False if the clause has a variable at one of the positions, so
+    the index cannot hold it; predicate declarations and clauses too short
+    to match are skipped.
+    """
+    if clause["type"] not in ("fact", "rule"):
+        return True
+    args = clause["args"] if clause["type"] == "fact" else clause["head_args"]
+    if len(args) <= positions[-1]:
+        return True
+    keys = tuple(_index_key(args[position]) for position in positions)
+    if None in keys:
+        return False
+    index.setdefault(keys, []).append(clause)
+    return True
+
+
+def _freeze_term(term, variables):
+    """
+    Make a hashable copy of a term.
+
+    Variables are numbered in order of first appearance, recorded in
+    variables, so terms that differ only in variable names freeze alike.
+    """
+    term_type = term["type"]
+    if term_type == "variable":
+        return ("variable", variables.setdefault(term["name"], len(variables)))
+    if term_type == "list":
+        return ("list",) + tuple(
+            _freeze_term(element, variables) for element in term["elements"]
+        )
+    if term_type == "atom":
+        return ("atom", term["name"])
+    return (term_type, term.get("value"))
+
+
+def _term_variables(term, names):
+    """Add the names of the variables in a term to the set names"""
+    if term["type"] == "variable":
+        names.add(term["name"])
+    elif term["type"] == "list":
+        for element in term["elements"]:
+            _term_variables(element, names)
+
+
+def _freeze_args(args):
+    """Freeze an argument list, sharing variable numbering across it"""
+    variables = {}
+    return tuple(_freeze_term(arg, variables) for arg in args)
+
+
+def _rename_term(term, variables):
+    """Copy a term with its variables renamed to _T0, _T1, ... via variables"""
+    if term["type"] == "variable":
+        return {
+            "type": "variable",
+            "name": variables.setdefault(term["name"], f"_T{len(variables)}"),
+        }
+    if term["type"] == "list":
+        return {
+            "type": "list",
+            "elements": [_rename_term(element, variables) for element in term["elements"]],
+        }
+    return term
 
 
 class TwPrologExecutor:
@@ -40,12 +195,48 @@ class TwPrologExecutor:
         """Initialize with reference to main interpreter"""
         self.interpreter = interpreter
         self.database = {}  # Facts and rules database
+        self.first_arg_index = {}  # predicate -> {first-arg key: clauses}
+        self.second_arg_index = {}  # predicate -> {second-arg key: clauses}
+        # predicate -> {bound positions: {keys: clauses}, or None if unusable}
+        self.composite_index = {}
+        self._call_cache = {}  # (predicate, ground args) -> solutions' new bindings
+        self._pure = {}  # predicate -> whether proving it has no side effects
+        # predicate -> clause variable names a call to it can bind
+        self._reachable_names = {}
+        self._db_version = 0  # Bumped whenever a clause is added or removed
         self.domains = {}  # Turbo Prolog domains (type definitions)
         self.objects = {}  # Turbo Prolog objects/classes
-        self.variables = {}  # Query variables
+        self.trail = []  # Variables bound since each choice point, for undo
         self.current_query = None
         self.backtrack_stack = []  # For backtracking
         self.cut_flag = False  # Cut operator
+        self._expr_cache = {}  # Arithmetic goal text -> compiled expression
+        self._terms = {}  # Term text -> shared parsed term
+        # Keyword -> bound handler, resolved once instead of per command
+        self._declaration_handlers = {
+            cmd: getattr(self, name) for cmd, name in self._DECLARATION_HANDLERS.items()
+        }
+        self._keyword_handlers = {
+            cmd: getattr(self, name) for cmd, name in self._KEYWORD_HANDLERS.items()
+        }
+        self.tabled = set()  # (predicate, arity) pairs declared with :- table
+        self.table = {}  # (predicate, call variant) -> answer table
+        self._table_pass = None  # Fixpoint pass of the leading tabled call
+        self._table_changed = False  # Whether the current pass found answers
+
+    # Dispatch tables: keyword -> handler method name
+    _DECLARATION_HANDLERS = {
+        "DOMAINS": "_handle_domains",
+        "OBJECT": "_handle_object_declaration",
+        "CLASS": "_handle_class_declaration",
+        "INHERITS": "_handle_inherits",
+        "PREDICATES": "_handle_predicates",
+    }
+    _KEYWORD_HANDLERS = {
+        "LISTING": "_handle_listing",
+        "TRACE": "_handle_trace",
+        "NOTRACE": "_handle_notrace",
+    }
 
     def execute_command(self, command):
         """Execute a Prolog command and return the result"""
@@ -57,39 +248,31 @@ class TwPrologExecutor:
             # Remove trailing period if present
             if command.endswith("."):
                 command = command[:-1].strip()
+                if not command:
+                    return "continue"
 
-            parts = command.split()
-            if not parts:
-                return "continue"
-
-            cmd = parts[0].upper()
-
-            # Turbo Prolog domain declarations
-            if cmd == "DOMAINS":
-                return self._handle_domains(command)
-            elif cmd == "OBJECT":
-                return self._handle_object_declaration(command)
-            elif cmd == "CLASS":
-                return self._handle_class_declaration(command)
-            elif cmd == "INHERITS":
-                return self._handle_inherits(command)
-            elif cmd == "PREDICATES":
-                return self._handle_predicates(command)
-
-            # Fact/rule definition
-            if ":-" in command:
+            # Directive, rule or query; these never start with a keyword
+            if command.startswith(":-"):
+                return self._handle_directive(command)
+            elif ":-" in command:
                 return self._handle_rule(command)
             elif command.startswith("?-"):
                 return self._handle_query(command)
-            elif "(" in command and ")" in command:
+
+            cmd = command.split(None, 1)[0].upper()
+
+            # Turbo Prolog declarations
+            handler = self._declaration_handlers.get(cmd)
+            if handler:
+                return handler(command)
+
+            if "(" in command and ")" in command:
                 # Likely a fact
                 return self._handle_fact(command)
-            elif cmd in ["LISTING", "LISTING."]:
-                return self._handle_listing()
-            elif cmd in ["TRACE", "TRACE."]:
-                return self._handle_trace()
-            elif cmd in ["NOTRACE", "NOTRACE."]:
-                return self._handle_notrace()
+
+            handler = self._keyword_handlers.get(cmd.rstrip("."))
+            if handler:
+                return handler()
 
         except Exception as e:
             self.interpreter.debug_output(f"Prolog command error: {e}")
@@ -101,9 +284,9 @@ class TwPrologExecutor:
         """Handle fact definition"""
         try:
             # fact(arg1, arg2, ...).
-            match = re.match(r"(\w+)\s*\((.*)\)$", command)
+            match = _PRED_RE.match(command)
             if match:
-                predicate = match.group(1)
+                predicate = sys.intern(match.group(1))
                 args_str = match.group(2)
 
                 # Parse arguments
@@ -113,7 +296,9 @@ class TwPrologExecutor:
                 if predicate not in self.database:
                     self.database[predicate] = []
 
-                self.database[predicate].append({"type": "fact", "args": args})
+                clause = {"type": "fact", "args": args, "code": _compile_head(args)}
+                self.database[predicate].append(clause)
+                self._index_clause(predicate, clause)
 
                 self.interpreter.log_output(
                     f"📚 Fact added: {predicate}({', '.join(map(str, args))})"
@@ -132,9 +317,9 @@ class TwPrologExecutor:
                 body_part = body_part.strip()
 
                 # Parse head
-                head_match = re.match(r"(\w+)\s*\((.*?)\)", head_part)
+                head_match = _HEAD_RE.match(head_part)
                 if head_match:
-                    predicate = head_match.group(1)
+                    predicate = sys.intern(head_match.group(1))
                     head_args = self._parse_arguments(head_match.group(2))
 
                     # Parse body (can be multiple goals separated by commas)
@@ -159,9 +344,14 @@ class TwPrologExecutor:
                     if predicate not in self.database:
                         self.database[predicate] = []
 
-                    self.database[predicate].append(
-                        {"type": "rule", "head_args": head_args, "body": goals}
-                    )
+                    clause = {
+                        "type": "rule",
+                        "head_args": head_args,
+                        "code": _compile_head(head_args),
+                        "body": [self._parse_goal(goal) for goal in goals],
+                    }
+                    self.database[predicate].append(clause)
+                    self._index_clause(predicate, clause)
 
                     self.interpreter.log_output(
                         f"📋 Rule added: {predicate}({', '.join(map(str, head_args))}) "
@@ -171,6 +361,22 @@ class TwPrologExecutor:
             self.interpreter.debug_output(f"Rule definition error: {e}")
         return "continue"
 
+    def _handle_directive(self, command):
+        """Handle :- directives (currently only table/1)"""
+        try:
+            # :- table name/arity, name/arity, ...
+            directive = command[2:].strip()
+            if directive.lower().startswith("table "):
+                for spec in directive[6:].split(","):
+                    name, _, arity = spec.strip().partition("/")
+                    name = name.strip()
+                    self.tabled.add((name, int(arity)))
+                    self.interpreter.log_output(f"📑 Tabling {name}/{int(arity)}")
+            # Other directives are not supported and are ignored
+        except Exception as e:
+            self.interpreter.debug_output(f"Directive error: {e}")
+        return "continue"
+
     def _handle_query(self, command):
         """Handle query execution"""
         try:
@@ -195,18 +401,24 @@ class TwPrologExecutor:
                 if buf:
                     goals.append("".join(buf).strip())
 
-                # Execute query
-                results = self._execute_query(goals)
+                # Execute query; every solution is still found, for the side
+                # effects of its goals, but only the first five are kept
+                results = []
+                count = 0
+                for result in self._execute_query(goals):
+                    if count < 5:  # Limit output
+                        results.append(result.copy())
+                    count += 1
 
-                if results:
+                if count:
                     self.interpreter.log_output("✅ Query succeeded")
-                    for result in results[:5]:  # Limit output
+                    for result in results:
                         if result:
                             var_bindings = [f"{k} = {v}" for k, v in result.items()]
                             self.interpreter.log_output(f"   {', '.join(var_bindings)}")
-                    if len(results) > 5:
+                    if count > 5:
                         self.interpreter.log_output(
-                            f"   ... and {len(results) - 5} more solutions"
+                            f"   ... and {count - 5} more solutions"
                         )
                 else:
                     self.interpreter.log_output("❌ Query failed - no solutions found")
@@ -214,6 +426,96 @@ class TwPrologExecutor:
             self.interpreter.debug_output(f"Query execution error: {e}")
         return "continue"
 
+    def _database_changed(self):
+        """Drop what was derived from the database's clauses"""
+        self._db_version += 1
+        self._call_cache.clear()
+        self._pure.clear()
+        self._reachable_names.clear()
+
+    def _index_clause(self, predicate, clause):
+        """
+        Add a fact or rule to the first- and second-argument indexes.
+
+        Each bucket keeps its clauses in database order. Clauses whose indexed
+        argument is a variable can match any call, so they are kept under
+        None and appended to every bucket; new buckets start from them.
+        Clauses too short to have the argument cannot match a call that has
+        it, so they are left out of that index.
+        """
+        self._database_changed()
+        args = clause["args"] if clause["type"] == "fact" else clause["head_args"]
+        for position, index in enumerate((self.first_arg_index, self.second_arg_index)):
+            if len(args) <= position:
+                break
+            buckets = index.setdefault(predicate, {None: []})
+            key = _index_key(args[position])
+            if key is None:
+                for bucket in buckets.values():
+                    bucket.append(clause)
+            else:
+                buckets.setdefault(key, list(buckets[None])).append(clause)
+
+        composites = self.composite_index.get(predicate, {})
+        for positions, index in composites.items():
+            if index is not None and not _add_to_composite(index, positions, clause):
+                composites[positions] = None
+
+    def _reindex_predicate(self, predicate):
+        """Rebuild the clause indexes for a predicate after removing a clause"""
+        self._database_changed()
+        self.first_arg_index.pop(predicate, None)
+        self.second_arg_index.pop(predicate, None)
+        self.composite_index.pop(predicate, None)
+        for clause in self.database.get(predicate, []):
+            if clause["type"] in ("fact", "rule"):
+                self._index_clause(predicate, clause)
+
+    def _candidate_clauses(self, predicate, bound_args):
+        """
+        Return the clauses of a predicate that could match a call.
+
+        A call with several bound arguments, such as route(london, paris, D),
+        looks up all of them at once in a composite index. Otherwise the
+        first bound argument among the first two picks the index bucket to
+        scan, so both parent(tom, X) and parent(X, mary) skip clauses that
+        cannot match; a call with neither bound scans every clause.
+        """
+        keys = [_index_key(arg) for arg in bound_args]
+        positions = tuple(position for position, key in enumerate(keys) if key)
+        if len(positions) > 1:
+            composites = self.composite_index.setdefault(predicate, {})
+            if positions not in composites:
+                composites[positions] = self._build_composite(predicate, positions)
+            index = composites[positions]
+            if index is not None:
+                return index.get(tuple(keys[position] for position in positions), [])
+
+        for position, index in enumerate(
+            (self.first_arg_index, self.second_arg_index)[: len(keys)]
+        ):
+            key = keys[position]
+            if key is not None:
+                buckets = index.get(predicate)
+                if not buckets:
+                    return []
+                return buckets.get(key, buckets[None])
+        return self.database[predicate]
+
+    def _build_composite(self, predicate, positions):
+        """
+        Index a predicate's clauses on the arguments at several positions.
+
+        Built the first time a call binds exactly those positions, then kept
+        up to date by _index_clause. Returns None when some clause has a
+        variable at one of the positions, as it would belong in every bucket.
+        """
+        index = {}
+        for clause in self.database[predicate]:
+            if not _add_to_composite(index, positions, clause):
+                return None
+        return index
+
     def _handle_listing(self):
         """Handle LISTING command - show database contents"""
         try:
@@ -226,7 +528,7 @@ class TwPrologExecutor:
                         self.interpreter.log_output(f"  {predicate}({args_str}).")
                     elif clause["type"] == "rule":
                         head_args_str = ", ".join(map(str, clause["head_args"]))
-                        body_str = ", ".join(clause["body"])
+                        body_str = ", ".join(goal[0] for goal in clause["body"])
                         self.interpreter.log_output(
                             f"  {predicate}({head_args_str}) :- {body_str}."
                         )
@@ -251,9 +553,7 @@ class TwPrologExecutor:
             # e.g., DOMAINS person = symbol
             # e.g., DOMAINS age = integer
             # e.g., DOMAINS grades = symbol*
-            domain_match = re.match(
-                r"DOMAINS\s+(\w+)\s*=\s*(.+)", command, re.IGNORECASE
-            )
+            domain_match = _DOMAINS_RE.match(command)
             if domain_match:
                 domain_name = domain_match.group(1).lower()
                 type_def = domain_match.group(2).strip()
@@ -275,7 +575,7 @@ class TwPrologExecutor:
         """Handle Turbo Prolog OBJECT declarations"""
         try:
             # OBJECT object_name
-            obj_match = re.match(r"OBJECT\s+(\w+)", command, re.IGNORECASE)
+            obj_match = _OBJECT_RE.match(command)
             if obj_match:
                 obj_name = obj_match.group(1).lower()
                 self.objects[obj_name] = {
@@ -294,7 +594,7 @@ class TwPrologExecutor:
         """Handle Turbo Prolog CLASS declarations"""
         try:
             # CLASS class_name
-            class_match = re.match(r"CLASS\s+(\w+)", command, re.IGNORECASE)
+            class_match = _CLASS_RE.match(command)
             if class_match:
                 class_name = class_match.group(1).lower()
                 self.objects[class_name] = {
@@ -313,7 +613,7 @@ class TwPrologExecutor:
         """Handle Turbo Prolog INHERITS declarations"""
         try:
             # INHERITS parent_class
-            inherit_match = re.match(r"INHERITS\s+(\w+)", command, re.IGNORECASE)
+            inherit_match = _INHERITS_RE.match(command)
             if inherit_match:
                 parent_name = inherit_match.group(1).lower()
                 # Find the current object/class being defined
@@ -342,7 +642,7 @@ class TwPrologExecutor:
         """Handle Turbo Prolog PREDICATES declarations"""
         try:
             # PREDICATES predicate_name(arg_types) or PREDICATES predicate_name
-            pred_match = re.match(r"PREDICATES\s+(.+)", command, re.IGNORECASE)
+            pred_match = _PREDICATES_RE.match(command)
             if pred_match:
                 pred_decl = pred_match.group(1).strip()
 
@@ -378,48 +678,65 @@ class TwPrologExecutor:
 
     def _parse_arguments(self, args_str):
         """Parse argument list from string"""
+        # Without lists or strings every comma separates arguments
+        if "[" not in args_str and '"' not in args_str:
+            return [
+                self._parse_term(arg) for arg in map(str.strip, args_str.split(",")) if arg
+            ]
+
+        # Otherwise split on top-level commas only, slicing each argument out
+        # once its end is found
         args = []
-        current_arg = ""
+        start = 0
         in_brackets = 0
         in_quotes = False
 
-        i = 0
-        while i < len(args_str):
-            char = args_str[i]
-
+        for i, char in enumerate(args_str):
             if char == '"' and (i == 0 or args_str[i - 1] != "\\"):
                 in_quotes = not in_quotes
-                current_arg += char
-            elif char == "[" and not in_quotes:
+            elif in_quotes:
+                continue
+            elif char == "[":
                 in_brackets += 1
-                current_arg += char
-            elif char == "]" and not in_quotes:
+            elif char == "]":
                 in_brackets -= 1
-                current_arg += char
-            elif char == "," and not in_quotes and in_brackets == 0:
-                if current_arg.strip():
-                    args.append(self._parse_term(current_arg.strip()))
-                    current_arg = ""
-            else:
-                current_arg += char
-
-            i += 1
+            elif char == "," and in_brackets == 0:
+                arg = args_str[start:i].strip()
+                if arg:
+                    args.append(self._parse_term(arg))
+                start = i + 1
 
-        if current_arg.strip():
-            args.append(self._parse_term(current_arg.strip()))
+        arg = args_str[start:].strip()
+        if arg:
+            args.append(self._parse_term(arg))
 
         return args
 
     def _parse_term(self, term_str):
-        """Parse a single term"""
-        term_str = term_str.strip()
+        """
+        Parse a single term from already stripped text.
+
+        Terms are never modified once built, so every occurrence of the same
+        text shares one term: a program stores one dict per distinct atom or
+        number rather than one per mention, and equal terms compare by
+        identity.
+        """
+        term = self._terms.get(term_str)
+        if term is None:
+            term = self._terms[term_str] = self._build_term(term_str)
+        return term
+
+    def _build_term(self, term_str):
+        """Build the term for stripped term text"""
+        # Dispatch on the first character rather than trying each pattern
+        first = term_str[:1]
 
         # Variable (starts with uppercase or _)
-        if re.match(r"^[A-Z_]\w*$", term_str):
-            return {"type": "variable", "name": term_str}
+        if ("A" <= first <= "Z" or first == "_") and term_str.isidentifier():
+            return {"type": "variable", "name": sys.intern(term_str)}
 
         # List [a,b,c]
-        elif term_str.startswith("[") and term_str.endswith("]"):
+        elif first == "[" and term_str.endswith("]"):
             list_content = term_str[1:-1]
             if not list_content.strip():
                 return {"type": "list", "elements": []}
@@ -427,99 +744,319 @@ class TwPrologExecutor:
             return {"type": "list", "elements": elements}
 
         # String "text"
-        elif term_str.startswith('"') and term_str.endswith('"'):
+        elif first == '"' and term_str.endswith('"'):
             return {"type": "string", "value": term_str[1:-1]}
 
-        # Number
-        elif re.match(r"^-?\d+(\.\d+)?$", term_str):
-            if "." in term_str:
-                return {"type": "number", "value": float(term_str)}
-            else:
+        # Number: -?digits(.digits)?
+        elif first == "-" or first.isdecimal():
+            digits = term_str[1:] if first == "-" else term_str
+            if digits.isdecimal():
                 return {"type": "number", "value": int(term_str)}
+            whole, dot, fraction = digits.partition(".")
+            if dot and whole.isdecimal() and fraction.isdecimal():
+                return {"type": "number", "value": float(term_str)}
 
         # Atom (starts with lowercase)
-        else:
-            return {"type": "atom", "name": term_str}
+        return {"type": "atom", "name": sys.intern(term_str)}
 
     def _execute_query(self, goals):
-        """Execute a query with backtracking"""
-        self.variables = {}
+        """Execute a query with backtracking, yielding its solutions"""
+        self.trail = []
         self.backtrack_stack = []
         self.cut_flag = False
+        self.table = {}  # Answers depend on the database, so start afresh
+
+        return self._prove_goals([self._parse_goal(goal) for goal in goals], 0, {})
+
+    def _parse_goal(self, goal):
+        """
+        Parse a goal once, ahead of proving it.
 
-        return self._prove_goals(goals, 0, {})
+        Returns:
+            tuple: (text, predicate, args); predicate and args are None when
+            the goal is not of the form name(args), so only the built-ins
+            can prove it
+        """
+        goal = goal.strip()
+        match = _PRED_RE.match(goal)
+        if not match:
+            return goal, None, None
+        return goal, sys.intern(match.group(1)), self._parse_arguments(match.group(2))
 
     def _prove_goals(self, goals, goal_index, bindings):
-        """Prove a list of goals using backtracking"""
+        """
+        Prove a list of parsed goals using backtracking.
+
+        Yields the bindings for each solution in turn. They are only valid
+        until the generator is resumed, so copy any solution that is kept.
+        """
         if goal_index >= len(goals):
             # All goals proved
-            return [bindings.copy()]
-
-        goal = goals[goal_index]
-        solutions = []
+            yield bindings
+            return
 
         # Try to prove current goal
-        goal_solutions = self._prove_goal(goal, bindings)
-
-        for solution_bindings in goal_solutions:
-            # Merge bindings
-            new_bindings = bindings.copy()
-            new_bindings.update(solution_bindings)
-
-            # Recursively prove remaining goals
-            remaining_solutions = self._prove_goals(goals, goal_index + 1, new_bindings)
-            solutions.extend(remaining_solutions)
+        for solution_bindings in self._prove_goal(goals[goal_index], bindings):
+            # Each solution already extends bindings; prove remaining goals
+            yield from self._prove_goals(goals, goal_index + 1, solution_bindings)
 
             if self.cut_flag:
-                break
-
-        return solutions
+                return
 
     def _prove_goal(self, goal, bindings):
-        """Prove a single goal"""
+        """Prove a single goal parsed by _parse_goal, yielding its solutions"""
+        text, predicate, args = goal
         # First try built-in predicates (these can include parenthesized forms)
-        builtin_res = self._prove_builtin(goal, bindings)
+        builtin_res = self._prove_builtin(text, bindings)
         if builtin_res:
-            return builtin_res
+            yield from builtin_res
+            return
 
-        # Parse goal
-        match = re.match(r"(\w+)\s*\((.*)\)$", goal)
-        if not match:
+        if predicate is None:
             # Nothing matched and not a built-in
-            return []
-
-        predicate = match.group(1)
-        args_str = match.group(2)
-        args = self._parse_arguments(args_str)
-
-        solutions = []
+            return
 
         # Apply current bindings to args
         bound_args = self._apply_bindings(args, bindings)
 
         # Look up predicate in database
-        if predicate in self.database:
-            for clause in self.database[predicate]:
-                if clause["type"] == "fact":
-                    # Try to unify with fact
-                    fact_args = clause["args"]
-                    unification = self._unify(bound_args, fact_args, bindings.copy())
-                    if unification is not None:
-                        solutions.append(unification)
-
-                elif clause["type"] == "rule":
-                    # Try to prove rule body
-                    rule_bindings = self._unify(
-                        bound_args, clause["head_args"], bindings.copy()
-                    )
-                    if rule_bindings is not None:
+        if predicate not in self.database:
+            return
+        if (predicate, len(bound_args)) in self.tabled:
+            yield from self._prove_tabled(predicate, bound_args, bindings)
+        elif (
+            not self.cut_flag
+            and all(self._is_ground(arg, bindings) for arg in bound_args)
+            and self._is_pure(predicate)
+        ):
+            yield from self._prove_ground(predicate, bound_args, bindings)
+        else:
+            yield from self._resolve_clauses(predicate, bound_args, bindings)
+
+    def _resolve_clauses(self, predicate, bound_args, bindings):
+        """Prove a call against the facts and rules of a predicate"""
+        arity = len(bound_args)
+        clauses = self._candidate_clauses(predicate, bound_args)
+        if len(clauses) == 1 and clauses[0]["type"] == "fact":
+            # Deterministic: a lone candidate fact matches at most once, so
+            # try it directly instead of looping over alternatives
+            code = clauses[0]["code"]
+            mark = len(self.trail)
+            if len(code) == arity and self._run_head(code, bound_args, bindings):
+                try:
+                    yield bindings
+                finally:
+                    self._undo_bindings(bindings, mark)
+            return
+
+        for clause in clauses:
+            code = clause.get("code")
+            if code is None or len(code) != arity:
+                continue  # Predicate declaration or different arity
+            mark = len(self.trail)
+            if self._run_head(code, bound_args, bindings):
+                # Undo even if the caller stops early and closes us
+                try:
+                    if clause["type"] == "fact":
+                        yield bindings
+                    else:
                         # Prove rule body
-                        body_solutions = self._prove_goals(
-                            clause["body"], 0, rule_bindings
-                        )
-                        solutions.extend(body_solutions)
+                        yield from self._prove_goals(clause["body"], 0, bindings)
+                finally:
+                    self._undo_bindings(bindings, mark)
+
+    def _prove_ground(self, predicate, bound_args, bindings):
+        """
+        Prove a ground call to a side-effect-free predicate, with caching.
+
+        Such a call binds none of its arguments, only the clause variables of
+        the rules it runs. Those are not renamed apart, so the caller's own
+        bindings for the same names steer the proof; they are part of the
+        key. The bindings each solution adds are cached once the call has
+        been run to the end, and replayed for the same call until the
+        database changes.
+        """
+        context = []
+        for name in self._reachable_variables(predicate):
+            if name in bindings:
+                value = self._resolve_term(bindings[name], bindings)
+                if not self._is_ground(value, bindings):
+                    # Replay binds by name, which a partly bound value defeats
+                    yield from self._resolve_clauses(predicate, bound_args, bindings)
+                    return
+                context.append((name, _freeze_term(value, {})))
+        key = (
+            predicate,
+            _freeze_args([self._resolve_term(arg, bindings) for arg in bound_args]),
+            tuple(context),
+        )
+        solutions = self._call_cache.get(key)
+        if solutions is not None:
+            for added in solutions:
+                mark = len(self.trail)
+                for name, term in added:
+                    if name not in bindings:
+                        bindings[name] = term
+                        self.trail.append(name)
+                try:
+                    yield bindings
+                finally:
+                    self._undo_bindings(bindings, mark)
+            return
+
+        version = self._db_version
+        bound = set(bindings)
+        solutions = []
+        for solution in self._resolve_clauses(predicate, bound_args, bindings):
+            solutions.append(
+                [(name, term) for name, term in solution.items() if name not in bound]
+            )
+            yield solution
+        if version == self._db_version:
+            if len(self._call_cache) >= _CALL_CACHE_MAX:
+                self._call_cache.clear()
+            self._call_cache[key] = solutions
+
+    def _reachable_variables(self, predicate):
+        """
+        Names of the clause variables a call to a predicate can bind.
+
+        Covers the clauses of every predicate its rules can reach, found by
+        scanning goal text, so the result may include extra names.
+        """
+        names = self._reachable_names.get(predicate)
+        if names is None:
+            names = set()
+            seen = {predicate}
+            pending = [predicate]
+            while pending:
+                for clause in self.database.get(pending.pop(), []):
+                    if clause["type"] == "fact":
+                        head = clause["args"]
+                    elif clause["type"] == "rule":
+                        head = clause["head_args"]
+                    else:
+                        continue
+                    for arg in head:
+                        _term_variables(arg, names)
+                    for text, _, _ in clause.get("body", ()):
+                        names.update(_GOAL_VAR_RE.findall(text))
+                        for called in _GOAL_CALL_RE.findall(text):
+                            if called in self.database and called not in seen:
+                                seen.add(called)
+                                pending.append(called)
+            names = self._reachable_names[predicate] = tuple(sorted(names))
+        return names
+
+    def _is_pure(self, predicate):
+        """Whether proving a predicate can have no side effects"""
+        pure = self._pure.get(predicate)
+        if pure is None:
+            # Assume recursive calls are pure while this one is checked
+            self._pure[predicate] = True
+            pure = all(
+                self._goal_is_pure(goal)
+                for clause in self.database.get(predicate, [])
+                if clause["type"] == "rule"
+                for goal in clause["body"]
+            )
+            self._pure[predicate] = pure
+        return pure
+
+    def _goal_is_pure(self, goal):
+        """Whether proving a parsed goal can have no side effects"""
+        text, predicate, _ = goal
+        if text in _IMPURE_GOALS or text.startswith(_IMPURE_PREFIXES):
+            return False
+        if text.startswith("not(") and text.endswith(")"):
+            return self._goal_is_pure(self._parse_goal(text[4:-1]))
+        return predicate is None or self._is_pure(predicate)
+
+    def _run_head(self, code, call_args, bindings):
+        """
+        Match a call against a clause head compiled by _compile_head.
+
+        Constants are checked directly; variables and lists go through
+        _unify_terms. Returns False, with bindings undone, on a mismatch.
+        """
+        mark = len(self.trail)
+        for op, position, term in code:
+            arg = call_args[position]
+            if op == OP_GET_CONSTANT:
+                while arg["type"] == "variable" and arg["name"] in bindings:
+                    arg = bindings[arg["name"]]
+                if arg is term or arg == term:
+                    continue
+                if arg["type"] == "variable":
+                    bindings[arg["name"]] = term
+                    self.trail.append(arg["name"])
+                    continue
+            elif self._unify_terms(arg, term, bindings) is not None:
+                continue
+            self._undo_bindings(bindings, mark)
+            return False
+        return True
+
+    def _prove_tabled(self, predicate, bound_args, bindings):
+        """
+        Prove a call to a tabled predicate from its answer table.
+
+        Answers are cached per call variant for the rest of the query. The
+        first tabled call of a query leads the evaluation: it re-runs the
+        clauses of every table it reaches until no table gains an answer,
+        so left-recursive predicates terminate. A call that is already
+        being evaluated in the current pass just reads the answers so far.
+        """
+        call_args = [self._resolve_term(arg, bindings) for arg in bound_args]
+        key = (predicate, _freeze_args(call_args))
+        entry = self.table.get(key)
+        if entry is None:
+            # Rename the call's variables apart from the clause variables,
+            # which share the caller's namespace
+            variables = {}
+            entry = self.table[key] = {
+                "args": [_rename_term(arg, variables) for arg in call_args],
+                "answers": {},
+                "complete": False,
+                "pass": -1,
+            }
 
-        return solutions
+        if not entry["complete"]:
+            if self._table_pass is None:
+                self._table_pass = 0
+                try:
+                    while True:
+                        self._table_changed = False
+                        self._fill_table(entry, predicate)
+                        if not self._table_changed:
+                            break
+                        self._table_pass += 1
+                finally:
+                    self._table_pass = None
+                for reached in self.table.values():
+                    reached["complete"] = True
+            elif entry["pass"] != self._table_pass:
+                self._fill_table(entry, predicate)
+
+        for answer in list(entry["answers"].values()):
+            mark = len(self.trail)
+            if self._unify(bound_args, answer, bindings) is not None:
+                try:
+                    yield bindings
+                finally:
+                    self._undo_bindings(bindings, mark)
+
+    def _fill_table(self, entry, predicate):
+        """Run a tabled call's clauses once, adding new answers to its table"""
+        entry["pass"] = self._table_pass
+        # The call's arguments already carry the caller's bindings, so the
+        # clauses start from empty bindings
+        for solution in self._resolve_clauses(predicate, entry["args"], {}):
+            answer = [self._resolve_term(arg, solution) for arg in entry["args"]]
+            frozen = _freeze_args(answer)
+            if frozen not in entry["answers"]:
+                entry["answers"][frozen] = answer
+                self._table_changed = True
 
     # Arithmetic comparison operators recognised by _prove_arithmetic
     _ARITH_OPS = (" =:= ", r" =\= ", " < ", " > ", " >= ", " =< ")
@@ -528,7 +1065,7 @@ class TwPrologExecutor:
         """Prove write/1 — output a term to the screen"""
         arg_str = goal[6:-1].strip()
         arg = self._parse_term(arg_str)
-        bound_arg = self._apply_bindings_to_term(arg, bindings)
+        bound_arg = self._resolve_term(arg, bindings)
         if bound_arg["type"] == "string":
             display = bound_arg["value"]
         elif bound_arg["type"] == "number":
@@ -600,33 +1137,23 @@ class TwPrologExecutor:
 
     def _prove_arithmetic(self, goal, bindings):
         """Prove arithmetic comparisons"""
-        try:
-            # Simple arithmetic evaluation
-            # Order matters: replace longer operators before shorter substrings
-            expr = goal.replace("=:=", "==").replace("=\\=", "!=").replace("=<", "<=")
-            bound_expr = self._apply_bindings_to_expression(expr, bindings)
-
-            # Safe evaluation
-            allowed_names = {
-                "abs": abs,
-                "round": round,
-                "int": int,
-                "float": float,
-                "max": max,
-                "min": min,
-                "sin": __import__("math").sin,
-                "cos": __import__("math").cos,
-                "sqrt": __import__("math").sqrt,
-            }
-
-            safe_dict = {"__builtins__": {}}
-            safe_dict.update(allowed_names)
+        # Compile each goal once; variables are passed in at evaluation
+        code = self._expr_cache.get(goal)
+        if code is None:
+            expr = _ARITH_OP_RE.sub(lambda m: _PYTHON_OPS[m.group()], goal)
+            try:
+                code = compile(expr, "<prolog-arith>", "eval")
+            except SyntaxError:
+                return []
+            self._expr_cache[goal] = code
 
-            result = eval(bound_expr, safe_dict)
-            if result:
-                return [bindings]
-        except (ValueError, TypeError, NameError, SyntaxError):
-            pass
+        # Safe evaluation; a goal that cannot be evaluated simply fails
+        try:
+            result = eval(code, _SAFE_GLOBALS, self._expression_values(code, bindings))
+        except (ValueError, TypeError, NameError, ZeroDivisionError, OverflowError):
+            return []
+        if result:
+            return [bindings]
         return []
 
     def _prove_member(self, goal, bindings):
@@ -639,10 +1166,17 @@ class TwPrologExecutor:
                 list_term = self._apply_bindings_to_term(args[1], bindings)
                 solutions = []
                 if list_term["type"] == "list":
+                    # With nothing to bind, every match is the same solution
+                    deterministic = self._is_ground(
+                        element, bindings
+                    ) and self._is_ground(list_term, bindings)
                     for item in list_term["elements"]:
-                        unification = self._unify_terms(element, item, bindings.copy())
-                        if unification is not None:
-                            solutions.append(unification)
+                        mark = len(self.trail)
+                        if self._unify_terms(element, item, bindings) is not None:
+                            solutions.append(bindings.copy())
+                        self._undo_bindings(bindings, mark)
+                        if solutions and deterministic:
+                            break
                 return solutions
         except (ValueError, TypeError, IndexError):
             pass
@@ -768,6 +1302,7 @@ class TwPrologExecutor:
                 # Clean up empty entries
                 if not self.database[key_to_remove]:
                     del self.database[key_to_remove]
+                self._reindex_predicate(key_to_remove)
                 self.interpreter.log_output(f"🔄 Retracted: {fact_str}")
                 return [bindings]
             return []
@@ -804,8 +1339,12 @@ class TwPrologExecutor:
         try:
             sub_goal = goal[4:-1].strip()  # Remove not(
             # Try to prove the subgoal - if it fails, not succeeds
-            sub_solutions = self._prove_goal(sub_goal, bindings)
-            if not sub_solutions:
+            sub_solutions = self._prove_goal(self._parse_goal(sub_goal), bindings)
+            try:
+                proved = next(sub_solutions, None) is not None
+            finally:
+                sub_solutions.close()
+            if not proved:
                 return [bindings]  # Negation succeeds
             return []  # Negation fails
         except (ValueError, TypeError):
@@ -817,58 +1356,77 @@ class TwPrologExecutor:
         return [bindings]
 
     def _unify(self, args1, args2, bindings):
-        """Unify two argument lists"""
+        """
+        Unify two argument lists, binding variables in place.
+
+        Returns bindings on success. On failure any bindings made here are
+        undone and None is returned.
+        """
         if len(args1) != len(args2):
             return None
 
-        result_bindings = bindings.copy()
-
+        mark = len(self.trail)
+        unify_terms = self._unify_terms
         for arg1, arg2 in zip(args1, args2):
-            unified = self._unify_terms(arg1, arg2, result_bindings)
-            if unified is None:
+            if unify_terms(arg1, arg2, bindings) is None:
+                self._undo_bindings(bindings, mark)
                 return None
-            result_bindings = unified
 
-        return result_bindings
+        return bindings
 
     def _unify_terms(self, term1, term2, bindings):
-        """Unify two terms"""
-        # Apply existing bindings
-        term1 = self._apply_bindings_to_term(term1, bindings)
-        term2 = self._apply_bindings_to_term(term2, bindings)
-
-        # Both variables
-        if term1["type"] == "variable" and term2["type"] == "variable":
-            if term1["name"] == term2["name"]:
-                return bindings
-            # Create binding
-            new_bindings = bindings.copy()
-            new_bindings[term1["name"]] = term2
-            return new_bindings
+        """Unify two terms, recording new variable bindings on the trail"""
+        # Dereference bound variables; inlined, as this runs for every
+        # argument of every clause tried
+        type1 = term1["type"]
+        while type1 == "variable" and term1["name"] in bindings:
+            term1 = bindings[term1["name"]]
+            type1 = term1["type"]
+        type2 = term2["type"]
+        while type2 == "variable" and term2["name"] in bindings:
+            term2 = bindings[term2["name"]]
+            type2 = term2["type"]
+
+        # Shared terms: the same variable, or a constant parsed from the same text
+        if term1 is term2:
+            return bindings
 
         # First is variable
-        elif term1["type"] == "variable":
-            if self._occurs_check(term1["name"], term2, bindings):
+        if type1 == "variable":
+            if type2 == "variable":
+                if term1["name"] == term2["name"]:
+                    return bindings
+            # Only a list can contain the variable
+            elif type2 == "list" and self._occurs_check(term1["name"], term2, bindings):
                 return None  # Occurs check failed
-            new_bindings = bindings.copy()
-            new_bindings[term1["name"]] = term2
-            return new_bindings
+            bindings[term1["name"]] = term2
+            self.trail.append(term1["name"])
+            return bindings
 
         # Second is variable
-        elif term2["type"] == "variable":
-            if self._occurs_check(term2["name"], term1, bindings):
+        if type2 == "variable":
+            if type1 == "list" and self._occurs_check(term2["name"], term1, bindings):
                 return None  # Occurs check failed
-            new_bindings = bindings.copy()
-            new_bindings[term2["name"]] = term1
-            return new_bindings
+            bindings[term2["name"]] = term1
+            self.trail.append(term2["name"])
+            return bindings
+
+        # Both lists - unify element by element
+        if type1 == "list" and type2 == "list":
+            return self._unify(term1["elements"], term2["elements"], bindings)
 
         # Both constants - check equality
-        else:
-            if term1 == term2:
-                return bindings
+        if term1 == term2:
+            return bindings
 
         return None
 
+    def _undo_bindings(self, bindings, mark):
+        """Backtrack: unbind the variables trailed since mark"""
+        trail = self.trail
+        while len(trail) > mark:
+            del bindings[trail.pop()]
+
     def _occurs_check(self, var_name, term, bindings):
         """Check if variable occurs in term (prevent circular bindings)"""
         if term["type"] == "variable":
@@ -887,26 +1445,46 @@ class TwPrologExecutor:
         return [self._apply_bindings_to_term(arg, bindings) for arg in args]
 
     def _apply_bindings_to_term(self, term, bindings):
-        """Apply bindings to a single term"""
-        if term["type"] == "variable" and term["name"] in bindings:
-            return self._apply_bindings_to_term(bindings[term["name"]], bindings)
-        elif term["type"] == "list":
+        """
+        Dereference a term: follow variable bindings to the end of the chain.
+
+        List elements are left as they are; unification dereferences them as
+        it reaches them. Use _resolve_term for a fully substituted copy.
+        """
+        while term["type"] == "variable" and term["name"] in bindings:
+            term = bindings[term["name"]]
+        return term
+
+    def _is_ground(self, term, bindings):
+        """Whether a term contains no unbound variables"""
+        term = self._apply_bindings_to_term(term, bindings)
+        if term["type"] == "variable":
+            return False
+        if term["type"] == "list":
+            return all(self._is_ground(elem, bindings) for elem in term["elements"])
+        return True
+
+    def _resolve_term(self, term, bindings):
+        """Substitute bindings throughout a term, including list elements"""
+        term = self._apply_bindings_to_term(term, bindings)
+        if term["type"] == "list":
             return {
                 "type": "list",
                 "elements": [
-                    self._apply_bindings_to_term(elem, bindings)
-                    for elem in term["elements"]
+                    self._resolve_term(elem, bindings) for elem in term["elements"]
                 ],
             }
-        else:
-            return term
-
-    def _apply_bindings_to_expression(self, expr, bindings):
-        """Apply bindings to arithmetic expression"""
-        for var_name, var_term in bindings.items():
-            if var_term["type"] in ["number"]:
-                expr = expr.replace(var_name, str(var_term["value"]))
-        return expr
+        return term
+
+    def _expression_values(self, code, bindings):
+        """Map the names a compiled arithmetic goal uses to their bound numbers"""
+        values = {}
+        for name in code.co_names:
+            if name in bindings:
+                term = self._apply_bindings_to_term(bindings[name], bindings)
+                if term["type"] == "number":
+                    values[name] = term["value"]
+        return values
 
     def _parse_domain_type(self, type_def):
         """Parse Turbo Prolog domain type definition"""
@@ -946,7 +1524,7 @@ class TwPrologExecutor:
             # predicate_name or predicate_name(arg_type1, arg_type2, ...)
             if "(" in decl and ")" in decl:
                 # With type specifications
-                pred_match = re.match(r"(\w+)\s*\((.+)\)", decl)
+                pred_match = _DECL_RE.match(decl)
                 if pred_match:
                     pred_name = pred_match.group(1)
                     arg_types_str = pred_match.group(2)
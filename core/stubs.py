@@ -6,6 +6,58 @@ IoT, networking, animation) are not installed.  Each stub provides the same
 public API surface so the interpreter can instantiate them without error.
 """
 
+from types import MappingProxyType
+
+# Fixed results returned by the stubs below; read-only so they can be shared
+_EMPTY_MAPPING = MappingProxyType({})
+_EMPTY_AUDIO_INFO = MappingProxyType(
+    {
+        "mixer_available": False,
+        "loaded_clips": 0,
+        "playing_sounds": 0,
+        "built_in_sounds": (),
+    }
+)
+_EMPTY_HOME = MappingProxyType({"discovered": 0, "connected": 0})
+_SCAN_ENV = MappingProxyType(
+    {
+        "lidar": MappingProxyType({"range": 10.0}),
+        "camera": MappingProxyType({"objects": ()}),
+    }
+)
+_NO_OBSTACLES = MappingProxyType({"obstacles_detected": 0})
+
+
+# Shared bodies for stub methods that ignore their arguments; classes bind
+# them as staticmethods instead of defining one function per method.
+def _ret_false(*a, **k):
+    """Stub: accept any arguments – always returns False."""
+    return False
+
+
+def _ret_none(*a, **k):
+    """Stub: accept any arguments – always returns None."""
+    return None
+
+
+def _noop(*a, **k):
+    """Stub: accept any arguments – no-op."""
+
+
+def _raise_ni_mp(*a, **k):
+    """Stub: multiplayer call – raises NotImplementedError."""
+    raise NotImplementedError("Multiplayer not available")
+
+
+def _raise_ni_net(*a, **k):
+    """Stub: networking call – raises NotImplementedError."""
+    raise NotImplementedError("Networking not available")
+
+
+def _raise_ni_iot(*a, **k):
+    """Stub: IoT call – raises NotImplementedError."""
+    raise NotImplementedError("IoT not available")
+
 
 # ---------------------------------------------------------------------------
 # Audio
@@ -17,9 +69,9 @@ class AudioEngine:
     class _SpatialStub:
         """Stub spatial audio sub-system – no-ops."""
 
-        @staticmethod
-        def set_listener_position(*args):
-            """Stub: set listener position – no-op."""
+        __slots__ = ()
+
+        set_listener_position = staticmethod(_noop)
 
     spatial_audio = _SpatialStub()
 
@@ -27,42 +79,19 @@ class AudioEngine:
         self.clips: dict = {}
         self.sound_library: dict = {}
 
-    def load_audio(self, *a):
-        """Stub: load an audio clip – always returns False."""
-        return False
-
-    def play_sound(self, *a):
-        """Stub: play a sound – always returns None."""
-        return None
-
-    def stop_sound(self, *a):
-        """Stub: stop a sound – always returns False."""
-        return False
-
-    def stop_all_sounds(self):
-        """Stub: stop all sounds – no-op."""
-
-    def play_music(self, *a):
-        """Stub: play music – always returns False."""
-        return False
-
-    def stop_music(self, *a):
-        """Stub: stop music – always returns False."""
-        return False
-
-    def set_master_volume(self, *a):
-        """Stub: set master volume – no-op."""
-
-    def set_sound_volume(self, *a):
-        """Stub: set sound volume – no-op."""
-
-    def set_music_volume(self, *a):
-        """Stub: set music volume – no-op."""
+    load_audio = staticmethod(_ret_false)
+    play_sound = staticmethod(_ret_none)
+    stop_sound = staticmethod(_ret_false)
+    stop_all_sounds = staticmethod(_noop)
+    play_music = staticmethod(_ret_false)
+    stop_music = staticmethod(_ret_false)
+    set_master_volume = staticmethod(_noop)
+    set_sound_volume = staticmethod(_noop)
+    set_music_volume = staticmethod(_noop)
 
     def get_audio_info(self):
-        """Stub: return empty audio info dict."""
-        return {"mixer_available": False, "loaded_clips": 0,
-                "playing_sounds": 0, "built_in_sounds": []}
+        """Stub: return empty audio info mapping."""
+        return _EMPTY_AUDIO_INFO
 
 
 # ---------------------------------------------------------------------------
@@ -72,102 +101,69 @@ class AudioEngine:
 class GameManager:
     """Stub game manager."""
 
-    session_id = None
-    game_mode = "cooperative"
-    max_players = 8
-    is_server = False
-    game_state = "waiting"
+    __slots__ = (
+        "players",
+        "session_id",
+        "game_mode",
+        "max_players",
+        "is_server",
+        "game_state",
+        "_cb",
+    )
 
     def __init__(self) -> None:
         self.players: dict = {}
+        self.session_id = None
+        self.game_mode = "cooperative"
+        self.max_players = 8
+        self.is_server = False
+        self.game_state = "waiting"
+        self._cb = None
 
     def set_output_callback(self, cb):
-        """Stub: register output callback – no-op."""
-
-    def create_object(self, *a):
-        """Stub: create a scene object – always returns False."""
-        return False
-
-    def move_object(self, *a):
-        """Stub: move a scene object – always returns False."""
-        return False
-
-    def set_gravity(self, *a):
-        """Stub: set gravity – no-op."""
-
-    def set_velocity(self, *a):
-        """Stub: set object velocity – always returns False."""
-        return False
-
-    def check_collision(self, *a):
-        """Stub: check collision – always returns False."""
-        return False
-
-    def render_scene(self, *a):
-        """Stub: render scene – always returns False."""
-        return False
-
-    def update_physics(self, *a):
-        """Stub: update physics – no-op."""
-
-    def delete_object(self, *a):
-        """Stub: delete a scene object – always returns False."""
-        return False
+        """Stub: register output callback – stored but never called."""
+        self._cb = cb
+
+    create_object = staticmethod(_ret_false)
+    move_object = staticmethod(_ret_false)
+    set_gravity = staticmethod(_noop)
+    set_velocity = staticmethod(_ret_false)
+    check_collision = staticmethod(_ret_false)
+    render_scene = staticmethod(_ret_false)
+    update_physics = staticmethod(_noop)
+    delete_object = staticmethod(_ret_false)
 
     def list_objects(self):
         """Stub: list scene objects – always returns empty list."""
         return []
 
-    def clear_scene(self):
-        """Stub: clear the scene – no-op."""
-
-    def get_object_info(self, *a):
-        """Stub: get object info – always returns None."""
-        return None
-
-    def get_object(self, *a):
-        """Stub: get a scene object – always returns None."""
-        return None
+    clear_scene = staticmethod(_noop)
+    get_object_info = staticmethod(_ret_none)
+    get_object = staticmethod(_ret_none)
 
     def get_game_info(self):
-        """Stub: get game info – returns empty dict."""
-        return {}
-
-    def add_player(self, *a):
-        """Stub: add a multiplayer player – raises NotImplementedError."""
-        raise NotImplementedError("Multiplayer not available")
-
-    def remove_player(self, *a):
-        """Stub: remove a multiplayer player – raises NotImplementedError."""
-        raise NotImplementedError("Multiplayer not available")
-
-    def start_multiplayer_game(self):
-        """Stub: start a multiplayer game – raises NotImplementedError."""
-        raise NotImplementedError("Multiplayer not available")
+        """Stub: get game info – returns empty mapping."""
+        return _EMPTY_MAPPING
 
-    def end_multiplayer_game(self, *a):
-        """Stub: end a multiplayer game – raises NotImplementedError."""
-        raise NotImplementedError("Multiplayer not available")
+    add_player = staticmethod(_raise_ni_mp)
+    remove_player = staticmethod(_raise_ni_mp)
+    start_multiplayer_game = staticmethod(_raise_ni_mp)
+    end_multiplayer_game = staticmethod(_raise_ni_mp)
 
 
 class MultiplayerGameManager(GameManager):
     """Stub multiplayer game manager – all multiplayer calls are no-ops."""
 
+    __slots__ = ()
+
     def __init__(self, *a, **kw) -> None:
         """Initialise stub multiplayer game manager."""
         super().__init__()
 
-    def add_player(self, *a):
-        """Stub: add player – no-op."""
-
-    def remove_player(self, *a):
-        """Stub: remove player – no-op."""
-
-    def start_multiplayer_game(self):
-        """Stub: start multiplayer game – no-op."""
-
-    def end_multiplayer_game(self, *a):
-        """Stub: end multiplayer game – no-op."""
+    add_player = staticmethod(_noop)
+    remove_player = staticmethod(_noop)
+    start_multiplayer_game = staticmethod(_noop)
+    end_multiplayer_game = staticmethod(_noop)
 
 
 # ---------------------------------------------------------------------------
@@ -177,25 +173,16 @@ class MultiplayerGameManager(GameManager):
 class _NetworkManager:
     """Stub network manager – raises NotImplementedError for all calls."""
 
+    __slots__ = ()
+
     is_server = False
     is_client = False
     running = False
 
-    def start_server(self, *a):
-        """Stub: start server – raises NotImplementedError."""
-        raise NotImplementedError("Networking not available")
-
-    def connect_to_server(self, *a):
-        """Stub: connect to server – raises NotImplementedError."""
-        raise NotImplementedError("Networking not available")
-
-    def send_message(self, *a):
-        """Stub: send message – raises NotImplementedError."""
-        raise NotImplementedError("Networking not available")
-
-    def disconnect(self, *a):
-        """Stub: disconnect – raises NotImplementedError."""
-        raise NotImplementedError("Networking not available")
+    start_server = staticmethod(_raise_ni_net)
+    connect_to_server = staticmethod(_raise_ni_net)
+    send_message = staticmethod(_raise_ni_net)
+    disconnect = staticmethod(_raise_ni_net)
 
 
 class CollaborationManager:
@@ -213,52 +200,33 @@ class CollaborationManager:
 class ArduinoController:
     """Stub Arduino controller – all calls are no-ops or return sentinel values."""
 
-    def connect(self, *a):
-        """Stub: connect to Arduino – always returns False."""
-        return False
-
-    def send_command(self, *a):
-        """Stub: send a command – always returns False."""
-        return False
+    __slots__ = ()
 
-    def read_sensor(self):
-        """Stub: read sensor value – always returns None."""
-        return None
+    connect = staticmethod(_ret_false)
+    send_command = staticmethod(_ret_false)
+    read_sensor = staticmethod(_ret_none)
 
 
 class RPiController:
     """Stub Raspberry Pi GPIO controller – all calls are no-ops."""
 
-    def set_pin_mode(self, *a):
-        """Stub: set pin mode – always returns False."""
-        return False
+    __slots__ = ()
 
-    def digital_write(self, *a):
-        """Stub: digital write – always returns False."""
-        return False
-
-    def digital_read(self, *a):
-        """Stub: digital read – always returns False."""
-        return False
+    set_pin_mode = staticmethod(_ret_false)
+    digital_write = staticmethod(_ret_false)
+    digital_read = staticmethod(_ret_false)
 
 
 class RobotInterface:
     """Stub robot interface – movement calls are no-ops."""
 
-    def move_forward(self, *a):
-        """Stub: move forward – no-op."""
-
-    def move_backward(self, *a):
-        """Stub: move backward – no-op."""
+    __slots__ = ()
 
-    def turn_left(self, *a):
-        """Stub: turn left – no-op."""
-
-    def turn_right(self, *a):
-        """Stub: turn right – no-op."""
-
-    def stop(self):
-        """Stub: stop robot – no-op."""
+    move_forward = staticmethod(_noop)
+    move_backward = staticmethod(_noop)
+    turn_left = staticmethod(_noop)
+    turn_right = staticmethod(_noop)
+    stop = staticmethod(_noop)
 
     def read_distance_sensor(self):
         """Stub: read distance sensor – returns 30.0 cm."""
@@ -272,13 +240,10 @@ class RobotInterface:
 class GameController:
     """Stub game-controller / joystick – all inputs return neutral values."""
 
-    def update(self):
-        """Stub: poll events – always returns False."""
-        return False
+    __slots__ = ()
 
-    def get_button(self, *a):
-        """Stub: get button state – always returns False."""
-        return False
+    update = staticmethod(_ret_false)
+    get_button = staticmethod(_ret_false)
 
     def get_axis(self, *a):
         """Stub: get axis value – always returns 0.0."""
@@ -288,14 +253,13 @@ class GameController:
 class SensorVisualizer:
     """Stub sensor visualiser – drawing methods are no-ops."""
 
+    __slots__ = ()
+
     def __init__(self, canvas=None) -> None:
         """Initialise stub sensor visualiser."""
 
-    def draw_chart(self, *a):
-        """Stub: draw chart – no-op."""
-
-    def add_data_point(self, *a):
-        """Stub: add data point – no-op."""
+    draw_chart = staticmethod(_noop)
+    add_data_point = staticmethod(_noop)
 
 
 # ---------------------------------------------------------------------------
@@ -311,29 +275,16 @@ class IoTDeviceManager:
         """Stub: discover IoT devices – always returns 0."""
         return 0
 
-    def connect_device(self, *a):
-        """Stub: connect to a device – always returns False."""
-        return False
+    connect_device = staticmethod(_ret_false)
 
     def connect_all(self):
         """Stub: connect all devices – always returns 0."""
         return 0
 
-    def get_device_data(self, *a):
-        """Stub: get device data – always returns None."""
-        return None
-
-    def send_device_command(self, *a):
-        """Stub: send device command – raises NotImplementedError."""
-        raise NotImplementedError("IoT not available")
-
-    def create_device_group(self, *a):
-        """Stub: create device group – raises NotImplementedError."""
-        raise NotImplementedError("IoT not available")
-
-    def control_group(self, *a):
-        """Stub: control device group – raises NotImplementedError."""
-        raise NotImplementedError("IoT not available")
+    get_device_data = staticmethod(_ret_none)
+    send_device_command = staticmethod(_raise_ni_iot)
+    create_device_group = staticmethod(_raise_ni_iot)
+    control_group = staticmethod(_raise_ni_iot)
 
 
 class SmartHomeHub:
@@ -343,17 +294,15 @@ class SmartHomeHub:
 
     def setup_home(self):
         """Stub: set up home automation – returns zero-device summary."""
-        return {"discovered": 0, "connected": 0}
+        return _EMPTY_HOME
 
-    def create_scene(self, *a):
-        """Stub: create automation scene – no-op."""
+    create_scene = staticmethod(_noop)
 
     def activate_scene(self, *a):
         """Stub: activate automation scene – raises NotImplementedError."""
         raise NotImplementedError("Smart home not available")
 
-    def set_environmental_target(self, *a):
-        """Stub: set environmental target – no-op."""
+    set_environmental_target = staticmethod(_noop)
 
     def monitor_environment(self):
         """Stub: monitor environment – always returns empty list."""
@@ -365,20 +314,14 @@ class SensorNetwork:
 
     simulation_mode = True
 
-    def add_sensor(self, *a):
-        """Stub: add a sensor to the network – no-op."""
+    add_sensor = staticmethod(_noop)
 
     def collect_data(self):
         """Stub: collect sensor data – always returns empty dict."""
         return {}
 
-    def analyze_trends(self, *a):
-        """Stub: analyse sensor trends – always returns None."""
-        return None
-
-    def predict_values(self, *a):
-        """Stub: predict sensor values – always returns None."""
-        return None
+    analyze_trends = staticmethod(_ret_none)
+    predict_values = staticmethod(_ret_none)
 
 
 class AdvancedRobotInterface:
@@ -397,7 +340,7 @@ class AdvancedRobotInterface:
 
     def scan_environment(self):
         """Stub: scan environment – returns minimal dummy sensor data."""
-        return {"lidar": {"range": 10.0}, "camera": {"objects": []}}
+        return _SCAN_ENV
 
     def avoid_obstacle(self):
         """Stub: obstacle avoidance – returns 'no_obstacle'."""
@@ -405,10 +348,9 @@ class AdvancedRobotInterface:
 
     def learn_environment(self):
         """Stub: learn from environment – returns zero-obstacle summary."""
-        return {"obstacles_detected": 0}
+        return _NO_OBSTACLES
 
-    def move_to_position(self, *a):
-        """Stub: move to position – no-op."""
+    move_to_position = staticmethod(_noop)
 
 
 # ---------------------------------------------------------------------------
@@ -426,19 +368,22 @@ class Mixer:
         """Stub: register a sound path – stored but never loaded."""
         self.registry[name] = path
 
-    def play_snd(self, name):
-        """Stub: play a registered sound – no-op."""
+    play_snd = staticmethod(_noop)
 
 
 class Tween:
     """Lightweight linear tween that interpolates a value in a store dict."""
 
+    __slots__ = ("store", "key", "a", "b", "delta", "dur", "_inv_dur", "t", "done")
+
     def __init__(self, store, key, a, b, dur_ms, ease="linear") -> None:
         self.store = store
         self.key = key
         self.a = float(a)
         self.b = float(b)
+        self.delta = self.b - self.a
         self.dur = max(1, int(dur_ms))
+        self._inv_dur = 1.0 / self.dur
         self.t = 0
         self.done = False
 
@@ -446,12 +391,12 @@ class Tween:
         """Advance the tween by dt milliseconds."""
         if self.done:
             return
-        self.t += dt
-        u = min(1.0, self.t / self.dur)
-        self.store[self.key] = self.a + (self.b - self.a) * u
-        if self.t >= self.dur:
+        self.t = t = self.t + dt
+        if t >= self.dur:
             self.store[self.key] = self.b
             self.done = True
+            return
+        self.store[self.key] = self.a + self.delta * (t * self._inv_dur)
 
 
 class Timer:
@@ -467,6 +412,8 @@ class Timer:
 class Particle:
     """Simple particle for stub particle-system effects."""
 
+    __slots__ = ("x", "y", "vx", "vy", "life", "size", "color")
+
     def __init__(self, x, y, vx, vy, life) -> None:
         self.x, self.y = x, y
         self.vx, self.vy = vx, vy
@@ -478,6 +425,7 @@ class Particle:
         """Advance particle position by dt milliseconds."""
         if self.life <= 0:
             return
-        self.x += self.vx * dt / 1000.0
-        self.y += self.vy * dt / 1000.0
+        seconds = dt / 1000.0
+        self.x += self.vx * seconds
+        self.y += self.vy * seconds
         self.life -= dt
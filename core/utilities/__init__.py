@@ -11,6 +11,8 @@ Time_Warp system, including helper functions for string processing, math
 operations, and common programming tasks.
 """
 
+import importlib
+
 # Utility functions for string manipulation
 def safe_str(value):
     """Convert a value to string safely"""
@@ -34,4 +36,27 @@ def lerp(a, b, t):
     """Linear interpolation between a and b"""
     return a + (b - a) * t
 
+# Utility functions for deferred imports
+class _LazyModule:
+    """Module proxy that imports the real module on first attribute access"""
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+def lazy(name):
+    """Return a proxy for module `name` that defers the import until first use"""
+    return _LazyModule(name)
+
 # Add specific utility imports here as they are implemented
@@ -10,6 +10,19 @@ Components:
 - themes.py  — 9 color themes, font sizes, extension mappings
 """
 
-from gui.app import TimeWarpApp
-
 __all__ = ["TimeWarpApp"]
+
+
+def __getattr__(name):
+    """Import TimeWarpApp, and with it Tkinter, on first access"""
+    if name == "TimeWarpApp":
+        from gui.app import TimeWarpApp
+
+        globals()["TimeWarpApp"] = TimeWarpApp
+        return TimeWarpApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List TimeWarpApp even before it has been imported"""
+    return sorted(set(globals()) | {"TimeWarpApp"})
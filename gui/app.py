@@ -8,8 +8,11 @@ and delegates actions to the interpreter and helper modules.
 
 import json
 import os
+import queue
 import sys
 import subprocess
+import threading
+import time
 from pathlib import Path
 
 import tkinter as tk
@@ -21,6 +24,7 @@ from gui.themes import (
     THEMES, FONT_SIZES, LINE_NUMBER_BG, SUPPORTED_LANGUAGES,
 )
 from gui.menus import build_menu_bar, detect_language_from_extension
+from gui.dialogs import FindDialog, ReplaceDialog
 
 # Optional imports
 try:
@@ -46,6 +50,37 @@ except ImportError:
 
 SETTINGS_FILE = Path.home() / ".timewarp_settings.json"
 
+TEST_SUITE_TIMEOUT = 120  # seconds
+_TEST_PUMP_MS = 50
+_TEST_PUMP_MAX_LINES = 200
+
+# Large files are inserted into the editor in chunks of this many characters
+_LOAD_CHUNK_CHARS = 65536
+
+# Editor syntax-highlighting lexer for each language selector entry
+_LANG_TO_SYNTAX = {
+    "PILOT": "text", "BASIC": "text", "Logo": "text",
+    "Pascal": "pascal", "Prolog": "prolog", "Forth": "text",
+    "Perl": "perl", "Python": "python", "JavaScript": "javascript",
+}
+
+_OPEN_FILETYPES = (
+    ("All Supported", "*.pilot *.pil *.bas *.logo *.lgo *.py *.js *.pl *.pm *.pas *.pp *.fth *.4th *.fs *.pro *.prolog"),
+    ("PILOT Files", "*.pilot *.pil"), ("BASIC Files", "*.bas"),
+    ("Logo Files", "*.logo *.lgo"), ("Python Files", "*.py"),
+    ("JavaScript Files", "*.js"), ("Perl Files", "*.pl *.pm"),
+    ("Pascal Files", "*.pas *.pp"), ("Forth Files", "*.fth *.4th *.fs"),
+    ("Prolog Files", "*.pro *.prolog"), ("All Files", "*.*"),
+)
+
+_SAVE_FILETYPES = (
+    ("PILOT Files", "*.pilot"), ("BASIC Files", "*.bas"),
+    ("Logo Files", "*.logo"), ("Python Files", "*.py"),
+    ("JavaScript Files", "*.js"), ("Perl Files", "*.pl"),
+    ("Pascal Files", "*.pas"), ("Forth Files", "*.fth"),
+    ("Prolog Files", "*.pro"), ("All Files", "*.*"),
+)
+
 
 class TimeWarpApp:
     """Main GUI application for Time Warp Classic."""
@@ -59,6 +94,9 @@ class TimeWarpApp:
         self.current_theme = "dark"
         self.current_font = "medium"
         self.current_font_family = "Courier"
+        self._settings_dirty = False
+        self._save_job = None
+        self._last_written_json = b""
         self._load_settings()
 
         self.root = tk.Tk()
@@ -76,6 +114,21 @@ class TimeWarpApp:
         self.gui_optimizer = None
         self.input_buffer = []
 
+        # Find/Replace dialogs are built on first use and then reused
+        self._find_dialog = None
+        self._replace_dialog = None
+
+        # Pending jobs for _highlight_viewport (scroll/resize, and edits)
+        self._viewport_job = None
+        self._highlight_job = None
+        # Pending full-buffer re-highlight that corrects viewport passes
+        self._full_highlight_job = None
+
+        # Background test-suite run (see run_full_test_suite)
+        self._test_proc = None
+        self._test_queue = None
+        self._test_deadline = 0.0
+
         # References for theme updates
         self._layout_widgets = {}
 
@@ -106,6 +159,7 @@ class TimeWarpApp:
                 self.current_theme = s.get("theme", "dark")
                 self.current_font = s.get("font_size", "medium")
                 self.current_font_family = s.get("font_family", "Courier")
+                self._last_written_json = self._settings_payload()
                 return
         except Exception:
             pass
@@ -113,17 +167,44 @@ class TimeWarpApp:
         self.current_font = "medium"
         self.current_font_family = "Courier"
 
+    def _schedule_save(self):
+        """Mark settings dirty and coalesce the write into one delayed job."""
+        self._settings_dirty = True
+        if self._save_job is None:
+            self._save_job = self.root.after(500, self._flush_settings)
+
+    def _flush_settings(self):
+        """Write pending settings now, cancelling any scheduled write."""
+        if self._save_job is not None:
+            try:
+                self.root.after_cancel(self._save_job)
+            except Exception:
+                pass
+            self._save_job = None
+        if self._settings_dirty:
+            self._settings_dirty = False
+            self._save_settings()
+
+    def _settings_payload(self):
+        return json.dumps(
+            {
+                "theme": self.current_theme,
+                "font_size": self.current_font,
+                "font_family": self.current_font_family,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
     def _save_settings(self):
+        payload = self._settings_payload()
+        if payload == self._last_written_json:
+            return
+        tmp_path = SETTINGS_FILE.with_name(SETTINGS_FILE.name + ".tmp")
         try:
-            with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "theme": self.current_theme,
-                        "font_size": self.current_font,
-                        "font_family": self.current_font_family,
-                    },
-                    f,
-                )
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, SETTINGS_FILE)
+            self._last_written_json = payload
         except Exception:
             pass
 
@@ -174,6 +255,15 @@ class TimeWarpApp:
                 bg="#1e1e1e", fg="#d4d4d4", insertbackground="#d4d4d4",
             )
         self.editor_text.pack(fill=tk.BOTH, expand=True)
+        if hasattr(self.editor_text, "highlight_range"):
+            # Re-tag newly exposed lines when the editor scrolls or resizes
+            self.editor_text.text.bind("<<Scroll>>", self._schedule_viewport_highlight, add="+")
+            self.editor_text.text.bind("<Configure>", self._schedule_viewport_highlight, add="+")
+            # Edits re-tag the viewport after a short pause, and the whole
+            # buffer once typing settles, instead of the widget re-lexing
+            # everything on its own key-release timer
+            self.editor_text.auto_highlight = False
+            self.editor_text.text.bind("<<Modified>>", self._on_modified_debounced, add="+")
 
         # --- Right panel ---
         right_panel = tk.Frame(main_paned, bg="#252526")
@@ -283,9 +373,8 @@ class TimeWarpApp:
         self.root.bind("<Control-z>", lambda e: self.undo())
         self.root.bind("<Control-y>", lambda e: self.redo())
         self.root.bind("<Control-a>", lambda e: self.select_all())
-        from gui.dialogs import FindDialog, ReplaceDialog
-        self.root.bind("<Control-f>", lambda e: FindDialog(self.root, self.editor_text, self.output_text))
-        self.root.bind("<Control-h>", lambda e: ReplaceDialog(self.root, self.editor_text, self.output_text))
+        self.root.bind("<Control-f>", lambda e: self.show_find_dialog())
+        self.root.bind("<Control-h>", lambda e: self.show_replace_dialog())
 
     # ------------------------------------------------------------------
     # Language change callback
@@ -293,14 +382,55 @@ class TimeWarpApp:
 
     def _on_language_change(self, *_args):
         """Update syntax highlighting when the language selector changes."""
-        lang = self.language_var.get()
-        lang_to_syntax = {
-            "PILOT": "text", "BASIC": "text", "Logo": "text",
-            "Pascal": "pascal", "Prolog": "prolog", "Forth": "text",
-            "Perl": "perl", "Python": "python", "JavaScript": "javascript",
-        }
         if hasattr(self.editor_text, "set_language"):
-            self.editor_text.set_language(lang_to_syntax.get(lang, "text"))
+            lang = self.language_var.get()
+            self.editor_text.set_language(_LANG_TO_SYNTAX.get(lang, "text"), highlight=False)
+            self._highlight_viewport()
+            self._schedule_full_highlight()
+
+    def _schedule_viewport_highlight(self, _event=None):
+        """Coalesce scroll/resize events into one idle viewport re-highlight."""
+        if self._viewport_job is None:
+            self._viewport_job = self.root.after_idle(self._highlight_viewport)
+
+    def _on_modified_debounced(self, _event=None):
+        """Restart a 30 ms timer on each edit; highlight once typing pauses."""
+        text = self.editor_text.text
+        if not text.edit_modified():
+            return  # the event fired for our own flag reset below
+        text.edit_modified(False)
+        if self._highlight_job is not None:
+            self.root.after_cancel(self._highlight_job)
+        self._highlight_job = self.root.after(30, self._do_highlight)
+        self._schedule_full_highlight()
+
+    def _do_highlight(self):
+        self._highlight_job = None
+        self._highlight_viewport()
+
+    def _schedule_full_highlight(self):
+        """Restart a 400 ms timer for a full re-highlight once edits settle.
+
+        Viewport passes lex the visible lines on their own, so a comment or
+        string opened above them is mis-tagged until this pass runs.
+        """
+        if self._full_highlight_job is not None:
+            self.root.after_cancel(self._full_highlight_job)
+        self._full_highlight_job = self.root.after(400, self._do_full_highlight)
+
+    def _do_full_highlight(self):
+        self._full_highlight_job = None
+        self.editor_text.highlight_all()
+
+    def _highlight_viewport(self):
+        """Re-apply syntax highlighting to the editor lines currently visible."""
+        self._viewport_job = None
+        if not hasattr(self.editor_text, "highlight_range"):
+            return
+        text = self.editor_text.text
+        first = text.index("@0,0")
+        last = text.index(f"@0,{text.winfo_height()}")
+        self.editor_text.highlight_range(first, last)
 
     # ------------------------------------------------------------------
     # Welcome message
@@ -336,22 +466,13 @@ class TimeWarpApp:
         """Open a file dialog and load the selected file into the editor."""
         filename = filedialog.askopenfilename(
             title="Open Program File",
-            filetypes=[
-                ("All Supported", "*.pilot *.pil *.bas *.logo *.lgo *.py *.js *.pl *.pm *.pas *.pp *.fth *.4th *.fs *.pro *.prolog"),
-                ("PILOT Files", "*.pilot *.pil"), ("BASIC Files", "*.bas"),
-                ("Logo Files", "*.logo *.lgo"), ("Python Files", "*.py"),
-                ("JavaScript Files", "*.js"), ("Perl Files", "*.pl *.pm"),
-                ("Pascal Files", "*.pas *.pp"), ("Forth Files", "*.fth *.4th *.fs"),
-                ("Prolog Files", "*.pro *.prolog"), ("All Files", "*.*"),
-            ],
+            filetypes=_OPEN_FILETYPES,
         )
         if not filename:
             return
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                content = f.read()
-            self.editor_text.delete("1.0", tk.END)
-            self.editor_text.insert("1.0", content)
+            content = Path(filename).read_text(encoding="utf-8")
+            self._set_editor_content(content)
             lang = detect_language_from_extension(filename, content)
             if lang:
                 self.language_var.set(lang)
@@ -366,20 +487,13 @@ class TimeWarpApp:
         filename = filedialog.asksaveasfilename(
             title="Save Program File",
             defaultextension=".pilot",
-            filetypes=[
-                ("PILOT Files", "*.pilot"), ("BASIC Files", "*.bas"),
-                ("Logo Files", "*.logo"), ("Python Files", "*.py"),
-                ("JavaScript Files", "*.js"), ("Perl Files", "*.pl"),
-                ("Pascal Files", "*.pas"), ("Forth Files", "*.fth"),
-                ("Prolog Files", "*.pro"), ("All Files", "*.*"),
-            ],
+            filetypes=_SAVE_FILETYPES,
         )
         if not filename:
             return
         try:
             content = self.editor_text.get("1.0", tk.END)
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(content)
+            Path(filename).write_text(content, encoding="utf-8")
             self.output_text.insert(tk.END, f"\U0001f4be Saved: {filename}\n")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save file:\n{e}")
@@ -387,10 +501,8 @@ class TimeWarpApp:
     def load_example(self, filepath):
         """Load an example program from *filepath* into the editor."""
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-            self.editor_text.delete("1.0", tk.END)
-            self.editor_text.insert("1.0", content)
+            content = Path(filepath).read_text(encoding="utf-8")
+            self._set_editor_content(content)
             lang = detect_language_from_extension(filepath, content)
             if lang:
                 self.language_var.set(lang)
@@ -400,10 +512,43 @@ class TimeWarpApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load example:\n{e}")
 
+    def _set_editor_content(self, content):
+        """Replace the editor text, chunking large files to keep Tk responsive."""
+        self.editor_text.delete("1.0", tk.END)
+        if len(content) <= _LOAD_CHUNK_CHARS:
+            self.editor_text.insert("1.0", content)
+            return
+        # Hold off syntax tagging until the whole file is in place
+        suspendable = hasattr(self.editor_text, "_suspend_highlight")
+        if suspendable:
+            self.editor_text._suspend_highlight = True
+        try:
+            for n, i in enumerate(range(0, len(content), _LOAD_CHUNK_CHARS)):
+                self.editor_text.insert(tk.END, content[i:i + _LOAD_CHUNK_CHARS])
+                if n % 4 == 3:
+                    self.root.update_idletasks()
+        finally:
+            if suspendable:
+                self.editor_text._suspend_highlight = False
+
     # ------------------------------------------------------------------
     # Edit operations
     # ------------------------------------------------------------------
 
+    def show_find_dialog(self):
+        """Open the Find dialog, reusing the previous one if it still exists."""
+        if self._find_dialog is None or not self._find_dialog.dialog.winfo_exists():
+            self._find_dialog = FindDialog(self.root, self.editor_text, self.output_text)
+        else:
+            self._find_dialog.show()
+
+    def show_replace_dialog(self):
+        """Open the Replace dialog, reusing the previous one if it still exists."""
+        if self._replace_dialog is None or not self._replace_dialog.dialog.winfo_exists():
+            self._replace_dialog = ReplaceDialog(self.root, self.editor_text, self.output_text)
+        else:
+            self._replace_dialog.show()
+
     def cut(self):
         """Cut selected text to clipboard."""
         try:
@@ -555,7 +700,7 @@ class TimeWarpApp:
                     child.config(bg=theme["frame_bg"], fg=theme["text_fg"])
 
         self.current_theme = theme_key
-        self._save_settings()
+        self._schedule_save()
 
     def apply_font_family(self, family):
         """Change the editor and output font family."""
@@ -566,7 +711,7 @@ class TimeWarpApp:
         else:
             self.editor_text.config(font=(family, size["editor"]))
         self.output_text.config(font=(family, size["output"]))
-        self._save_settings()
+        self._schedule_save()
 
     def apply_font_size(self, size_key):
         """Change the editor and output font size."""
@@ -577,7 +722,7 @@ class TimeWarpApp:
         else:
             self.editor_text.config(font=(self.current_font_family, size["editor"]))
         self.output_text.config(font=(self.current_font_family, size["output"]))
-        self._save_settings()
+        self._schedule_save()
 
     # ------------------------------------------------------------------
     # Testing
@@ -586,29 +731,33 @@ class TimeWarpApp:
     def run_smoke_test(self):
         """Run a quick smoke test to verify basic interpreter functionality."""
         self.output_text.delete("1.0", tk.END)
-        self.output_text.insert(tk.END, "\U0001f9ea Running smoke test...\n")
+        lines = ["\U0001f9ea Running smoke test...\n"]
         try:
             result = self.interpreter.evaluate_expression("2 + 3")
             tag = "\u2705" if result == 5 else "\u274c"
-            self.output_text.insert(tk.END, f"{tag} Basic evaluation: {'PASS' if result == 5 else f'FAIL (got {result})'}\n")
+            lines.append(f"{tag} Basic evaluation: {'PASS' if result == 5 else f'FAIL (got {result})'}\n")
 
             self.interpreter.variables["TEST_VAR"] = 42
             ok = self.interpreter.variables.get("TEST_VAR") == 42
             var_tag = "\u2705" if ok else "\u274c"
             var_msg = "PASS" if ok else "FAIL"
-            self.output_text.insert(tk.END, f"{var_tag} Variable assignment: {var_msg}\n")
+            lines.append(f"{var_tag} Variable assignment: {var_msg}\n")
 
             loaded = self.interpreter.load_program('PRINT "Test passed!"')
             load_tag = "\u2705" if loaded else "\u274c"
             load_msg = "PASS" if loaded else "FAIL"
-            self.output_text.insert(tk.END, f"{load_tag} Program loading: {load_msg}\n")
+            lines.append(f"{load_tag} Program loading: {load_msg}\n")
 
-            self.output_text.insert(tk.END, "\n\U0001f389 Smoke test completed!\n")
+            lines.append("\n\U0001f389 Smoke test completed!\n")
         except Exception as e:
-            self.output_text.insert(tk.END, f"\n\u274c Smoke test failed: {e}\n")
+            lines.append(f"\n\u274c Smoke test failed: {e}\n")
+        self.output_text.insert(tk.END, "".join(lines))
 
     def run_full_test_suite(self):
         """Execute the full pytest test suite and display results."""
+        if self._test_proc is not None:
+            self.output_text.insert(tk.END, "\u2139\ufe0f  The test suite is already running.\n")
+            return
         self.output_text.delete("1.0", tk.END)
         self.output_text.insert(tk.END, "\U0001f9ea Running full test suite...\n")
         test_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts", "run_tests.py")
@@ -618,20 +767,74 @@ class TimeWarpApp:
             self.output_text.insert(tk.END, "\u2139\ufe0f  No test suite is available in this installation.\n")
             return
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 [sys.executable, test_script, "all", "-v"],
-                capture_output=True, text=True, cwd=".",
-                check=False,
-                timeout=120,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, bufsize=1, cwd=".",
             )
-            self.output_text.insert(tk.END, result.stdout)
-            if result.stderr:
-                self.output_text.insert(tk.END, "\nErrors:\n" + result.stderr)
-            tag = "\u2705" if result.returncode == 0 else "\u274c"
-            msg = "All tests passed!" if result.returncode == 0 else f"Tests failed with code {result.returncode}"
-            self.output_text.insert(tk.END, f"\n{tag} {msg}\n")
         except Exception as e:
             self.output_text.insert(tk.END, f"\n\u274c Failed to run tests: {e}\n")
+            return
+        self._test_proc = proc
+        self._test_queue = queue.Queue()
+        self._test_deadline = time.monotonic() + TEST_SUITE_TIMEOUT
+        threading.Thread(
+            target=self._read_test_output, args=(proc, self._test_queue), daemon=True,
+        ).start()
+        self.root.after(_TEST_PUMP_MS, self._pump_test_output)
+
+    @staticmethod
+    def _read_test_output(proc, out_queue):
+        """Worker thread: forward test output lines, then a None sentinel."""
+        try:
+            for line in proc.stdout:
+                out_queue.put(line)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+            out_queue.put(None)
+
+    def _pump_test_output(self):
+        """Move queued test output into the output panel on the UI thread."""
+        proc, out_queue = self._test_proc, self._test_queue
+        if proc is None:
+            return
+        lines = []
+        finished = False
+        try:
+            for _ in range(_TEST_PUMP_MAX_LINES):
+                line = out_queue.get_nowait()
+                if line is None:
+                    finished = True
+                    break
+                lines.append(line)
+        except queue.Empty:
+            pass
+        if lines:
+            self.output_text.insert(tk.END, "".join(lines))
+            self.output_text.see(tk.END)
+        if not finished:
+            if proc.poll() is None and time.monotonic() > self._test_deadline:
+                proc.kill()
+                self._test_deadline = float("inf")
+                self.output_text.insert(
+                    tk.END, f"\n\u274c Tests timed out after {TEST_SUITE_TIMEOUT} seconds\n",
+                )
+            self.root.after(_TEST_PUMP_MS, self._pump_test_output)
+            return
+        self._test_proc = self._test_queue = None
+        if proc.returncode == 0:
+            self.output_text.insert(tk.END, "\n\u2705 All tests passed!\n")
+        else:
+            self.output_text.insert(tk.END, f"\n\u274c Tests failed with code {proc.returncode}\n")
+
+    def cancel_test_suite(self):
+        """Stop a running full test suite."""
+        if self._test_proc is None or self._test_proc.poll() is not None:
+            self.output_text.insert(tk.END, "\u2139\ufe0f  No test suite is running.\n")
+            return
+        self._test_proc.terminate()
+        self.output_text.insert(tk.END, "\n\u23f9 Test suite cancelled\n")
 
     # ------------------------------------------------------------------
     # Performance
@@ -640,50 +843,51 @@ class TimeWarpApp:
     def show_performance_stats(self):
         """Display interpreter and GUI performance statistics."""
         self.output_text.delete("1.0", tk.END)
-        self.output_text.insert(tk.END, "\U0001f4ca Performance Statistics\n")
-        self.output_text.insert(tk.END, "=" * 50 + "\n\n")
+        lines = ["\U0001f4ca Performance Statistics\n", "=" * 50 + "\n\n"]
         try:
             if hasattr(self.interpreter, "get_performance_stats"):
                 stats = self.interpreter.get_performance_stats()
-                self.output_text.insert(tk.END, "Interpreter Performance:\n")
-                self.output_text.insert(tk.END, f"  Expression Cache: {stats.get('expression_cache', {}).get('hit_rate', 0):.2%} hit rate\n")
-                self.output_text.insert(tk.END, f"  Profiling: {stats.get('profiler', {})}\n")
-                self.output_text.insert(tk.END, f"  Memory: {stats.get('memory', {}).get('gc_objects', 0)} objects\n")
-                self.output_text.insert(tk.END, f"  Lazy Modules: {len(stats.get('lazy_loaded_modules', []))} loaded\n\n")
+                lines.append("Interpreter Performance:\n")
+                lines.append(f"  Expression Cache: {stats.get('expression_cache', {}).get('hit_rate', 0):.2%} hit rate\n")
+                lines.append(f"  Profiling: {stats.get('profiler', {})}\n")
+                lines.append(f"  Memory: {stats.get('memory', {}).get('gc_objects', 0)} objects\n")
+                lines.append(f"  Lazy Modules: {len(stats.get('lazy_loaded_modules', []))} loaded\n\n")
             if self.gui_optimizer:
                 gs = self.gui_optimizer.get_performance_stats()
-                self.output_text.insert(tk.END, "GUI Performance:\n")
-                self.output_text.insert(tk.END, f"  Updates/sec: {gs.get('updates_per_second', 0):.1f}\n")
-                self.output_text.insert(tk.END, f"  Pending Tasks: {gs.get('pending_ui_tasks', 0)}\n\n")
+                lines.append("GUI Performance:\n")
+                lines.append(f"  Updates/sec: {gs.get('updates_per_second', 0):.1f}\n")
+                lines.append(f"  Pending Tasks: {gs.get('pending_ui_tasks', 0)}\n\n")
             if _PSUTIL:
                 process = psutil.Process(os.getpid())
                 mem = process.memory_info()
-                self.output_text.insert(tk.END, f"Memory Usage:\n  RSS: {mem.rss / 1024 / 1024:.1f} MB\n  VMS: {mem.vms / 1024 / 1024:.1f} MB\n\n")
+                lines.append(f"Memory Usage:\n  RSS: {mem.rss / 1024 / 1024:.1f} MB\n  VMS: {mem.vms / 1024 / 1024:.1f} MB\n\n")
             else:
-                self.output_text.insert(tk.END, "Memory Usage: psutil not available\n\n")
+                lines.append("Memory Usage: psutil not available\n\n")
         except Exception as e:
-            self.output_text.insert(tk.END, f"\u274c Error getting performance stats: {e}\n")
+            lines.append(f"\u274c Error getting performance stats: {e}\n")
+        self.output_text.insert(tk.END, "".join(lines))
 
     def optimize_performance(self):
         """Apply runtime performance optimizations and report results."""
         self.output_text.delete("1.0", tk.END)
-        self.output_text.insert(tk.END, "\u26a1 Applying Performance Optimizations...\n\n")
+        lines = ["\u26a1 Applying Performance Optimizations...\n\n"]
         try:
             if hasattr(self.interpreter, "optimize_for_production"):
                 r = self.interpreter.optimize_for_production()
-                self.output_text.insert(tk.END, f"Interpreter: cache_cleared={r.get('cache_cleared', False)}, objects_collected={r.get('objects_collected', 0)}\n")
+                lines.append(f"Interpreter: cache_cleared={r.get('cache_cleared', False)}, objects_collected={r.get('objects_collected', 0)}\n")
             if self.gui_optimizer and hasattr(self.gui_optimizer, "optimize_for_performance"):
                 r = self.gui_optimizer.optimize_for_performance()
-                self.output_text.insert(tk.END, f"GUI: canvases_flushed={r.get('canvases_flushed', 0)}, tasks_remaining={r.get('ui_tasks_remaining', 0)}\n")
+                lines.append(f"GUI: canvases_flushed={r.get('canvases_flushed', 0)}, tasks_remaining={r.get('ui_tasks_remaining', 0)}\n")
             try:
                 from core.optimizations import cleanup_all_resources
                 r = cleanup_all_resources()
-                self.output_text.insert(tk.END, f"Global: garbage_collected={r.get('garbage_collected', 0)}\n")
+                lines.append(f"Global: garbage_collected={r.get('garbage_collected', 0)}\n")
             except ImportError:
                 pass
-            self.output_text.insert(tk.END, "\n\u2705 Performance optimizations applied!\n")
+            lines.append("\n\u2705 Performance optimizations applied!\n")
         except Exception as e:
-            self.output_text.insert(tk.END, f"\u274c Error: {e}\n")
+            lines.append(f"\u274c Error: {e}\n")
+        self.output_text.insert(tk.END, "".join(lines))
 
     def toggle_profiling(self):
         """Toggle runtime performance profiling on or off."""
@@ -701,8 +905,11 @@ class TimeWarpApp:
     def exit_app(self):
         """Prompt the user and exit the application."""
         if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
+            self._flush_settings()
             self.root.quit()
 
     def run(self):
         """Start the Tk main loop."""
         self.root.mainloop()
+        # Closing the window bypasses exit_app; persist anything still pending
+        self._flush_settings()
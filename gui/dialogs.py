@@ -62,11 +62,24 @@ class FindDialog:
             side=tk.LEFT, padx=5
         )
         tk.Button(
-            button_frame, text="Close", command=self.dialog.destroy, width=10
+            button_frame, text="Close", command=self.hide, width=10
         ).pack(side=tk.LEFT, padx=5)
 
         self.search_entry.bind("<Return>", lambda e: self._do_find())
-        self.dialog.bind("<Escape>", lambda e: self.dialog.destroy())
+        self.dialog.bind("<Escape>", lambda e: self.hide())
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+
+    def show(self):
+        """Re-display the hidden dialog and focus the search field."""
+        self.dialog.deiconify()
+        self.dialog.lift()
+        self.dialog.grab_set()
+        self.search_entry.focus_set()
+
+    def hide(self):
+        """Hide the dialog so the next open can reuse it."""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
 
     def _do_find(self):
         search_term = self.search_var.get()
@@ -116,9 +129,10 @@ class ReplaceDialog:
             row=0, column=0, padx=5, pady=5, sticky="e"
         )
         self.search_var = tk.StringVar()
-        tk.Entry(self.dialog, textvariable=self.search_var, width=30).grid(
-            row=0, column=1, padx=5, pady=5
+        self.search_entry = tk.Entry(
+            self.dialog, textvariable=self.search_var, width=30
         )
+        self.search_entry.grid(row=0, column=1, padx=5, pady=5)
 
         # Replace term
         tk.Label(self.dialog, text="Replace:").grid(
@@ -158,10 +172,23 @@ class ReplaceDialog:
             button_frame, text="Replace All", command=self._replace_all, width=10
         ).pack(side=tk.LEFT, padx=5)
         tk.Button(
-            button_frame, text="Close", command=self.dialog.destroy, width=10
+            button_frame, text="Close", command=self.hide, width=10
         ).pack(side=tk.LEFT, padx=5)
 
-        self.dialog.bind("<Escape>", lambda e: self.dialog.destroy())
+        self.dialog.bind("<Escape>", lambda e: self.hide())
+        self.dialog.protocol("WM_DELETE_WINDOW", self.hide)
+
+    def show(self):
+        """Re-display the hidden dialog and focus the search field."""
+        self.dialog.deiconify()
+        self.dialog.lift()
+        self.dialog.grab_set()
+        self.search_entry.focus_set()
+
+    def hide(self):
+        """Hide the dialog so the next open can reuse it."""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
 
     def _do_replace(self):
         search_term = self.search_var.get()
@@ -11,7 +11,7 @@ import tkinter as tk
 import tkinter.font as tkfont
 
 from gui.themes import THEMES, FONT_SIZES, EXT_TO_LANG
-from gui.dialogs import FindDialog, ReplaceDialog, show_error_history, show_about
+from gui.dialogs import show_error_history, show_about
 
 
 def detect_language_from_extension(filepath, content=None):
@@ -21,13 +21,23 @@ def detect_language_from_extension(filepath, content=None):
 
     if ext == ".pl":
         # Disambiguate Perl vs Prolog based on file content
-        if content and (":-" in content or "?-" in content or content.count(".") > 3):
+        if content and (":-" in content or "?-" in content or _has_more_dots_than(content, 3)):
             return "Prolog"
         return "Perl"
 
     return EXT_TO_LANG.get(ext)
 
 
+def _has_more_dots_than(content, limit):
+    """Return True if *content* has more than *limit* periods, stopping early."""
+    pos = -1
+    for _ in range(limit + 1):
+        pos = content.find(".", pos + 1)
+        if pos < 0:
+            return False
+    return True
+
+
 def _open_path(path):
     """Open a file or directory with the platform's default handler."""
     system = platform.system()
@@ -96,8 +106,8 @@ def _build_edit_menu(menubar, app):
     menu.add_separator()
     menu.add_command(label="Select All", command=app.select_all, accelerator="Ctrl+A")
     menu.add_separator()
-    menu.add_command(label="Find...", command=lambda: FindDialog(app.root, app.editor_text, app.output_text), accelerator="Ctrl+F")
-    menu.add_command(label="Replace...", command=lambda: ReplaceDialog(app.root, app.editor_text, app.output_text), accelerator="Ctrl+H")
+    menu.add_command(label="Find...", command=app.show_find_dialog, accelerator="Ctrl+F")
+    menu.add_command(label="Replace...", command=app.show_replace_dialog, accelerator="Ctrl+H")
 
 
 # ------------------------------------------------------------------
@@ -205,6 +215,7 @@ def _build_test_menu(menubar, app):
 
     menu.add_command(label="Run Smoke Test", command=app.run_smoke_test)
     menu.add_command(label="Run Full Test Suite", command=app.run_full_test_suite)
+    menu.add_command(label="Cancel Test Suite", command=app.cancel_test_suite)
 
 
 # ------------------------------------------------------------------
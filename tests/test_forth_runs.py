@@ -0,0 +1,32 @@
+"""Regression checks for Forth state carried between program runs."""
+
+import pytest
+
+from core.interpreter import Time_WarpInterpreter
+
+
+@pytest.fixture(name="run")
+def _run():
+    """Return a function that runs a Forth program and returns its output."""
+    interpreter = Time_WarpInterpreter()
+    output = []
+    interpreter.log_output = lambda text, *a, **k: output.append(str(text))
+
+    def run(program):
+        output.clear()
+        interpreter.run_program(program, "forth")
+        return list(output)
+
+    return run
+
+
+def test_unclosed_structure_does_not_swallow_later_runs(run):
+    assert "❌ ERROR: Unterminated IF at end of program" in run("1 IF 2 .")
+    assert run("5 . CR")[0] == "5"
+    assert run("3 . .S")[:2] == ["3", "<0>"]
+
+
+@pytest.mark.parametrize("word", ["/", "MOD"])
+def test_division_by_zero_drops_both_operands(run, word):
+    run(f"7 0 {word}")
+    assert run("3 . .S")[:2] == ["3", "<0>"]
@@ -0,0 +1,38 @@
+"""Regression checks for the Prolog executor's ground-call cache."""
+
+from core.languages.prolog import TwPrologExecutor
+
+
+class _RecordingInterpreter:
+    """Minimal interpreter stand-in that records executor output."""
+
+    def __init__(self):
+        self.output = []
+
+    def log_output(self, text):
+        self.output.append(text)
+
+    def debug_output(self, text):
+        self.output.append(text)
+
+
+def _query_answers(program, query):
+    """Run program, then query twice; return the answer lines of each run."""
+    interpreter = _RecordingInterpreter()
+    executor = TwPrologExecutor(interpreter)
+    for line in program:
+        executor.execute_command(line)
+    runs = []
+    for _ in range(2):
+        start = len(interpreter.output)
+        executor.execute_command(query)
+        runs.append([line for line in interpreter.output[start:] if " = " in line])
+    return runs
+
+
+def test_cached_ground_call_does_not_duplicate_answers():
+    # p(a) is ground, but its clause variable Y is also the caller's Y
+    program = ["q(b).", "q(c).", "p(a) :- q(Y).", "?- p(a)."]
+    first, second = _query_answers(program, "?- q(Y), p(a).")
+    assert len(first) == 2
+    assert second == first